@@ -0,0 +1,89 @@
+"""
+Benchmark of JSON rendering and compression for the school list.
+
+Reports the CPU time DRF's stdlib renderer and the orjson renderer take to
+render the ``get_schools`` payload, and the bytes on the wire uncompressed,
+gzipped and brotli-compressed, with the CPU each encoding costs. Uses the
+configured database; ``--seed`` adds schools and reviews inside a
+transaction that is rolled back afterwards:
+
+    python benchmarks/json_rendering.py --seed 100 --reviews-per-school 20
+"""
+
+import argparse
+import statistics
+import sys
+import time
+
+from serialization import Rollback, seed
+
+from django.contrib.auth.models import AnonymousUser
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from config import compression
+from config.renderers import ORJSONRenderer
+from schools.listing import school_payloads
+from schools.models import Schools
+
+
+def cpu_ms(function, repeat):
+    """Median CPU milliseconds of ``repeat`` calls, and the last result."""
+    durations = []
+    for _ in range(repeat):
+        started = time.process_time()
+        result = function()
+        durations.append(time.process_time() - started)
+    return statistics.median(durations) * 1000, result
+
+
+def run(repeat):
+    request = Request(APIRequestFactory().get("/"))
+    request.user = AnonymousUser()
+    data = school_payloads(Schools.objects.all(), request)
+    print(f"{len(data)} schools, median of {repeat}\n")
+
+    stdlib_ms, body = cpu_ms(lambda: JSONRenderer().render(data), repeat)
+    orjson_ms, fast_body = cpu_ms(lambda: ORJSONRenderer().render(data), repeat)
+    print("render      CPU ms")
+    print(f"stdlib    {stdlib_ms:8.2f}")
+    print(f"orjson    {orjson_ms:8.2f}   {stdlib_ms / orjson_ms:.1f}x faster")
+    print(f"identical {body == fast_body}\n")
+
+    print("encoding       bytes    ratio   CPU ms")
+    print(f"identity {len(body):11,}    1.00x     0.00")
+    for coding in compression.ENCODERS:
+        ms, compressed = cpu_ms(lambda: compression._compress(coding, body), repeat)
+        print(
+            f"{coding:<8} {len(compressed):11,} "
+            f"{len(body) / len(compressed):7.2f}x {ms:8.2f}"
+        )
+    if "br" not in compression.ENCODERS:
+        print("(install brotli to compare br)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--seed", type=int, default=0, help="Schools to add for the run"
+    )
+    parser.add_argument("--reviews-per-school", type=int, default=10)
+    args = parser.parse_args()
+
+    if not args.seed:
+        run(args.repeat)
+        return
+    try:
+        with transaction.atomic():
+            seed(args.seed, args.reviews_per_school)
+            run(args.repeat)
+            raise Rollback
+    except Rollback:
+        pass
+
+
+if __name__ == "__main__":
+    sys.exit(main())
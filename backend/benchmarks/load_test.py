@@ -0,0 +1,155 @@
+"""
+Closed-loop HTTP load test reporting throughput and latency percentiles.
+
+Each of ``--concurrency`` clients sends requests back to back over its own
+keep-alive connection for ``--duration`` seconds. Pass several ``label=url``
+targets to compare server profiles side by side, e.g. the bare gunicorn
+command against ``gunicorn.conf.py``:
+
+    gunicorn -b :8001 config.wsgi:application &
+    gunicorn -c gunicorn.conf.py -b :8002 &
+    python benchmarks/load_test.py \\
+        baseline=http://localhost:8001/api/public/schools/ \\
+        tuned=http://localhost:8002/api/public/schools/
+
+Only the standard library is used so it runs anywhere the backend does.
+"""
+
+import argparse
+import http.client
+import math
+import threading
+import time
+from urllib.parse import urlsplit
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of ``values`` (which must be sorted)."""
+    if not values:
+        return 0.0
+    rank = max(math.ceil(pct / 100 * len(values)), 1)
+    return values[rank - 1]
+
+
+def _connect(url):
+    connection_class = (
+        http.client.HTTPSConnection
+        if url.scheme == "https"
+        else http.client.HTTPConnection
+    )
+    return connection_class(url.netloc, timeout=30)
+
+
+def _client(url, stop_at, headers, latencies, errors, lock):
+    path = url.path or "/"
+    if url.query:
+        path += f"?{url.query}"
+    connection = _connect(url)
+    own_latencies, own_errors = [], 0
+    while time.monotonic() < stop_at:
+        started = time.perf_counter()
+        try:
+            connection.request("GET", path, headers=headers)
+            response = connection.getresponse()
+            response.read()
+            if response.status >= 400:
+                own_errors += 1
+            else:
+                own_latencies.append(time.perf_counter() - started)
+            if response.will_close:
+                connection.close()
+                connection = _connect(url)
+        except (OSError, http.client.HTTPException):
+            own_errors += 1
+            connection.close()
+            connection = _connect(url)
+    connection.close()
+    with lock:
+        latencies.extend(own_latencies)
+        errors.append(own_errors)
+
+
+def run(url, concurrency, duration, headers=None):
+    """Load ``url`` and return a dict of req/s, latency percentiles and errors."""
+    url = urlsplit(url)
+    latencies, errors, lock = [], [], threading.Lock()
+    stop_at = time.monotonic() + duration
+    clients = [
+        threading.Thread(
+            target=_client,
+            args=(url, stop_at, headers or {}, latencies, errors, lock),
+        )
+        for _ in range(concurrency)
+    ]
+    started = time.monotonic()
+    for client in clients:
+        client.start()
+    for client in clients:
+        client.join()
+    elapsed = time.monotonic() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": sum(errors),
+        "rps": len(latencies) / elapsed,
+        "p50": percentile(latencies, 50) * 1000,
+        "p95": percentile(latencies, 95) * 1000,
+        "p99": percentile(latencies, 99) * 1000,
+    }
+
+
+def _target(value):
+    label, sep, url = value.partition("=")
+    return (label, url) if sep else (value, value)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "targets", nargs="+", type=_target, help="URL or label=URL to load"
+    )
+    parser.add_argument("-c", "--concurrency", type=int, default=20)
+    parser.add_argument("-d", "--duration", type=float, default=30)
+    parser.add_argument(
+        "--warmup", type=float, default=3, help="Seconds of unmeasured load first"
+    )
+    parser.add_argument(
+        "-H",
+        "--header",
+        action="append",
+        default=[],
+        help='Extra request header, e.g. "Authorization: Bearer ..."',
+    )
+    args = parser.parse_args()
+    headers = dict(
+        (name.strip(), value.strip())
+        for name, _, value in (header.partition(":") for header in args.header)
+    )
+
+    results = []
+    for label, url in args.targets:
+        if args.warmup:
+            run(url, args.concurrency, args.warmup, headers)
+        results.append((label, run(url, args.concurrency, args.duration, headers)))
+
+    print(
+        f"{'target':<16}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}"
+        f"{'p99 ms':>10}{'errors':>8}"
+    )
+    baseline = results[0][1]
+    for label, result in results:
+        line = (
+            f"{label:<16}{result['rps']:>10.1f}{result['p50']:>10.1f}"
+            f"{result['p95']:>10.1f}{result['p99']:>10.1f}{result['errors']:>8}"
+        )
+        if result is not baseline and baseline["rps"] and baseline["p99"]:
+            line += (
+                f"   req/s {result['rps'] / baseline['rps'] - 1:+.0%}, "
+                f"p99 {result['p99'] / baseline['p99'] - 1:+.0%}"
+            )
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
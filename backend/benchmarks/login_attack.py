@@ -0,0 +1,131 @@
+"""
+Load test of legitimate traffic while the login endpoint is under attack.
+
+Measures ``--path`` with ``--concurrency`` closed-loop clients (see
+``load_test.py``), first on its own and then while ``--attackers`` threads
+stuff random credentials into ``/users/login/`` as fast as they can. The
+attackers connect from ``--attacker-ips`` loopback addresses (127.0.0.2 and
+up, which Linux routes without setup), the way a small botnet would; the
+legitimate clients stay on 127.0.0.1. Run the server on the same host:
+
+    gunicorn -c gunicorn.conf.py -b 127.0.0.1:8000 &
+    python benchmarks/login_attack.py http://127.0.0.1:8000
+
+With the throttles in ``users/throttling.py`` most attempts get a 429
+without hashing a password, so the legitimate p95 stays close to the quiet
+run. To see the attack without them, start the server with
+``AUTH_THROTTLE_IP_RATE=1000000/s AUTH_THROTTLE_ACCOUNT_RATE=1000000/s``.
+"""
+
+import argparse
+import collections
+import http.client
+import json
+import threading
+import time
+import uuid
+from urllib.parse import urlsplit
+
+from load_test import run
+
+
+def _attacker(url, source_ip, stop, statuses, lock):
+    counts = collections.Counter()
+    connection = None
+    while not stop.is_set():
+        if connection is None:
+            connection = http.client.HTTPConnection(
+                url.netloc, timeout=30, source_address=(source_ip, 0)
+            )
+        body = json.dumps(
+            {"email": f"{uuid.uuid4().hex[:12]}@example.com", "password": "Guess123"}
+        )
+        try:
+            connection.request(
+                "POST",
+                "/users/login/",
+                body=body,
+                headers={"Content-Type": "application/json"},
+            )
+            response = connection.getresponse()
+            response.read()
+            counts[response.status] += 1
+            if response.will_close:
+                connection.close()
+                connection = None
+        except (OSError, http.client.HTTPException):
+            counts["error"] += 1
+            connection.close()
+            connection = None
+    if connection is not None:
+        connection.close()
+    with lock:
+        statuses.update(counts)
+
+
+def attack(url, attackers, attacker_ips):
+    """Start the attackers; returns a function that stops them and reports."""
+    stop, lock, statuses = threading.Event(), threading.Lock(), collections.Counter()
+    threads = [
+        threading.Thread(
+            target=_attacker,
+            args=(url, f"127.0.0.{2 + i % attacker_ips}", stop, statuses, lock),
+        )
+        for i in range(attackers)
+    ]
+    started = time.monotonic()
+    for thread in threads:
+        thread.start()
+
+    def finish():
+        stop.set()
+        for thread in threads:
+            thread.join()
+        return statuses, time.monotonic() - started
+
+    return finish
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("server", help="Base URL, e.g. http://127.0.0.1:8000")
+    parser.add_argument(
+        "--path", default="/api/public/schools/", help="Legitimate traffic's path"
+    )
+    parser.add_argument("-c", "--concurrency", type=int, default=4)
+    parser.add_argument("-d", "--duration", type=float, default=20)
+    parser.add_argument("--attackers", type=int, default=32)
+    parser.add_argument("--attacker-ips", type=int, default=4)
+    args = parser.parse_args()
+    url = urlsplit(args.server)
+    target = args.server.rstrip("/") + args.path
+
+    run(target, args.concurrency, 3)
+    quiet = run(target, args.concurrency, args.duration)
+    finish = attack(url, args.attackers, args.attacker_ips)
+    attacked = run(target, args.concurrency, args.duration)
+    statuses, elapsed = finish()
+
+    print(
+        f"{'legitimate':<16}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}"
+        f"{'p99 ms':>10}{'errors':>8}"
+    )
+    for label, result in (("quiet", quiet), ("under attack", attacked)):
+        print(
+            f"{label:<16}{result['rps']:>10.1f}{result['p50']:>10.1f}"
+            f"{result['p95']:>10.1f}{result['p99']:>10.1f}{result['errors']:>8}"
+        )
+    if quiet["p95"]:
+        print(f"p95 under attack {attacked['p95'] / quiet['p95'] - 1:+.0%}")
+
+    attempts = sum(statuses.values())
+    print(
+        f"\n{attempts} login attempts from {args.attacker_ips} IPs "
+        f"({attempts / elapsed:.0f}/s)"
+    )
+    for status, count in sorted(statuses.items(), key=str):
+        print(f"  {status:<6}{count:>8}  {count / (attempts or 1):6.1%}")
+
+
+if __name__ == "__main__":
+    main()
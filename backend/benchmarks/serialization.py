@@ -0,0 +1,159 @@
+"""
+Microbenchmark of the list serializers against the ``.values()`` fast path.
+
+Times ``SchoolSerializer``/``ReviewsSerializer`` and ``school_payloads()``/
+``review_payloads()`` on the same rows, queries included, and checks that
+both render to the same JSON. Runs against the configured database; with
+``--seed`` it first adds that many schools' worth of reviews inside a
+transaction that is rolled back afterwards:
+
+    python benchmarks/serialization.py --seed 100 --reviews-per-school 20
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.contrib.auth.models import AnonymousUser  # noqa: E402
+from django.db import transaction  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+from rest_framework.request import Request  # noqa: E402
+from rest_framework.test import APIRequestFactory  # noqa: E402
+
+from reviews.listing import review_payloads  # noqa: E402
+from reviews.models import Reviews  # noqa: E402
+from reviews.serializers import ReviewsSerializer  # noqa: E402
+from schools.listing import school_payloads  # noqa: E402
+from schools.models import Schools  # noqa: E402
+from schools.serializers import SchoolSerializer, with_listed_reviews  # noqa: E402
+from users.models import Users  # noqa: E402
+
+
+class Rollback(Exception):
+    pass
+
+
+def seed(schools, reviews_per_school):
+    created = Schools.objects.bulk_create(
+        Schools(
+            school_name=f"Benchmark School {i}",
+            mbb=True,
+            wbb=True,
+            fb=True,
+            conference="Benchmark Conference",
+            location="Benchmark Location",
+        )
+        for i in range(schools)
+    )
+    users = Users.objects.bulk_create(
+        Users(email=f"benchmark{i}@example.com") for i in range(reviews_per_school)
+    )
+    Reviews.objects.bulk_create(
+        (
+            Reviews(
+                school=school,
+                user=user,
+                sport="fb",
+                head_coach_name="Benchmark Coach",
+                head_coach_name_normalized="benchmark coach",
+                review_message="Benchmark review of the program.",
+                head_coach=7,
+                assistant_coaches=6,
+                team_culture=8,
+                campus_life=5,
+                athletic_facilities=9,
+                athletic_department=7,
+                player_development=6,
+                nil_opportunity=4,
+            )
+            for school in created
+            for user in users
+        ),
+        batch_size=5000,
+    )
+
+
+def measure(build, repeat):
+    """Median seconds of ``repeat`` calls, and the last result rendered."""
+    durations = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        data = build()
+        durations.append(time.perf_counter() - started)
+    return statistics.median(durations), JSONRenderer().render(data)
+
+
+def compare(label, serializer, fast, repeat):
+    slow_seconds, slow_json = measure(serializer, repeat)
+    fast_seconds, fast_json = measure(fast, repeat)
+    print(
+        f"{label:<8} serializer {slow_seconds * 1000:8.1f} ms   "
+        f"fast path {fast_seconds * 1000:8.1f} ms   "
+        f"{slow_seconds / fast_seconds:5.1f}x   "
+        f"{'identical' if slow_json == fast_json else 'OUTPUT DIFFERS'}"
+    )
+    return slow_json == fast_json
+
+
+def run(repeat):
+    request = Request(APIRequestFactory().get("/"))
+    request.user = AnonymousUser()
+    context = {"request": request}
+    schools = Schools.objects.order_by("id")
+    reviews = Reviews.objects.all()
+    print(f"{schools.count()} schools, {reviews.count()} reviews, median of {repeat}")
+    return all(
+        [
+            compare(
+                "schools",
+                lambda: SchoolSerializer(
+                    with_listed_reviews(schools, request), many=True, context=context
+                ).data,
+                lambda: school_payloads(schools, request),
+                repeat,
+            ),
+            compare(
+                "reviews",
+                lambda: ReviewsSerializer(
+                    reviews.for_listing(request.user), many=True, context=context
+                ).data,
+                lambda: review_payloads(reviews, request),
+                repeat,
+            ),
+        ]
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--seed", type=int, default=0, help="Schools to add for the run"
+    )
+    parser.add_argument("--reviews-per-school", type=int, default=10)
+    args = parser.parse_args()
+
+    if not args.seed:
+        sys.exit(0 if run(args.repeat) else 1)
+    try:
+        with transaction.atomic():
+            seed(args.seed, args.reviews_per_school)
+            identical = run(args.repeat)
+            raise Rollback
+    except Rollback:
+        pass
+    sys.exit(0 if identical else 1)
+
+
+if __name__ == "__main__":
+    main()
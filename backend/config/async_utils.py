@@ -0,0 +1,51 @@
+"""
+Helpers for the plain Django async views served in ASGI mode.
+
+DRF's ``@api_view`` only wraps sync views, so the async views parse request
+bodies and authenticate JWTs themselves, returning the same payloads and
+status codes as their DRF counterparts.
+"""
+
+import json
+
+from asgiref.sync import sync_to_async
+from django.http import JsonResponse
+from rest_framework import status
+from rest_framework.exceptions import NotAuthenticated, ParseError
+
+from users.authentication import CachedJWTAuthentication
+
+
+def request_data(request):
+    """The JSON or form body of ``request`` as a dict, like ``request.data``."""
+    if request.content_type == "application/json":
+        if not request.body:
+            return {}
+        try:
+            return json.loads(request.body)
+        except ValueError as e:
+            raise ParseError(f"JSON parse error - {e}")
+    return request.POST
+
+
+def error_response(exc):
+    """Render a DRF ``APIException`` the way DRF's exception handler does."""
+    detail = exc.detail
+    if not isinstance(detail, (list, dict)):
+        detail = {"detail": detail}
+    return JsonResponse(detail, status=exc.status_code, safe=False)
+
+
+async def aauthenticate(request):
+    """
+    The user authenticated by the request's JWT. Raises ``NotAuthenticated``
+    without credentials and ``AuthenticationFailed`` for a bad token.
+    """
+    result = await sync_to_async(CachedJWTAuthentication().authenticate)(request)
+    if result is None:
+        raise NotAuthenticated()
+    return result[0]
+
+
+def bad_request(message):
+    return JsonResponse({"error": message}, status=status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,195 @@
+"""
+Response compression negotiated through ``Accept-Encoding``.
+
+Brotli is preferred when the ``brotli`` package is installed and the client
+accepts it, otherwise gzip. Responses under ``settings.COMPRESSION_MIN_SIZE``
+bytes are sent as they are, since compressing them costs more than it saves.
+Streaming responses, sync or async, are compressed chunk by chunk.
+
+Compressing a secret next to text an attacker controls lets them guess the
+secret from response sizes (BREACH). Like Django's ``GZipMiddleware``, gzip
+output is padded with up to ``settings.COMPRESSION_GZIP_MAX_RANDOM_BYTES``
+random bytes in the header's file name field. Brotli has no such field, so
+views whose responses carry secrets (the JWT login) are marked with
+``compression_exempt`` and sent uncompressed in either coding.
+"""
+
+import secrets
+import struct
+import zlib
+from functools import wraps
+
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+
+from config.instrumentation import timed
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is in requirements.txt
+    brotli = None
+
+
+def _gzip_header():
+    # Magic, deflate, FNAME flag, no mtime, no extra flags, unknown OS, then
+    # the random-length, zero-terminated file name
+    padding = b"a" * secrets.randbelow(settings.COMPRESSION_GZIP_MAX_RANDOM_BYTES + 1)
+    return b"\x1f\x8b\x08\x08\x00\x00\x00\x00\x00\xff" + padding + b"\x00"
+
+
+class _Gzip:
+    def __init__(self):
+        # A raw deflate stream; the header and trailer are written here so the
+        # header can carry the padding
+        self._compressor = zlib.compressobj(
+            settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, -zlib.MAX_WBITS
+        )
+        self._header = _gzip_header()
+        self._crc = 0
+        self._size = 0
+
+    def _with_header(self, data):
+        data, self._header = self._header + data, b""
+        return data
+
+    def compress(self, data):
+        self._crc = zlib.crc32(data, self._crc)
+        self._size += len(data)
+        return self._with_header(self._compressor.compress(data))
+
+    def finish(self):
+        trailer = struct.pack("<LL", self._crc, self._size & 0xFFFFFFFF)
+        return self._with_header(self._compressor.flush()) + trailer
+
+
+class _Brotli:
+    def __init__(self):
+        self._compressor = brotli.Compressor(
+            quality=settings.COMPRESSION_BROTLI_QUALITY
+        )
+
+    def compress(self, data):
+        return self._compressor.process(data)
+
+    def finish(self):
+        return self._compressor.finish()
+
+
+# In order of preference when the client accepts several equally
+ENCODERS = {"gzip": _Gzip}
+if brotli is not None:
+    ENCODERS = {"br": _Brotli, **ENCODERS}
+
+
+def accepted_encodings(header):
+    """The codings in an ``Accept-Encoding`` header, mapped to their q-values."""
+    accepted = {}
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding] = q
+    return accepted
+
+
+def choose_encoding(header):
+    """The supported coding the client prefers, or None for identity."""
+    accepted = accepted_encodings(header)
+    best, best_q = None, 0.0
+    for coding in ENCODERS:
+        q = accepted.get(coding, accepted.get("*", 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def _compress(coding, content):
+    encoder = ENCODERS[coding]()
+    return encoder.compress(content) + encoder.finish()
+
+
+def _compress_stream(coding, chunks):
+    encoder = ENCODERS[coding]()
+    for chunk in chunks:
+        data = encoder.compress(chunk)
+        if data:
+            yield data
+    yield encoder.finish()
+
+
+async def _acompress_stream(coding, chunks):
+    encoder = ENCODERS[coding]()
+    async for chunk in chunks:
+        data = encoder.compress(chunk)
+        if data:
+            yield data
+    yield encoder.finish()
+
+
+def compression_exempt(view):
+    """Send the view's responses uncompressed, e.g. because they carry secrets."""
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        response = view(*args, **kwargs)
+        response.compression_exempt = True
+        return response
+
+    return wrapper
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    Compress responses with brotli or gzip, whichever the client prefers.
+    Replaces Django's ``GZipMiddleware``, including its BREACH padding for gzip.
+    """
+
+    def process_response(self, request, response):
+        if response.has_header("Content-Encoding"):
+            return response
+        if getattr(response, "compression_exempt", False):
+            return response
+        if (
+            not response.streaming
+            and len(response.content) < settings.COMPRESSION_MIN_SIZE
+        ):
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        coding = choose_encoding(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        if coding is None:
+            return response
+
+        if response.streaming:
+            # Pull the iterator out now in case streaming_content is replaced
+            chunks = response.streaming_content
+            if response.is_async:
+                response.streaming_content = _acompress_stream(coding, chunks)
+            else:
+                response.streaming_content = _compress_stream(coding, chunks)
+            # The compressed size isn't known until the stream ends
+            del response.headers["Content-Length"]
+        else:
+            with timed("compress"):
+                compressed = _compress(coding, response.content)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers["Content-Length"] = str(len(compressed))
+
+        # A strong ETag can't match a body in a different encoding
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = coding
+        return response
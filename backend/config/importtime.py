@@ -0,0 +1,83 @@
+"""
+Import-time profiling of process startup.
+
+``measure()`` boots the backend the way a gunicorn worker does (or imports
+the given modules) in a fresh ``python -X importtime`` subprocess and parses
+the interpreter's report, so imports already loaded by the calling process
+don't hide anything. ``by_package()`` totals each module's own time per
+top-level package, which is usually what points at a heavy dependency.
+"""
+
+import os
+import subprocess
+import sys
+from collections import namedtuple
+from pathlib import Path
+
+Import = namedtuple("Import", ["module", "depth", "self_us", "cumulative_us"])
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# What a worker imports before serving its first request
+BOOT = (
+    "import django; django.setup(); "
+    "import config.wsgi, config.urls; "
+    "from django.urls import get_resolver; get_resolver().url_patterns"
+)
+
+
+def parse(report):
+    """The ``Import``s in ``-X importtime`` output, in the order they finished."""
+    imports = []
+    for line in report.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # The header line
+        name = fields[2].rstrip()
+        module = name.lstrip()
+        # Each nesting level is indented by two spaces
+        depth = (len(name) - len(module) - 1) // 2
+        imports.append(Import(module, depth, int(fields[0]), int(fields[1])))
+    return imports
+
+
+def measure(modules=None):
+    """Import ``modules`` (default: boot the backend) and return the ``Import``s."""
+    code = "; ".join(f"import {module}" for module in modules) if modules else BOOT
+    env = {
+        **os.environ,
+        "DJANGO_SETTINGS_MODULE": os.environ.get(
+            "DJANGO_SETTINGS_MODULE", "config.settings"
+        ),
+    }
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    return parse(result.stderr)
+
+
+def total_us(imports):
+    """Time spent importing, i.e. the sum over the outermost imports."""
+    return sum(entry.cumulative_us for entry in imports if entry.depth == 0)
+
+
+def by_package(imports):
+    """``[(package, self_us, modules)]``, slowest first."""
+    packages = {}
+    for entry in imports:
+        package = entry.module.split(".")[0]
+        self_us, count = packages.get(package, (0, 0))
+        packages[package] = (self_us + entry.self_us, count + 1)
+    return sorted(
+        ((package, us, count) for package, (us, count) in packages.items()),
+        key=lambda row: row[1],
+        reverse=True,
+    )
@@ -0,0 +1,283 @@
+"""
+Per-request performance instrumentation.
+
+``RequestTimingMiddleware`` measures each request's wall time, database query
+count and time, and the time spent in code wrapped in ``timed()`` (serializers,
+LLM calls, SMTP). The breakdown is logged as one JSON line per request and
+sent back to admins (or everyone, per ``settings.SERVER_TIMING``) as a
+``Server-Timing`` header. With ``settings.METRICS_ENABLED`` the totals are
+also served in Prometheus text format at ``/metrics``.
+
+Database time is captured by a wrapper installed on every connection with
+``connection.execute_wrapper``'s mechanism; it only records while a request is
+being measured, so management commands and workers pay nothing.
+"""
+
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.http import Http404, HttpResponse
+from django.utils.functional import SimpleLazyObject, empty
+
+logger = logging.getLogger(__name__)
+
+_current = ContextVar("request_timings", default=None)
+# Names of the timed() blocks open in this thread or task
+_open = ContextVar("open_timings", default=frozenset())
+
+# Seconds; Prometheus histogram buckets for request duration
+DURATION_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+class Timings:
+    """Accumulated durations for one request; safe to share across threads."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.durations = {"db": 0.0}
+        self._lock = threading.Lock()
+
+    def add(self, name, seconds):
+        with self._lock:
+            self.durations[name] = self.durations.get(name, 0) + seconds
+
+    def add_query(self, seconds):
+        with self._lock:
+            self.queries += 1
+            self.durations["db"] += seconds
+
+
+@contextmanager
+def timed(name):
+    """
+    Add the time spent in the block to the current request's ``name`` timing.
+
+    Nested blocks with the same name (a serializer serializing its nested
+    serializers) only count once. Blocks running in parallel threads or tasks
+    all count, so a timing can exceed the request's wall time.
+    """
+    timings = _current.get()
+    if timings is None or name in _open.get():
+        yield
+        return
+    token = _open.set(_open.get() | {name})
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        _open.reset(token)
+        timings.add(name, time.perf_counter() - started)
+
+
+def _record_query(execute, sql, params, many, context):
+    timings = _current.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timings.add_query(time.perf_counter() - started)
+
+
+def _install_query_wrapper(connection, **kwargs):
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record_query)
+
+
+def _install_on_open_connections():
+    # Connections opened before the middleware was loaded missed the signal
+    for connection in connections.all(initialized_only=True):
+        _install_query_wrapper(connection)
+
+
+class TimedSerializerMixin:
+    """Count a serializer's ``to_representation`` as "serialize" time."""
+
+    def to_representation(self, instance):
+        with timed("serialize"):
+            return super().to_representation(instance)
+
+
+class _Metrics:
+    """Per-process request totals by method, route and status."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = {}
+
+    def observe(self, labels, seconds, timings):
+        with self._lock:
+            entry = self.requests.setdefault(
+                labels,
+                {
+                    "count": 0,
+                    "seconds": 0.0,
+                    "queries": 0,
+                    "db_seconds": 0.0,
+                    "buckets": [0] * len(DURATION_BUCKETS),
+                },
+            )
+            entry["count"] += 1
+            entry["seconds"] += seconds
+            entry["queries"] += timings.queries
+            entry["db_seconds"] += timings.durations["db"]
+            for i, bound in enumerate(DURATION_BUCKETS):
+                if seconds <= bound:
+                    entry["buckets"][i] += 1
+
+    def render(self):
+        # Each family is one block under its TYPE line, as the format requires
+        with self._lock:
+            entries = [
+                (f'method="{method}",route="{route}",status="{status}"', entry)
+                for (method, route, status), entry in sorted(self.requests.items())
+            ]
+        lines = ["# TYPE http_requests_total counter"]
+        for labels, entry in entries:
+            lines.append(f"http_requests_total{{{labels}}} {entry['count']}")
+        lines.append("# TYPE http_request_duration_seconds histogram")
+        for labels, entry in entries:
+            for bound, count in zip(DURATION_BUCKETS, entry["buckets"]):
+                lines.append(
+                    f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {count}'
+                )
+            lines.append(
+                f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {entry["count"]}'
+            )
+            lines.append(
+                f"http_request_duration_seconds_sum{{{labels}}} {entry['seconds']:.6f}"
+            )
+            lines.append(
+                f"http_request_duration_seconds_count{{{labels}}} {entry['count']}"
+            )
+        lines.append("# TYPE http_request_db_queries_total counter")
+        for labels, entry in entries:
+            lines.append(
+                f"http_request_db_queries_total{{{labels}}} {entry['queries']}"
+            )
+        lines.append("# TYPE http_request_db_seconds_total counter")
+        for labels, entry in entries:
+            lines.append(
+                f"http_request_db_seconds_total{{{labels}}} {entry['db_seconds']:.6f}"
+            )
+        return "\n".join(lines) + "\n"
+
+
+metrics = _Metrics()
+
+
+def metrics_view(request):
+    """Prometheus text exposition of this process's request totals."""
+    if not settings.METRICS_ENABLED:
+        raise Http404
+    return HttpResponse(
+        metrics.render(), content_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
+def _shows_server_timing(request):
+    """Whether the response may carry the timings (they name internals)."""
+    if settings.SERVER_TIMING == "all":
+        return True
+    if settings.SERVER_TIMING != "admin":
+        return False
+    # Only a user the view already loaded: DRF sets the one it authenticated
+    # on the request. Loading the session user here would query the database,
+    # which isn't allowed from the event loop under ASGI.
+    user = getattr(request, "user", None)
+    if user is None or (isinstance(user, SimpleLazyObject) and user._wrapped is empty):
+        return False
+    return user.is_authenticated and (
+        user.is_superuser or getattr(user, "role", "") == "admin"
+    )
+
+
+class RequestTimingMiddleware:
+    """
+    Measure every request and report it in the log, the metrics and, where
+    allowed, ``Server-Timing``. Works under both WSGI and ASGI.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+        # Connections opened from now on (any thread) get the query wrapper
+        connection_created.connect(_install_query_wrapper)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        _install_on_open_connections()
+        timings = Timings()
+        token = _current.set(timings)
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self._report(request, response, timings)
+
+    async def __acall__(self, request):
+        # Under ASGI every request opens its own connections (CONN_MAX_AGE is
+        # 0), which pick up the query wrapper from the connection_created signal
+        timings = Timings()
+        token = _current.set(timings)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self._report(request, response, timings)
+
+    def _report(self, request, response, timings):
+        total = time.perf_counter() - timings.started
+        durations = {"total": total, **timings.durations}
+        if _shows_server_timing(request):
+            response["Server-Timing"] = ", ".join(
+                self._server_timing(name, seconds, timings)
+                for name, seconds in durations.items()
+            )
+
+        match = request.resolver_match
+        route = match.route if match else "unmatched"
+        logger.info(
+            json.dumps(
+                {
+                    "event": "request",
+                    "method": request.method,
+                    "path": request.path,
+                    "route": route,
+                    "status": response.status_code,
+                    "queries": timings.queries,
+                    **{
+                        f"{name}_ms": round(seconds * 1000, 2)
+                        for name, seconds in durations.items()
+                    },
+                }
+            )
+        )
+        if settings.METRICS_ENABLED:
+            metrics.observe(
+                (request.method, route, response.status_code), total, timings
+            )
+        return response
+
+    @staticmethod
+    def _server_timing(name, seconds, timings):
+        entry = f"{name};dur={seconds * 1000:.1f}"
+        if name == "db":
+            entry += f';desc="{timings.queries} queries"'
+        return entry
@@ -0,0 +1,129 @@
+"""
+Non-blocking log handling.
+
+``QueueHandler`` formats each record on the calling thread and hands it to a
+background thread that writes it out, so requests never wait on stderr or
+the log collector behind it. When the queue is full the record is dropped
+and counted instead of blocking.
+
+``SamplingFilter`` keeps a fraction of the records from chosen loggers and
+``RateLimitFilter`` caps how many records per second each logger may emit.
+Warnings and errors always get through both. ``settings.LOGGING`` attaches all
+three to the console output.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+import threading
+import time
+
+
+class _Listener(logging.handlers.QueueListener):
+    def enqueue_sentinel(self):
+        # Wait for room instead of failing when stopped with a full queue
+        self.queue.put(self._sentinel)
+
+
+class QueueHandler(logging.handlers.QueueHandler):
+    """Format on the caller's thread, write to ``stream`` on a background one."""
+
+    def __init__(self, stream=None, queue_size=10000):
+        self.queue_size = queue_size
+        self.stream = stream or sys.stderr
+        self.dropped = 0
+        self._listener = None
+        super().__init__(queue.Queue(queue_size))
+        self.start()
+        # The listener thread doesn't survive a fork (gunicorn preloads the
+        # app in the master), so each child starts its own
+        os.register_at_fork(after_in_child=self._restart_in_child)
+        atexit.register(self.stop)
+
+    def start(self):
+        target = logging.StreamHandler(self.stream)
+        self._listener = _Listener(self.queue, target)
+        self._listener.start()
+
+    def stop(self):
+        """Write out what's queued and stop the listener."""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
+    def _restart_in_child(self):
+        # The parent's queue may have been locked mid-fork; start afresh
+        self.queue = queue.Queue(self.queue_size)
+        self._listener = None
+        self.start()
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep ``rates[prefix]`` of the records from loggers under each prefix (the
+    longest matching prefix wins). Other loggers and records at ``WARNING``
+    and above always pass.
+    """
+
+    def __init__(self, rates=None):
+        super().__init__()
+        self.rates = dict(rates or {})
+        self._by_logger = {}
+
+    def _rate(self, name):
+        if name not in self._by_logger:
+            matches = [
+                prefix
+                for prefix in self.rates
+                if name == prefix or name.startswith(prefix + ".")
+            ]
+            self._by_logger[name] = (
+                self.rates[max(matches, key=len)] if matches else 1.0
+            )
+        return self._by_logger[name]
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = self._rate(record.name)
+        return rate >= 1 or random.random() < rate
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    A token bucket per logger: each may emit ``burst`` records at once and
+    ``rate`` per second after that. Records over the limit are dropped and
+    counted in ``suppressed``; warnings and errors always pass.
+    """
+
+    def __init__(self, rate=50, burst=100):
+        super().__init__()
+        self.rate = rate
+        self.burst = burst
+        self.suppressed = 0
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING:
+            return True
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.get(record.name, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - updated) * self.rate)
+            if tokens < 1:
+                self._buckets[record.name] = (tokens, now)
+                self.suppressed += 1
+                return False
+            self._buckets[record.name] = (tokens - 1, now)
+            return True
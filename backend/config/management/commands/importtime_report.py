@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from config.importtime import by_package, measure, total_us
+
+
+class Command(BaseCommand):
+    help = (
+        "Report where process startup spends its time importing modules, "
+        "from python -X importtime."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "modules",
+            nargs="*",
+            help="Modules to import instead of booting the backend like a worker",
+        )
+        parser.add_argument("--limit", type=int, default=20, help="Rows in each table")
+        parser.add_argument(
+            "--min-ms",
+            type=float,
+            default=0,
+            help="Leave out modules that took less than this, cumulatively",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            imports = measure(options["modules"])
+        except RuntimeError as e:
+            raise CommandError(f"Import failed: {e}")
+        limit = options["limit"]
+
+        self.stdout.write(
+            f"{len(imports)} modules imported in {total_us(imports) / 1000:.1f} ms\n"
+        )
+        self.stdout.write(f"{'package':<32}{'self ms':>10}{'modules':>9}")
+        for package, self_us, count in by_package(imports)[:limit]:
+            self.stdout.write(f"{package:<32}{self_us / 1000:>10.1f}{count:>9}")
+
+        self.stdout.write(f"\n{'module':<48}{'cumul. ms':>10}{'self ms':>10}")
+        slowest = sorted(imports, key=lambda entry: entry.cumulative_us, reverse=True)
+        for entry in slowest[:limit]:
+            if entry.cumulative_us < options["min_ms"] * 1000:
+                break
+            name = "  " * entry.depth + entry.module
+            self.stdout.write(
+                f"{name[:47]:<48}{entry.cumulative_us / 1000:>10.1f}"
+                f"{entry.self_us / 1000:>10.1f}"
+            )
@@ -0,0 +1,230 @@
+"""
+Opt-in profiling of individual requests.
+
+``ProfilingMiddleware`` profiles a ``settings.PROFILING_SAMPLE_RATE``
+fraction of the requests under ``settings.PROFILING_PATHS``, and any request
+whose ``X-Profile`` header matches ``settings.PROFILING_TOKEN``. Each profile
+is written to ``settings.PROFILING_DIR`` next to a JSON file of request
+metadata, and the response names it in an ``X-Profile-Id`` header.
+
+Two profilers are available (``settings.PROFILING_MODE``):
+
+- ``"sample"`` (the default) snapshots the request thread's stack every
+  ``settings.PROFILING_INTERVAL`` seconds from a background thread and writes
+  the counts as collapsed stacks (``<id>.collapsed``), ready for
+  ``flamegraph.pl`` or speedscope. Its overhead is low and doesn't grow with
+  the number of function calls.
+- ``"cprofile"`` traces every call with ``cProfile`` and writes
+  ``<id>.prof`` for ``pstats`` or snakeviz. It is exact, but slows the
+  request down several times.
+
+Only the request's own thread is profiled. Under ASGI that is the event loop,
+so work handed to sync threads shows up as time spent waiting, and other
+requests on the same loop can show up in the profile.
+
+With neither a sample rate nor a token configured the middleware removes
+itself at startup, so it costs nothing.
+"""
+
+import cProfile
+import hmac
+import json
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from config.instrumentation import _current
+
+HEADER = "HTTP_X_PROFILE"
+
+
+@lru_cache(maxsize=8192)
+def _frame_name(code):
+    filename = code.co_filename
+    # Shorten paths to their package-relative part
+    for path in sorted(sys.path, key=len, reverse=True):
+        if path and filename.startswith(path):
+            filename = filename[len(path) :].lstrip(os.sep)
+            break
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})".replace(";", ":")
+
+
+def collapse(frame):
+    """The stack ending at ``frame`` as one collapsed line, outermost first."""
+    names = []
+    while frame is not None:
+        names.append(_frame_name(frame.f_code))
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class StackSampler:
+    """Count the stacks a thread is seen in, sampled every ``interval`` seconds."""
+
+    def __init__(self, thread_id, interval):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.stacks[collapse(frame)] += 1
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def write(self, path):
+        with open(path, "w") as file:
+            for stack, count in self.stacks.most_common():
+                file.write(f"{stack} {count}\n")
+        return sum(self.stacks.values())
+
+
+class CProfiler:
+    """``cProfile`` behind the same interface as ``StackSampler``."""
+
+    def __init__(self):
+        self.profile = cProfile.Profile()
+
+    def start(self):
+        self.profile.enable()
+
+    def stop(self):
+        self.profile.disable()
+
+    def write(self, path):
+        self.profile.dump_stats(path)
+        return None
+
+
+PROFILERS = {"sample": ".collapsed", "cprofile": ".prof"}
+
+
+class ProfilingMiddleware:
+    """Profile sampled or explicitly requested requests; see the module docs."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.sample_rate = settings.PROFILING_SAMPLE_RATE
+        self.token = settings.PROFILING_TOKEN
+        if self.sample_rate <= 0 and not self.token:
+            raise MiddlewareNotUsed
+        if settings.PROFILING_MODE not in PROFILERS:
+            raise ValueError(f"Unknown PROFILING_MODE {settings.PROFILING_MODE!r}")
+        self.mode = settings.PROFILING_MODE
+        self.paths = tuple(settings.PROFILING_PATHS)
+        self.directory = settings.PROFILING_DIR
+        os.makedirs(self.directory, exist_ok=True)
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def _trigger(self, request):
+        """Why the request should be profiled ("header" or "sample"), or None."""
+        header = request.META.get(HEADER)
+        if header and self.token and hmac.compare_digest(header, self.token):
+            return "header"
+        if self.sample_rate > 0 and request.path.startswith(self.paths or ("/",)):
+            if random.random() < self.sample_rate and not self._full():
+                return "sample"
+        return None
+
+    def _full(self):
+        # Sampling stops once the directory holds enough profiles
+        with os.scandir(self.directory) as entries:
+            count = sum(entry.name.endswith(".json") for entry in entries)
+        return count >= settings.PROFILING_MAX_PROFILES
+
+    def _profiler(self):
+        if self.mode == "cprofile":
+            return CProfiler()
+        return StackSampler(threading.get_ident(), settings.PROFILING_INTERVAL)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        trigger = self._trigger(request)
+        if trigger is None:
+            return self.get_response(request)
+        profiler = self._profiler()
+        started = time.perf_counter()
+        profiler.start()
+        try:
+            response = self.get_response(request)
+        finally:
+            profiler.stop()
+        return self._save(request, response, profiler, trigger, started)
+
+    async def __acall__(self, request):
+        trigger = self._trigger(request)
+        if trigger is None:
+            return await self.get_response(request)
+        profiler = self._profiler()
+        started = time.perf_counter()
+        profiler.start()
+        try:
+            response = await self.get_response(request)
+        finally:
+            profiler.stop()
+        return self._save(request, response, profiler, trigger, started)
+
+    def _save(self, request, response, profiler, trigger, started):
+        duration = time.perf_counter() - started
+        started_at = datetime.now(timezone.utc) - timedelta(seconds=duration)
+        profile_id = f"{started_at:%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}"
+        base = os.path.join(self.directory, profile_id)
+        samples = profiler.write(base + PROFILERS[self.mode])
+
+        match = request.resolver_match
+        timings = _current.get()
+        metadata = {
+            "id": profile_id,
+            "profile": profile_id + PROFILERS[self.mode],
+            "mode": self.mode,
+            "trigger": trigger,
+            "started_at": started_at.isoformat(),
+            "method": request.method,
+            "path": request.path,
+            # Names only; values may be personal or secret
+            "query_params": sorted(request.GET),
+            "route": match.route if match else None,
+            "view": match.view_name if match else None,
+            "status": response.status_code,
+            "duration_ms": round(duration * 1000, 2),
+            "pid": os.getpid(),
+        }
+        if samples is not None:
+            metadata["interval"] = settings.PROFILING_INTERVAL
+            metadata["samples"] = samples
+        if timings is not None:
+            metadata["queries"] = timings.queries
+            metadata["timings_ms"] = {
+                name: round(seconds * 1000, 2)
+                for name, seconds in timings.durations.items()
+            }
+        with open(base + ".json", "w") as file:
+            json.dump(metadata, file, indent=2)
+
+        response["X-Profile-Id"] = profile_id
+        return response
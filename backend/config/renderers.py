@@ -0,0 +1,58 @@
+"""
+orjson-backed JSON renderer and parser for DRF.
+
+Both produce and accept the same JSON as DRF's stdlib-based classes. Types
+orjson doesn't handle the way DRF does (datetimes, decimals, lazy strings,
+querysets) go through DRF's own encoder. Without orjson installed they
+fall back to the stdlib implementation.
+"""
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    orjson = None
+
+if orjson is not None:
+    # Datetimes pass through to DRF's encoder, which writes UTC as "Z"
+    OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+else:
+    OPTIONS = 0
+
+_default = JSONEncoder().default
+
+
+class ORJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        options = OPTIONS
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if indent:
+            # orjson only indents by two spaces
+            options |= orjson.OPT_INDENT_2
+        ret = orjson.dumps(data, default=_default, option=options)
+        # Escape these like DRF does, so the output is valid JavaScript
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+                b"\xe2\x80\xa9", b"\\u2029"
+            )
+        return ret
+
+
+class ORJSONParser(JSONParser):
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        encoding = (parser_context or {}).get("encoding", settings.DEFAULT_CHARSET)
+        if orjson is None or encoding.lower().replace("-", "") != "utf8":
+            return super().parse(stream, media_type, parser_context)
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
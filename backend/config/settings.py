@@ -52,6 +52,9 @@ INSTALLED_APPS = [
     "reviews",
     "report",
     "preferences",
+    "outbox",
+    # Project-wide management commands (config/management)
+    "config",
 ]
 
 AUTH_USER_MODEL = "users.Users"
@@ -62,8 +65,22 @@ AUTHENTICATION_BACKENDS = [
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
-    )
+        # JWTAuthentication, with the user served from the cache
+        "users.authentication.CachedJWTAuthentication",
+    ),
+    # orjson-backed; same JSON as DRF's defaults, rendered several times faster
+    "DEFAULT_RENDERER_CLASSES": (
+        "config.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "config.renderers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
+    # Proxies in front of the app (nginx). Throttles key on the address the
+    # last of them added to X-Forwarded-For, since clients can send their own
+    "NUM_PROXIES": int(os.getenv("NUM_PROXIES", "1")),
 }
 
 SIMPLE_JWT = {
@@ -74,6 +91,12 @@ SIMPLE_JWT = {
 }
 
 MIDDLEWARE = [
+    # First, so its timings cover the rest of the stack
+    "config.instrumentation.RequestTimingMiddleware",
+    # Outside everything that sets the body, so it compresses the final one
+    "config.compression.CompressionMiddleware",
+    # Removes itself unless PROFILING_SAMPLE_RATE or PROFILING_TOKEN is set
+    "config.profiling.ProfilingMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -106,6 +129,12 @@ TEMPLATES = [
 
 WSGI_APPLICATION = "config.wsgi.application"
 
+# "wsgi" (gunicorn sync workers) or "asgi" (gunicorn with uvicorn workers). In
+# ASGI mode the I/O-bound endpoints (review summaries, emails) route to their
+# async views so a worker can serve other requests while they wait.
+SERVER_MODE = os.getenv("SERVER_MODE", "wsgi").lower()
+ASYNC_VIEWS = SERVER_MODE == "asgi"
+
 
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
@@ -120,9 +149,24 @@ DATABASES = {
         "PASSWORD": os.getenv("DB_PASSWORD"),
         "HOST": os.getenv("DB_HOST"),
         "PORT": os.getenv("DB_PORT"),
+        # Keep connections open across requests instead of reconnecting every
+        # time, checking they are still alive before reuse. Not under ASGI,
+        # where each request runs in a fresh thread and would leak them.
+        "CONN_MAX_AGE": int(os.getenv("DB_CONN_MAX_AGE", "0" if ASYNC_VIEWS else "60")),
+        "CONN_HEALTH_CHECKS": True,
     }
 }
 
+# Set when DB_HOST is a PgBouncer in transaction pooling mode: server-side
+# cursors and session-level advisory locks don't survive a transaction there,
+# so the former are disabled and summary generation skips its single-flight
+# lock (versioned summary writes still keep the results consistent)
+PGBOUNCER_TRANSACTION_POOLING = (
+    os.getenv("PGBOUNCER_TRANSACTION_POOLING", "false").lower() == "true"
+)
+if PGBOUNCER_TRANSACTION_POOLING:
+    DATABASES["default"]["DISABLE_SERVER_SIDE_CURSORS"] = True
+
 # Email Settings
 EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
 EMAIL_HOST = "smtp.gmail.com"
@@ -130,6 +174,8 @@ EMAIL_PORT = 587
 EMAIL_USE_TLS = True
 EMAIL_HOST_USER = os.getenv("EMAIL_ADDRESS")
 EMAIL_HOST_PASSWORD = os.getenv("EMAIL_PWD")
+# Seconds before a stalled SMTP call gives up (otherwise it can block forever)
+EMAIL_TIMEOUT = float(os.getenv("EMAIL_TIMEOUT", "10"))
 DEFAULT_FROM_EMAIL = os.getenv("EMAIL_ADDRESS")
 REPORT_RECEIVER_EMAIL = [
     email.strip()
@@ -137,6 +183,17 @@ REPORT_RECEIVER_EMAIL = [
     if email.strip()
 ]
 
+# Outbox worker (`manage.py send_outbox`): emails per SMTP connection, attempts
+# before a message is dead-lettered, base seconds between retries (doubling;
+# a batch that couldn't connect waits this long without using an attempt),
+# seconds between polls when idle, and seconds a worker holds its claimed batch
+# before other workers may take it over (keep it well above a batch's send time)
+OUTBOX_BATCH_SIZE = int(os.getenv("OUTBOX_BATCH_SIZE", "50"))
+OUTBOX_MAX_ATTEMPTS = int(os.getenv("OUTBOX_MAX_ATTEMPTS", "5"))
+OUTBOX_RETRY_BACKOFF = float(os.getenv("OUTBOX_RETRY_BACKOFF", "60"))
+OUTBOX_POLL_INTERVAL = float(os.getenv("OUTBOX_POLL_INTERVAL", "5"))
+OUTBOX_LEASE = float(os.getenv("OUTBOX_LEASE", "600"))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -180,6 +237,113 @@ STATIC_URL = "static/"
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL") or None
+
+# LLM gateway (reviews/llm.py): seconds per attempt, seconds per call including
+# retries, and how many consecutive failures open the breaker for how long
+LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", "10"))
+LLM_DEADLINE = float(os.getenv("LLM_DEADLINE", "20"))
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "2"))
+LLM_RETRY_BACKOFF = float(os.getenv("LLM_RETRY_BACKOFF", "0.5"))
+LLM_BREAKER_THRESHOLD = int(os.getenv("LLM_BREAKER_THRESHOLD", "5"))
+LLM_BREAKER_COOLDOWN = float(os.getenv("LLM_BREAKER_COOLDOWN", "30"))
+LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "20"))
+# Most model calls in flight at once per process; keeps bursts under the
+# provider's rate limit
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "4"))
+# Seconds a call may wait for one of those slots; LLM_DEADLINE starts after
+LLM_SLOT_WAIT = float(os.getenv("LLM_SLOT_WAIT", "30"))
+
+# Seconds a summary request waits for another worker generating the same
+# school and sport before serving the stored summary instead
+SUMMARY_LOCK_WAIT = float(os.getenv("SUMMARY_LOCK_WAIT", "5"))
+
+# Whether page loads regenerate stale summaries themselves; turn off when
+# `manage.py refresh_summaries` runs on a schedule
+SUMMARY_GENERATE_ON_REQUEST = (
+    os.getenv("SUMMARY_GENERATE_ON_REQUEST", "true").lower() != "false"
+)
+
+# Estimated tokens of review text sent with each summary prompt
+SUMMARY_PROMPT_TOKEN_BUDGET = int(os.getenv("SUMMARY_PROMPT_TOKEN_BUDGET", "3000"))
+
+# Reviews beyond the budget are summarized in chunks of this many reviews
+SUMMARY_CHUNK_SIZE = int(os.getenv("SUMMARY_CHUNK_SIZE", "25"))
+
+# Redis when REDIS_URL is set, so every worker shares the cache; otherwise each
+# process has its own, and a user saved in one worker can stay cached in the
+# others for up to AUTH_USER_CACHE_TIMEOUT seconds
+REDIS_URL = os.getenv("REDIS_URL")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+# Seconds an authenticated user is served from the cache (users/authentication.py)
+AUTH_USER_CACHE_TIMEOUT = int(os.getenv("AUTH_USER_CACHE_TIMEOUT", "60"))
+
+# Seconds anonymous school list and detail payloads stay in the cache
+# (schools/cache.py); writes invalidate them sooner
+SCHOOL_CACHE_TIMEOUT = int(os.getenv("SCHOOL_CACHE_TIMEOUT", "300"))
+
+# Schools whose detail payloads warm_caches precomputes, most reviewed first,
+# and the threads it builds them on
+WARM_CACHE_TOP_SCHOOLS = int(os.getenv("WARM_CACHE_TOP_SCHOOLS", "25"))
+WARM_CACHE_WORKERS = int(os.getenv("WARM_CACHE_WORKERS", "4"))
+
+# Password attempts (login, signup, password change and reset) allowed per
+# client IP and per account, as "N/period": N in each fixed window of that
+# period. Over the limit gets a 429 before any hashing
+AUTH_THROTTLE_IP_RATE = os.getenv("AUTH_THROTTLE_IP_RATE", "30/min")
+AUTH_THROTTLE_ACCOUNT_RATE = os.getenv("AUTH_THROTTLE_ACCOUNT_RATE", "10/min")
+
+# Who gets the Server-Timing header with each response's timings and query
+# count: "admin" (admin accounts only), "all" or "off"
+SERVER_TIMING = os.getenv("SERVER_TIMING", "admin")
+
+# Serve per-process request metrics in Prometheus text format at /metrics
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "false").lower() == "true"
+
+# Request profiling (config/profiling.py), off unless one of the first two is
+# set: profile this fraction of requests under PROFILING_PATHS (comma-separated
+# path prefixes, all paths when empty), and any request sent with an
+# "X-Profile: <PROFILING_TOKEN>" header. PROFILING_MODE is "sample" (stack
+# samples every PROFILING_INTERVAL seconds, written as collapsed stacks) or
+# "cprofile". Sampling stops once PROFILING_DIR holds PROFILING_MAX_PROFILES
+PROFILING_SAMPLE_RATE = float(os.getenv("PROFILING_SAMPLE_RATE", "0"))
+PROFILING_TOKEN = os.getenv("PROFILING_TOKEN", "")
+PROFILING_PATHS = [
+    path for path in os.getenv("PROFILING_PATHS", "").split(",") if path.strip()
+]
+PROFILING_MODE = os.getenv("PROFILING_MODE", "sample")
+PROFILING_INTERVAL = float(os.getenv("PROFILING_INTERVAL", "0.005"))
+PROFILING_DIR = os.getenv("PROFILING_DIR", str(BASE_DIR / "profiles"))
+PROFILING_MAX_PROFILES = int(os.getenv("PROFILING_MAX_PROFILES", "1000"))
+
+# Response compression (config/compression.py): bodies smaller than this many
+# bytes are sent uncompressed. Brotli quality 4 and gzip level 6 compress
+# dynamic JSON well without costing much CPU per request. Gzip output gets up
+# to this many random bytes of padding against BREACH, as in Django's
+# GZipMiddleware
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "4"))
+COMPRESSION_GZIP_MAX_RANDOM_BYTES = int(
+    os.getenv("COMPRESSION_GZIP_MAX_RANDOM_BYTES", "100")
+)
+
+# Logs are written by a background thread (config/logs.py). Each logger may
+# emit LOG_RATE_LIMIT records a second after a burst of LOG_RATE_BURST, and
+# only LOG_REQUEST_SAMPLE_RATE of the per-request timing lines are kept;
+# warnings always get through
+LOG_RATE_LIMIT = float(os.getenv("LOG_RATE_LIMIT", "50"))
+LOG_RATE_BURST = int(os.getenv("LOG_RATE_BURST", "100"))
+LOG_REQUEST_SAMPLE_RATE = float(os.getenv("LOG_REQUEST_SAMPLE_RATE", "1"))
 
 LOGGING = {
     "version": 1,
@@ -190,10 +354,22 @@ LOGGING = {
             "style": "{",
         },
     },
+    "filters": {
+        "sampling": {
+            "()": "config.logs.SamplingFilter",
+            "rates": {"config.instrumentation": LOG_REQUEST_SAMPLE_RATE},
+        },
+        "rate_limit": {
+            "()": "config.logs.RateLimitFilter",
+            "rate": LOG_RATE_LIMIT,
+            "burst": LOG_RATE_BURST,
+        },
+    },
     "handlers": {
         "console": {
-            "class": "logging.StreamHandler",
+            "()": "config.logs.QueueHandler",
             "formatter": "verbose",
+            "filters": ["sampling", "rate_limit"],
         },
     },
     "root": {
@@ -0,0 +1,176 @@
+import gzip
+import pytest
+from asgiref.sync import async_to_sync
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory
+from rest_framework.test import APIClient
+from config import compression
+from config.compression import (
+    CompressionMiddleware,
+    choose_encoding,
+    compression_exempt,
+)
+from schools.models import Schools
+
+BODY = b'{"school_name": "Compression University", "conference": "Big"}' * 50
+
+
+def respond(response, accept="gzip"):
+    request = RequestFactory().get("/", HTTP_ACCEPT_ENCODING=accept)
+    return CompressionMiddleware(lambda request: response)(request)
+
+
+class TestChooseEncoding:
+    @pytest.fixture(autouse=True)
+    def with_brotli(self, monkeypatch):
+        # Negotiation only looks at the names, so brotli needn't be installed
+        monkeypatch.setattr(
+            compression, "ENCODERS", {"br": object, "gzip": compression._Gzip}
+        )
+
+    @pytest.mark.parametrize(
+        "header, expected",
+        [
+            ("gzip, deflate", "gzip"),
+            ("gzip, deflate, br", "br"),
+            ("br;q=0.5, gzip", "gzip"),
+            ("BR;Q=1.0, gzip;q=0.8", "br"),
+            ("br;q=0, gzip;q=0", None),
+            ("*", "br"),
+            ("*;q=0.1, gzip;q=0", "br"),
+            ("identity", None),
+            ("", None),
+        ],
+    )
+    def test_prefers_highest_quality_then_brotli(self, header, expected):
+        assert choose_encoding(header) == expected
+
+
+class TestCompressionMiddleware:
+    def test_compresses_large_responses(self):
+        response = respond(HttpResponse(BODY, content_type="application/json"))
+
+        assert response["Content-Encoding"] == "gzip"
+        assert response["Vary"] == "Accept-Encoding"
+        assert int(response["Content-Length"]) == len(response.content)
+        assert gzip.decompress(response.content) == BODY
+
+    def test_leaves_identity_requests_alone(self):
+        response = respond(HttpResponse(BODY), accept="identity")
+
+        assert not response.has_header("Content-Encoding")
+        assert response["Vary"] == "Accept-Encoding"
+        assert response.content == BODY
+
+    def test_skips_responses_under_threshold(self, settings):
+        settings.COMPRESSION_MIN_SIZE = len(BODY) + 1
+
+        response = respond(HttpResponse(BODY))
+
+        assert not response.has_header("Content-Encoding")
+        assert not response.has_header("Vary")
+
+    def test_skips_already_encoded_responses(self):
+        original = HttpResponse(BODY)
+        original["Content-Encoding"] = "identity"
+
+        assert respond(original).content == BODY
+
+    def test_weakens_strong_etags(self):
+        original = HttpResponse(BODY)
+        original["ETag"] = '"abc"'
+
+        assert respond(original)["ETag"] == 'W/"abc"'
+
+    def test_compresses_streams(self):
+        response = respond(StreamingHttpResponse(iter([BODY[:100], BODY[100:]])))
+
+        assert response["Content-Encoding"] == "gzip"
+        assert gzip.decompress(b"".join(response.streaming_content)) == BODY
+
+    def test_compresses_async_streams(self):
+        async def chunks():
+            yield BODY[:100]
+            yield BODY[100:]
+
+        response = respond(StreamingHttpResponse(chunks()))
+
+        async def collect():
+            return b"".join([chunk async for chunk in response.streaming_content])
+
+        assert gzip.decompress(async_to_sync(collect)()) == BODY
+
+    def test_gzip_is_padded_with_random_bytes(self):
+        sizes = set()
+        for _ in range(20):
+            response = respond(HttpResponse(BODY))
+            assert gzip.decompress(response.content) == BODY
+            sizes.add(len(response.content))
+
+        assert len(sizes) > 1
+
+    def test_gzip_padding_can_be_turned_off(self, settings):
+        settings.COMPRESSION_GZIP_MAX_RANDOM_BYTES = 0
+
+        sizes = {len(respond(HttpResponse(BODY)).content) for _ in range(5)}
+
+        assert len(sizes) == 1
+
+    def test_skips_exempt_views(self):
+        view = compression_exempt(lambda request: HttpResponse(BODY))
+        request = RequestFactory().get("/", HTTP_ACCEPT_ENCODING="gzip, br")
+
+        response = CompressionMiddleware(view)(request)
+
+        assert not response.has_header("Content-Encoding")
+        assert response.content == BODY
+
+    @pytest.mark.django_db
+    def test_login_tokens_are_not_compressed(self, django_user_model, settings):
+        settings.COMPRESSION_MIN_SIZE = 0
+        django_user_model.objects.create_user(
+            email="breach@example.com",
+            first_name="Breach",
+            last_name="Test",
+            password="Password123",
+        )
+
+        response = APIClient().post(
+            "/users/login/",
+            {"email": "breach@example.com", "password": "Password123"},
+            format="json",
+            HTTP_ACCEPT_ENCODING="gzip, br",
+        )
+
+        assert response.status_code == 200
+        assert not response.has_header("Content-Encoding")
+        assert "access" in response.json()
+
+    def test_brotli(self):
+        brotli = pytest.importorskip("brotli")
+
+        response = respond(HttpResponse(BODY), accept="gzip, br")
+
+        assert response["Content-Encoding"] == "br"
+        assert brotli.decompress(response.content) == BODY
+
+    @pytest.mark.django_db
+    def test_school_list_is_compressed_end_to_end(self, settings):
+        settings.SERVER_TIMING = "all"
+        Schools.objects.create(
+            school_name="Compression University",
+            mbb=True,
+            wbb=True,
+            fb=True,
+            conference="Test Conference",
+            location="Test Location",
+        )
+        client = APIClient()
+        plain = client.get("/api/public/schools/")
+
+        compressed = client.get("/api/public/schools/", HTTP_ACCEPT_ENCODING="gzip")
+
+        assert compressed["Content-Encoding"] == "gzip"
+        assert "compress;dur=" in compressed["Server-Timing"]
+        assert gzip.decompress(compressed.content) == plain.content
+        assert len(compressed.content) < len(plain.content) / 4
@@ -0,0 +1,67 @@
+import subprocess
+import sys
+
+from django.core.management import call_command
+
+from config.importtime import BACKEND_DIR, BOOT, by_package, measure, parse, total_us
+
+REPORT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        420 | io
+import time:        50 |         50 |     openai._types
+import time:       200 |        250 |   openai._client
+import time:      1000 |       1250 | openai
+Traceback-looking noise that isn't part of the report
+"""
+
+
+class TestImportTime:
+    def test_parse(self):
+        imports = parse(REPORT)
+
+        assert [(entry.module, entry.depth) for entry in imports] == [
+            ("_io", 1),
+            ("io", 0),
+            ("openai._types", 2),
+            ("openai._client", 1),
+            ("openai", 0),
+        ]
+        assert imports[-1].self_us == 1000
+        assert imports[-1].cumulative_us == 1250
+
+    def test_totals(self):
+        imports = parse(REPORT)
+
+        assert total_us(imports) == 1670
+        assert by_package(imports) == [
+            ("openai", 1250, 3),
+            ("io", 300, 1),
+            ("_io", 120, 1),
+        ]
+
+    def test_worker_boot_does_not_import_openai(self):
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                f"{BOOT}; import sys; assert 'openai' not in sys.modules",
+            ],
+            cwd=BACKEND_DIR,
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0, result.stderr
+
+    def test_measure_imports_in_a_fresh_process(self):
+        imports = measure(["xml.dom.minidom"])
+
+        assert "xml.dom.minidom" in [entry.module for entry in imports]
+
+    def test_command(self, capsys):
+        call_command("importtime_report", "xml.dom.minidom", "--limit", "50")
+
+        out = capsys.readouterr().out
+        assert "modules imported in" in out
+        assert "xml.dom.minidom" in out
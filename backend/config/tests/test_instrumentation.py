@@ -0,0 +1,164 @@
+import json
+import logging
+import re
+import time
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from config.instrumentation import Timings, _current, metrics, timed
+from reviews.models import Reviews
+from schools.models import Schools
+
+
+def server_timing(response):
+    """Parse a Server-Timing header into {name: (ms, desc)}."""
+    entries = {}
+    for entry in response["Server-Timing"].split(", "):
+        name, *params = entry.split(";")
+        params = dict(param.split("=", 1) for param in params)
+        entries[name] = (float(params["dur"]), params.get("desc", "").strip('"'))
+    return entries
+
+
+@pytest.fixture
+def school(django_user_model):
+    school = Schools.objects.create(
+        school_name="Timing University",
+        mbb=True,
+        wbb=False,
+        fb=True,
+        conference="Test Conference",
+        location="Test Location",
+    )
+    user = django_user_model.objects.create(email="timing@example.com")
+    Reviews.objects.create(
+        school=school,
+        user=user,
+        sport="fb",
+        head_coach_name="Pat Coach",
+        review_message="Great coaching staff.",
+        head_coach=8,
+        assistant_coaches=8,
+        team_culture=8,
+        campus_life=8,
+        athletic_facilities=8,
+        athletic_department=8,
+        player_development=8,
+        nil_opportunity=8,
+    )
+    return school
+
+
+@pytest.mark.django_db
+class TestRequestTiming:
+    @pytest.fixture(autouse=True)
+    def public_server_timing(self, settings):
+        settings.SERVER_TIMING = "all"
+
+    def test_server_timing_reports_queries(self, school):
+        with CaptureQueriesContext(connection) as queries:
+            response = APIClient().get(f"/api/public/schools/{school.id}/")
+
+        timing = server_timing(response)
+        assert response.status_code == 200
+        assert timing["total"][0] > 0
+        assert timing["db"][1] == f"{len(queries)} queries"
+        assert "serialize" in timing
+
+    def test_server_timing_only_for_admins(self, school, settings):
+        settings.SERVER_TIMING = "admin"
+        client = APIClient()
+        user = Reviews.objects.get(school=school).user
+
+        assert "Server-Timing" not in client.get(f"/api/public/schools/{school.id}/")
+
+        client.force_authenticate(user=user)
+        assert "Server-Timing" not in client.get(f"/api/public/schools/{school.id}/")
+
+        user.role = "admin"
+        client.force_authenticate(user=user)
+        assert "db" in server_timing(client.get(f"/api/public/schools/{school.id}/"))
+
+    def test_server_timing_off(self, school, settings):
+        settings.SERVER_TIMING = "off"
+
+        response = APIClient().get(f"/api/public/schools/{school.id}/")
+
+        assert response.status_code == 200
+        assert "Server-Timing" not in response
+
+    def test_llm_time_is_reported(self, llm_stub, school):
+        llm_stub.delay(0.2)
+
+        response = APIClient().get(
+            f"/api/public/schools/{school.id}/reviews/summary/?sport=fb"
+        )
+
+        assert server_timing(response)["llm"][0] >= 200
+
+    def test_request_is_logged_as_json(self, school, caplog):
+        with caplog.at_level(logging.INFO, logger="config.instrumentation"):
+            APIClient().get(f"/api/public/schools/{school.id}/")
+
+        line = json.loads(caplog.records[-1].getMessage())
+        assert line["route"] == "api/public/schools/<int:pk>/"
+        assert line["status"] == 200
+        assert line["queries"] > 0
+        assert line["total_ms"] >= line["db_ms"]
+
+    def test_metrics_disabled_by_default(self):
+        assert APIClient().get("/metrics").status_code == 404
+
+    def test_metrics_count_requests(self, school, settings):
+        settings.METRICS_ENABLED = True
+        metrics.requests.clear()
+        APIClient().get(f"/api/public/schools/{school.id}/")
+
+        body = APIClient().get("/metrics").content.decode()
+
+        labels = 'method="GET",route="api/public/schools/<int:pk>/",status="200"'
+        assert f"http_requests_total{{{labels}}} 1" in body
+        assert re.search(
+            rf"http_request_db_queries_total{{{re.escape(labels)}}} [1-9]", body
+        )
+
+    def test_metrics_families_are_contiguous(self, school, settings):
+        settings.METRICS_ENABLED = True
+        metrics.requests.clear()
+        client = APIClient()
+        client.get(f"/api/public/schools/{school.id}/")
+        client.get("/api/public/schools/")
+
+        lines = client.get("/metrics").content.decode().splitlines()
+
+        families = [line.split()[2] for line in lines if line.startswith("# TYPE")]
+        # Every sample follows its own family's TYPE line, and no family's
+        # samples are split by another family
+        seen, current = [], None
+        for line in lines:
+            if line.startswith("# TYPE"):
+                current = line.split()[2]
+                seen.append(current)
+                continue
+            name = line.split("{")[0]
+            assert name == current or name.rsplit("_", 1)[0] == current
+        assert seen == families and len(set(families)) == len(families) == 4
+
+
+class TestTimed:
+    def test_outside_a_request_is_a_no_op(self):
+        with timed("llm"):
+            pass
+
+    def test_nested_blocks_count_once(self):
+        timings = Timings()
+        token = _current.set(timings)
+        try:
+            with timed("serialize"):
+                with timed("serialize"):
+                    time.sleep(0.01)
+        finally:
+            _current.reset(token)
+
+        assert 0.01 <= timings.durations["serialize"] < 0.02
@@ -0,0 +1,98 @@
+import io
+import logging
+import pytest
+from config import logs
+from config.logs import QueueHandler, RateLimitFilter, SamplingFilter
+
+
+def record(name="reviews.views", level=logging.INFO, msg="hello %s", args=("world",)):
+    return logging.LogRecord(name, level, __file__, 1, msg, args, None)
+
+
+class TestQueueHandler:
+    @pytest.fixture
+    def stream(self):
+        return io.StringIO()
+
+    @pytest.fixture
+    def handler(self, stream):
+        handler = QueueHandler(stream=stream, queue_size=2)
+        handler.setFormatter(
+            logging.Formatter("{levelname} {name} {message}", style="{")
+        )
+        yield handler
+        handler.stop()
+
+    def test_writes_formatted_records_in_background(self, handler, stream):
+        handler.handle(record())
+        handler.handle(record(level=logging.WARNING, msg="careful", args=()))
+        handler.stop()
+
+        assert stream.getvalue() == (
+            "INFO reviews.views hello world\nWARNING reviews.views careful\n"
+        )
+
+    def test_drops_records_when_queue_is_full(self, handler, stream):
+        handler.stop()
+        for _ in range(5):
+            handler.handle(record())
+
+        assert handler.dropped == 3
+        assert stream.getvalue() == ""
+
+    def test_console_handler_is_queued(self):
+        handlers = logging.getLogger("reviews").handlers
+
+        assert any(isinstance(handler, QueueHandler) for handler in handlers)
+
+
+class TestSamplingFilter:
+    def test_samples_matching_loggers_only(self, monkeypatch):
+        monkeypatch.setattr(logs.random, "random", lambda: 0.5)
+        sampler = SamplingFilter({"config": 0.25, "config.instrumentation": 0.75})
+
+        assert sampler.filter(record("config.instrumentation"))
+        assert not sampler.filter(record("config.renderers"))
+        assert sampler.filter(record("configuration"))
+        assert sampler.filter(record("reviews.views"))
+
+    def test_warnings_are_never_sampled_out(self):
+        sampler = SamplingFilter({"reviews": 0})
+
+        assert not sampler.filter(record())
+        assert sampler.filter(record(level=logging.WARNING))
+
+
+class TestRateLimitFilter:
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr(logs.time, "monotonic", lambda: now[0])
+        return now
+
+    def test_limits_each_logger_separately(self, clock):
+        limiter = RateLimitFilter(rate=1, burst=2)
+
+        passed = [limiter.filter(record()) for _ in range(3)]
+
+        assert passed == [True, True, False]
+        assert limiter.filter(record("schools.views"))
+        assert limiter.suppressed == 1
+
+    def test_refills_over_time(self, clock):
+        limiter = RateLimitFilter(rate=2, burst=1)
+        limiter.filter(record())
+        assert not limiter.filter(record())
+
+        clock[0] += 0.5
+
+        assert limiter.filter(record())
+        assert not limiter.filter(record())
+
+    @pytest.mark.parametrize("level", [logging.WARNING, logging.ERROR])
+    def test_warnings_and_errors_always_pass(self, clock, level):
+        limiter = RateLimitFilter(rate=1, burst=1)
+        limiter.filter(record())
+
+        assert all(limiter.filter(record(level=level)) for _ in range(5))
+        assert limiter.suppressed == 0
@@ -0,0 +1,141 @@
+import asyncio
+import json
+import pstats
+import sys
+import time
+
+import pytest
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpResponse
+from django.test import RequestFactory
+from rest_framework.test import APIClient
+
+from config.profiling import ProfilingMiddleware, collapse
+
+
+def slow_view(request):
+    deadline = time.perf_counter() + 0.05
+    while time.perf_counter() < deadline:
+        pass
+    return HttpResponse("ok")
+
+
+def profiles(directory):
+    return sorted(path.name for path in directory.iterdir())
+
+
+@pytest.fixture
+def profiling(settings, tmp_path):
+    settings.PROFILING_DIR = str(tmp_path)
+    settings.PROFILING_TOKEN = "s3cret"
+    settings.PROFILING_INTERVAL = 0.001
+    return settings
+
+
+class TestProfilingMiddleware:
+    def test_off_by_default(self, settings):
+        settings.PROFILING_SAMPLE_RATE = 0
+        settings.PROFILING_TOKEN = ""
+
+        with pytest.raises(MiddlewareNotUsed):
+            ProfilingMiddleware(slow_view)
+
+    def test_header_writes_collapsed_stacks_and_metadata(self, profiling, tmp_path):
+        middleware = ProfilingMiddleware(slow_view)
+        request = RequestFactory().get("/slow/?q=private", HTTP_X_PROFILE="s3cret")
+
+        response = middleware(request)
+
+        profile_id = response["X-Profile-Id"]
+        assert profiles(tmp_path) == [f"{profile_id}.collapsed", f"{profile_id}.json"]
+        metadata = json.loads((tmp_path / f"{profile_id}.json").read_text())
+        assert metadata["trigger"] == "header"
+        assert metadata["path"] == "/slow/"
+        assert metadata["query_params"] == ["q"]
+        assert metadata["status"] == 200
+        assert metadata["samples"] > 0
+        stacks = (tmp_path / f"{profile_id}.collapsed").read_text().splitlines()
+        assert any("slow_view (" in line for line in stacks)
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in stacks)
+
+    def test_wrong_or_missing_token_is_not_profiled(self, profiling, tmp_path):
+        profiling.PROFILING_SAMPLE_RATE = 0
+        middleware = ProfilingMiddleware(slow_view)
+
+        for headers in ({"HTTP_X_PROFILE": "guess"}, {}):
+            response = middleware(RequestFactory().get("/slow/", **headers))
+            assert "X-Profile-Id" not in response
+
+        assert profiles(tmp_path) == []
+
+    def test_cprofile_mode(self, profiling, tmp_path):
+        profiling.PROFILING_MODE = "cprofile"
+        middleware = ProfilingMiddleware(slow_view)
+
+        response = middleware(RequestFactory().get("/", HTTP_X_PROFILE="s3cret"))
+
+        path = tmp_path / f"{response['X-Profile-Id']}.prof"
+        functions = {name for _, _, name in pstats.Stats(str(path)).stats}
+        assert "slow_view" in functions
+
+    def test_sampling_is_limited_to_paths(self, profiling, tmp_path):
+        profiling.PROFILING_TOKEN = ""
+        profiling.PROFILING_SAMPLE_RATE = 1
+        profiling.PROFILING_PATHS = ["/api/filter/"]
+        middleware = ProfilingMiddleware(slow_view)
+
+        middleware(RequestFactory().get("/api/schools/"))
+        response = middleware(RequestFactory().get("/api/filter/"))
+
+        assert (
+            json.loads((tmp_path / f"{response['X-Profile-Id']}.json").read_text())[
+                "trigger"
+            ]
+            == "sample"
+        )
+        assert len(profiles(tmp_path)) == 2
+
+    def test_sampling_stops_when_directory_is_full(self, profiling, tmp_path):
+        profiling.PROFILING_SAMPLE_RATE = 1
+        profiling.PROFILING_MAX_PROFILES = 2
+        middleware = ProfilingMiddleware(slow_view)
+
+        for _ in range(4):
+            middleware(RequestFactory().get("/"))
+        # The header still works, for a profile asked for on purpose
+        middleware(RequestFactory().get("/", HTTP_X_PROFILE="s3cret"))
+
+        assert sum(name.endswith(".json") for name in profiles(tmp_path)) == 3
+
+    def test_async_requests(self, profiling, tmp_path):
+        async def view(request):
+            await asyncio.sleep(0.02)
+            return HttpResponse("ok")
+
+        middleware = ProfilingMiddleware(view)
+        request = RequestFactory().get("/", HTTP_X_PROFILE="s3cret")
+
+        response = asyncio.run(middleware(request))
+
+        assert (tmp_path / f"{response['X-Profile-Id']}.collapsed").exists()
+
+    def test_collapse(self):
+        def inner():
+            return collapse(sys._getframe())
+
+        frames = inner().split(";")
+
+        assert frames[-1].startswith("inner (")
+        assert frames[-2].startswith("test_collapse (")
+        assert "test_profiling.py:" in frames[-2]
+
+    @pytest.mark.django_db
+    def test_through_the_stack(self, profiling, tmp_path):
+        response = APIClient().get("/api/api/public/schools/", HTTP_X_PROFILE="s3cret")
+
+        metadata = json.loads(
+            (tmp_path / f"{response['X-Profile-Id']}.json").read_text()
+        )
+        assert metadata["view"] == "get_schools"
+        assert metadata["queries"] >= 1
+        assert "db" in metadata["timings_ms"]
@@ -0,0 +1,78 @@
+import datetime
+import decimal
+import io
+import uuid
+import pytest
+from collections import OrderedDict
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+from config.renderers import ORJSONParser, ORJSONRenderer
+
+PAYLOAD = {
+    "id": 7,
+    "name": "Café Line",
+    "score": 6.9,
+    "ratio": 1 / 3,
+    "flags": [True, False, None],
+    "created_at": datetime.datetime(
+        2025, 3, 4, 5, 6, 7, 891011, tzinfo=datetime.timezone.utc
+    ),
+    "day": datetime.date(2025, 3, 4),
+    "price": decimal.Decimal("12.50"),
+    "review_id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+    "label": gettext_lazy("Football"),
+    "nested": OrderedDict([("b", 1), ("a", [{"c": "d"}])]),
+    3: "int key",
+}
+
+
+class TestORJSONRenderer:
+    def test_matches_drf_renderer(self):
+        assert ORJSONRenderer().render(PAYLOAD) == JSONRenderer().render(PAYLOAD)
+
+    def test_none_renders_empty(self):
+        assert ORJSONRenderer().render(None) == b""
+
+    def test_indent_from_accept_header(self):
+        rendered = ORJSONRenderer().render(
+            {"a": [1]}, accepted_media_type="application/json; indent=4"
+        )
+
+        assert rendered == b'{\n  "a": [\n    1\n  ]\n}'
+
+
+class TestORJSONParser:
+    def parse(self, parser, body):
+        return parser.parse(io.BytesIO(body), parser_context={"encoding": "utf-8"})
+
+    def test_matches_drf_parser(self):
+        body = '{"school": 1, "message": "Great \\u00e9 coach", "ratings": [1.5, null]}'
+
+        assert self.parse(ORJSONParser(), body.encode()) == self.parse(
+            JSONParser(), body.encode()
+        )
+
+    def test_invalid_json_raises_parse_error(self):
+        with pytest.raises(ParseError, match="JSON parse error"):
+            self.parse(ORJSONParser(), b'{"school": ')
+
+    def test_other_encodings_use_stdlib(self):
+        body = '{"name": "Ünïcode"}'.encode("utf-16")
+
+        parsed = ORJSONParser().parse(
+            io.BytesIO(body), parser_context={"encoding": "utf-16"}
+        )
+
+        assert parsed == {"name": "Ünïcode"}
+
+    @pytest.mark.django_db
+    def test_api_rejects_malformed_json(self):
+        response = APIClient().post(
+            "/users/login/", b'{"email": ', content_type="application/json"
+        )
+
+        assert response.status_code == 400
+        assert response.json()["detail"].startswith("JSON parse error")
@@ -18,6 +18,8 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path, include
 
+from config.instrumentation import metrics_view
+
 urlpatterns = [
     path("", include("users.urls")),
     path("admin/", admin.site.urls),
@@ -27,4 +29,5 @@ urlpatterns = [
     path("api/report/", include("report.urls")),
     path("api/", include("schools.urls")),
     path("api/preferences/", include("preferences.urls")),
+    path("metrics", metrics_view, name="metrics"),
 ]
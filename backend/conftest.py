@@ -0,0 +1,283 @@
+import json
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from django.core.cache import cache
+
+from reviews import llm
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("performance", "performance suite (performance/)")
+    group.addoption(
+        "--perf",
+        action="store_true",
+        help="Run the performance suite, which is skipped otherwise",
+    )
+    group.addoption(
+        "--perf-sizes",
+        default="small",
+        help="Comma-separated dataset sizes: small, medium, large",
+    )
+    group.addoption(
+        "--perf-update-baseline",
+        action="store_true",
+        help="Record this run's query counts and latencies as the baseline",
+    )
+    group.addoption(
+        "--perf-tolerance",
+        type=float,
+        default=3.0,
+        help="p95 latency over this multiple of the baseline is a regression",
+    )
+    group.addoption(
+        "--perf-strict",
+        action="store_true",
+        help="Fail on latency regressions, not just query count ones",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("perf"):
+        return
+    skip = pytest.mark.skip(reason="performance suite; run with --perf")
+    for item in items:
+        if "perf" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with an empty cache, so no cached user leaks across."""
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_llm_gateway():
+    """Give every test a fresh LLM client and a closed circuit breaker."""
+    llm.reset()
+    yield
+    llm.reset()
+
+
+class StubLLMServer:
+    """
+    Local stand-in for the OpenAI chat completions API.
+
+    Queue responses with ``reply()``, ``fail()``, ``delay()`` and ``drop()``;
+    each request consumes one, and once the queue is empty every request gets
+    ``default_reply``, which may also be a function of the request body.
+    """
+
+    def __init__(self):
+        self.default_reply = "Stub summary"
+        self.requests = []
+        self._script = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever)
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self._server.server_port}/v1"
+
+    def reply(self, content):
+        self._script.append(("reply", content))
+
+    def fail(self, status=500):
+        self._script.append(("fail", status))
+
+    def delay(self, seconds, content="Slow summary"):
+        self._script.append(("delay", (seconds, content)))
+
+    def drop(self):
+        self._script.append(("drop", None))
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _next(self, body):
+        with self._lock:
+            self.requests.append(body)
+            if self._script:
+                return self._script.pop(0)
+        if callable(self.default_reply):
+            return ("reply", self.default_reply(body))
+        return ("reply", self.default_reply)
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                action, value = stub._next(json.loads(self.rfile.read(length)))
+                if action == "drop":
+                    self.close_connection = True
+                    self.connection.close()
+                    return
+                if action == "fail":
+                    self._send(value, {"error": {"message": "stub failure"}})
+                    return
+                if action == "delay":
+                    seconds, value = value
+                    time.sleep(seconds)
+                self._send(200, self._completion(value))
+
+            def _completion(self, content):
+                return {
+                    "id": "chatcmpl-stub",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": "stub",
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {"role": "assistant", "content": content},
+                            "finish_reason": "stop",
+                        }
+                    ],
+                }
+
+            def _send(self, status, payload):
+                body = json.dumps(payload).encode()
+                try:
+                    self.send_response(status)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    # The client gave up waiting (timeout tests)
+                    pass
+
+        return Handler
+
+
+@pytest.fixture
+def llm_stub(settings):
+    """Point the LLM gateway at a local stub server with fast retries."""
+    stub = StubLLMServer()
+    stub.start()
+    settings.OPENAI_BASE_URL = stub.base_url
+    settings.OPENAI_API_KEY = "sk-test"
+    settings.LLM_RETRY_BACKOFF = 0.01
+    llm.reset()
+    yield stub
+    llm.reset()
+    stub.stop()
+
+
+class StubSMTPServer:
+    """
+    Minimal local SMTP server for the outbox worker.
+
+    Accepted messages land in ``messages`` as ``(sender, recipients, data)``;
+    ``connections`` counts SMTP sessions. ``reject(code)`` refuses the next
+    message's recipients with that reply code, ``disconnect()`` drops the
+    connection on the next message.
+    """
+
+    def __init__(self):
+        self.messages = []
+        self.connections = 0
+        self._script = []
+        self._lock = threading.Lock()
+        self._server = socketserver.ThreadingTCPServer(
+            ("127.0.0.1", 0), self._handler()
+        )
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever)
+
+    @property
+    def port(self):
+        return self._server.server_address[1]
+
+    def reject(self, code=550):
+        self._script.append(("reject", code))
+
+    def disconnect(self):
+        self._script.append(("disconnect", None))
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _next(self):
+        with self._lock:
+            return self._script.pop(0) if self._script else (None, None)
+
+    def _handler(self):
+        stub = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def reply(self, line):
+                self.wfile.write(f"{line}\r\n".encode())
+
+            def handle(self):
+                with stub._lock:
+                    stub.connections += 1
+                self.reply("220 stub ESMTP")
+                sender, recipients, action = None, [], (None, None)
+                while line := self.rfile.readline():
+                    command = line.decode().strip()
+                    verb = command[:4].upper()
+                    if verb in ("EHLO", "HELO"):
+                        self.reply("250 stub")
+                    elif verb == "MAIL":
+                        action = stub._next()
+                        if action[0] == "disconnect":
+                            return
+                        sender, recipients = command[10:].strip("<>"), []
+                        self.reply("250 OK")
+                    elif verb == "RCPT":
+                        if action[0] == "reject":
+                            self.reply(f"{action[1]} Recipient refused")
+                            continue
+                        recipients.append(command[8:].strip("<>"))
+                        self.reply("250 OK")
+                    elif verb == "DATA":
+                        self.reply("354 End data with <CR><LF>.<CR><LF>")
+                        data = []
+                        while (line := self.rfile.readline()) not in (b".\r\n", b""):
+                            data.append(line.decode())
+                        with stub._lock:
+                            stub.messages.append((sender, recipients, "".join(data)))
+                        self.reply("250 OK")
+                    elif verb == "QUIT":
+                        self.reply("221 Bye")
+                        return
+                    else:
+                        # RSET, NOOP
+                        self.reply("250 OK")
+
+        return Handler
+
+
+@pytest.fixture
+def smtp_stub(settings):
+    """Send real SMTP to a local stub server."""
+    stub = StubSMTPServer()
+    stub.start()
+    settings.EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
+    settings.EMAIL_HOST = "127.0.0.1"
+    settings.EMAIL_PORT = stub.port
+    settings.EMAIL_USE_TLS = False
+    settings.EMAIL_HOST_USER = ""
+    settings.EMAIL_HOST_PASSWORD = ""
+    yield stub
+    stub.stop()
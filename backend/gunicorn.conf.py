@@ -0,0 +1,69 @@
+"""
+Gunicorn serving profile, used by the Dockerfile (``gunicorn -c gunicorn.conf.py``).
+
+Every value can be overridden from the environment. Defaults are derived from
+the CPUs available to the container: sync mode runs threaded workers so a
+request waiting on the database, SMTP or the model doesn't hold a whole
+process, and ASGI mode (``SERVER_MODE=asgi``) runs one uvicorn worker per
+core's worth of processes with the event loop doing the waiting.
+"""
+
+import os
+
+
+def _cpus():
+    try:
+        # Respects the container's CPU set, unlike os.cpu_count()
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _flag(name, default):
+    return os.getenv(name, default).lower() in ("1", "true", "yes")
+
+
+ASGI = os.getenv("SERVER_MODE", "wsgi").lower() == "asgi"
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+wsgi_app = "config.asgi:application" if ASGI else "config.wsgi:application"
+
+workers = int(os.getenv("GUNICORN_WORKERS", 2 * _cpus() + 1))
+if ASGI:
+    worker_class = "uvicorn_worker.UvicornWorker"
+    threads = 1
+else:
+    threads = int(os.getenv("GUNICORN_THREADS", "4"))
+    worker_class = "gthread" if threads > 1 else "sync"
+
+# Summary requests may wait on the summary lock and the model's deadline
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+# Longer than the proxy's idle timeout in front, so it closes connections first
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "75"))
+
+# Recycle workers now and then to bound slow memory growth
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "2000"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "200"))
+
+# Import Django once in the master so workers fork with it already loaded
+preload_app = _flag("GUNICORN_PRELOAD", "true")
+
+accesslog = os.getenv("GUNICORN_ACCESS_LOG", "-")
+errorlog = "-"
+
+
+def post_fork(server, worker):
+    # Never share a database socket opened during preload between processes
+    from django.db import connections
+
+    connections.close_all()
+
+
+def when_ready(server):
+    # With the app preloaded, build per-process caches once in the master so
+    # every worker forks with them already filled
+    if preload_app:
+        from reviews.services import preload_tenure_indexes
+
+        preload_tenure_indexes()
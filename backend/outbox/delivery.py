@@ -0,0 +1,202 @@
+"""
+Out-of-band email delivery.
+
+Views call ``enqueue_email`` and return straight away; the worker
+(``manage.py send_outbox``) sends pending messages in batches over one SMTP
+connection. Temporary failures are retried with exponential backoff, and a
+message that fails permanently or runs out of attempts is dead-lettered
+(left in the table with status ``dead`` and its last error). Messages that
+were never tried because the SMTP server couldn't be reached wait
+``settings.OUTBOX_RETRY_BACKOFF`` seconds without using up an attempt, so an
+outage doesn't dead-letter the queue.
+
+A worker claims its batch in a short transaction, marking the rows
+``sending`` with a lease of ``settings.OUTBOX_LEASE`` seconds, and sends
+outside of it, so no row lock or transaction is held across SMTP calls. Each
+message is then marked sent or failed on its own. If the worker dies, the
+lease runs out and another worker picks the rows up again; a message sent just
+before the crash can therefore go out twice.
+"""
+
+import logging
+import smtplib
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.utils import timezone
+
+from config.instrumentation import timed
+
+from .models import OutboxEmail
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_email(subject, message, from_email, recipient_list):
+    """Queue an email with ``send_mail``'s arguments for the outbox worker."""
+    return OutboxEmail.objects.create(
+        subject=subject,
+        body=message,
+        from_email=from_email or "",
+        recipients=list(recipient_list),
+    )
+
+
+@dataclass
+class DeliveryResult:
+    sent: int = 0
+    retried: int = 0
+    dead: int = 0
+
+
+def _is_permanent(error):
+    """SMTP 5xx replies won't succeed on retry; everything else might."""
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return all(code >= 500 for code, _ in error.recipients.values())
+    if isinstance(error, smtplib.SMTPResponseException):
+        return error.smtp_code >= 500
+    return False
+
+
+def _retry_delay(attempts):
+    return timedelta(seconds=settings.OUTBOX_RETRY_BACKOFF * 2 ** (attempts - 1))
+
+
+def _claim(batch_size):
+    """Lease up to ``batch_size`` due emails to this worker and return them."""
+    now = timezone.now()
+    leased_until = now + timedelta(seconds=settings.OUTBOX_LEASE)
+    with transaction.atomic():
+        # SKIP LOCKED lets several workers claim at once without overlapping.
+        # A sending row whose lease has run out belongs to a worker that died.
+        batch = list(
+            OutboxEmail.objects.select_for_update(skip_locked=True)
+            .filter(
+                status__in=[OutboxEmail.PENDING, OutboxEmail.SENDING],
+                next_attempt_at__lte=now,
+            )
+            .order_by("next_attempt_at", "id")[:batch_size]
+        )
+        OutboxEmail.objects.filter(pk__in=[email.pk for email in batch]).update(
+            status=OutboxEmail.SENDING, next_attempt_at=leased_until
+        )
+    for email in batch:
+        email.status = OutboxEmail.SENDING
+        email.next_attempt_at = email.leased_until = leased_until
+    return batch
+
+
+def _fail(email, error, result):
+    email.attempts += 1
+    email.last_error = str(error)[:1000]
+    if _is_permanent(error) or email.attempts >= settings.OUTBOX_MAX_ATTEMPTS:
+        email.status = OutboxEmail.DEAD
+        result.dead += 1
+        logger.error(
+            f"Dead-lettering email {email.id} after {email.attempts} attempts: {error}"
+        )
+    else:
+        email.status = OutboxEmail.PENDING
+        email.next_attempt_at = timezone.now() + _retry_delay(email.attempts)
+        result.retried += 1
+        logger.warning(f"Email {email.id} failed, retrying later: {error}")
+    _release(
+        email,
+        attempts=email.attempts,
+        last_error=email.last_error,
+        status=email.status,
+        next_attempt_at=email.next_attempt_at,
+    )
+
+
+def _postpone(emails, error, result):
+    """Put back emails that were never tried, keeping their attempts."""
+    if not emails:
+        return
+    logger.warning(
+        f"Couldn't reach the SMTP server, {len(emails)} emails wait: {error}"
+    )
+    # A batch shares one lease, so one update releases it
+    OutboxEmail.objects.filter(
+        pk__in=[email.pk for email in emails],
+        status=OutboxEmail.SENDING,
+        next_attempt_at=emails[0].leased_until,
+    ).update(
+        status=OutboxEmail.PENDING,
+        last_error=str(error)[:1000],
+        next_attempt_at=timezone.now()
+        + timedelta(seconds=settings.OUTBOX_RETRY_BACKOFF),
+    )
+    result.retried += len(emails)
+
+
+def _release(email, **fields):
+    # Only while the lease is still ours; once it has run out another worker
+    # may have claimed the row again
+    OutboxEmail.objects.filter(
+        pk=email.pk, status=OutboxEmail.SENDING, next_attempt_at=email.leased_until
+    ).update(**fields)
+
+
+def _message(email, connection):
+    return EmailMessage(
+        subject=email.subject,
+        body=email.body,
+        from_email=email.from_email or None,
+        to=email.recipients,
+        connection=connection,
+    )
+
+
+def send_pending(batch_size=None):
+    """
+    Send one batch of due emails over a single SMTP connection.
+
+    The batch is claimed first (see the module docs), so several workers can
+    run at once without sending the same message twice.
+    """
+    batch_size = batch_size or settings.OUTBOX_BATCH_SIZE
+    result = DeliveryResult()
+    batch = _claim(batch_size)
+    if not batch:
+        return result
+
+    connection = get_connection(fail_silently=False)
+    try:
+        connection.open()
+    except Exception as e:
+        # Nothing can go out without a connection; every message waits
+        _postpone(batch, e, result)
+        return result
+
+    try:
+        for index, email in enumerate(batch):
+            if timezone.now() >= email.leased_until:
+                # The rest may belong to another worker by now
+                logger.warning(
+                    f"Outbox lease ran out with {len(batch) - index} emails unsent"
+                )
+                break
+            try:
+                with timed("smtp"):
+                    _message(email, connection).send()
+            except smtplib.SMTPServerDisconnected as e:
+                _fail(email, e, result)
+                # Reconnect so the rest of the batch can still go out
+                try:
+                    connection.close()
+                    connection.open()
+                except Exception as e:
+                    _postpone(batch[index + 1 :], e, result)
+                    break
+            except Exception as e:
+                _fail(email, e, result)
+            else:
+                _release(email, status=OutboxEmail.SENT, sent_at=timezone.now())
+                result.sent += 1
+    finally:
+        connection.close()
+    return result
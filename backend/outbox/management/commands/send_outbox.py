@@ -0,0 +1,55 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from outbox.delivery import DeliveryResult, send_pending
+
+
+class Command(BaseCommand):
+    help = "Send queued emails in batches over one SMTP connection per batch."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=None,
+            help="Emails sent per connection (defaults to OUTBOX_BATCH_SIZE)",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep polling for new emails instead of exiting once drained",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=None,
+            help="Seconds between polls with --loop (defaults to OUTBOX_POLL_INTERVAL)",
+        )
+
+    def handle(self, *args, **options):
+        interval = options["interval"] or settings.OUTBOX_POLL_INTERVAL
+        total = DeliveryResult()
+        while True:
+            result = send_pending(options["batch_size"])
+            total.sent += result.sent
+            total.retried += result.retried
+            total.dead += result.dead
+            if result.sent or result.retried or result.dead:
+                self.stdout.write(
+                    f"Sent {result.sent} emails "
+                    f"({result.retried} to retry, {result.dead} dead-lettered)"
+                )
+                # Keep going until nothing is due
+                continue
+            if not options["loop"]:
+                break
+            time.sleep(interval)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Outbox drained: {total.sent} sent, {total.retried} to retry, "
+                f"{total.dead} dead-lettered"
+            )
+        )
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("outbox", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="outboxemail",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("pending", "Pending"),
+                    ("sending", "Sending"),
+                    ("sent", "Sent"),
+                    ("dead", "Dead"),
+                ],
+                default="pending",
+                max_length=10,
+            ),
+        ),
+    ]
@@ -0,0 +1,38 @@
+from django.db import models
+from django.utils import timezone
+
+
+class OutboxEmail(models.Model):
+    """
+    An email waiting to be sent by the outbox worker
+    (``manage.py send_outbox``) rather than inside the request that wrote it.
+    """
+
+    PENDING = "pending"
+    SENDING = "sending"
+    SENT = "sent"
+    DEAD = "dead"
+    STATUS_CHOICES = [
+        (PENDING, "Pending"),
+        (SENDING, "Sending"),
+        (SENT, "Sent"),
+        (DEAD, "Dead"),
+    ]
+
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    from_email = models.CharField(max_length=255, blank=True)
+    recipients = models.JSONField(default=list)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    # For a sending row, when its worker's lease runs out
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["status", "next_attempt_at"])]
+
+    def __str__(self):
+        return f"{self.subject} to {', '.join(self.recipients)} ({self.status})"
@@ -0,0 +1,194 @@
+import pytest
+from datetime import timedelta
+from io import StringIO
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework.test import APIClient
+from outbox import delivery
+from outbox.delivery import DeliveryResult, enqueue_email, send_pending
+from outbox.models import OutboxEmail
+
+
+def queue(count):
+    return [
+        enqueue_email(
+            f"Subject {i}", f"Body {i}", "noreply@example.com", [f"user{i}@example.com"]
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.django_db
+class TestOutbox:
+    def test_endpoint_only_enqueues(self, smtp_stub, settings):
+        settings.REPORT_RECEIVER_EMAIL = ["admin@example.com"]
+
+        response = APIClient().post(
+            "/api/report/report_issue/",
+            {"email": "test@example.com", "description": "Broken page"},
+            format="json",
+        )
+
+        assert response.status_code == 201
+        email = OutboxEmail.objects.get()
+        assert email.status == OutboxEmail.PENDING
+        assert email.recipients == ["admin@example.com"]
+        assert smtp_stub.connections == 0
+
+    def test_batch_is_sent_over_one_connection(self, smtp_stub):
+        queue(3)
+
+        result = send_pending()
+
+        assert result == DeliveryResult(sent=3)
+        assert smtp_stub.connections == 1
+        assert [recipients for _, recipients, _ in smtp_stub.messages] == [
+            ["user0@example.com"],
+            ["user1@example.com"],
+            ["user2@example.com"],
+        ]
+        assert "Subject: Subject 0" in smtp_stub.messages[0][2]
+        assert not OutboxEmail.objects.exclude(status=OutboxEmail.SENT).exists()
+        assert send_pending() == DeliveryResult()
+
+    def test_batch_size_limits_each_run(self, smtp_stub):
+        queue(3)
+
+        assert send_pending(batch_size=2) == DeliveryResult(sent=2)
+        assert send_pending(batch_size=2) == DeliveryResult(sent=1)
+
+    def test_temporary_failure_is_retried_later(self, smtp_stub, settings):
+        settings.OUTBOX_RETRY_BACKOFF = 60
+        first, second = queue(2)
+        smtp_stub.reject(451)
+
+        result = send_pending()
+
+        assert result == DeliveryResult(sent=1, retried=1)
+        first.refresh_from_db()
+        assert first.status == OutboxEmail.PENDING
+        assert first.attempts == 1
+        assert first.next_attempt_at > timezone.now() + timedelta(seconds=50)
+        assert "451" in first.last_error
+        # Not due yet
+        assert send_pending() == DeliveryResult()
+
+        OutboxEmail.objects.filter(id=first.id).update(next_attempt_at=timezone.now())
+        assert send_pending() == DeliveryResult(sent=1)
+
+    def test_permanent_failure_is_dead_lettered(self, smtp_stub):
+        (email,) = queue(1)
+        smtp_stub.reject(550)
+
+        assert send_pending() == DeliveryResult(dead=1)
+        email.refresh_from_db()
+        assert email.status == OutboxEmail.DEAD
+        assert smtp_stub.messages == []
+
+    def test_dead_lettered_after_max_attempts(self, smtp_stub, settings):
+        settings.OUTBOX_MAX_ATTEMPTS = 2
+        settings.OUTBOX_RETRY_BACKOFF = 0
+        (email,) = queue(1)
+        smtp_stub.reject(451)
+        smtp_stub.reject(451)
+
+        assert send_pending() == DeliveryResult(retried=1)
+        assert send_pending() == DeliveryResult(dead=1)
+        email.refresh_from_db()
+        assert email.status == OutboxEmail.DEAD
+        assert email.attempts == 2
+
+    def test_reconnects_after_disconnect(self, smtp_stub):
+        queue(3)
+        smtp_stub.disconnect()
+
+        result = send_pending()
+
+        assert result == DeliveryResult(sent=2, retried=1)
+        assert smtp_stub.connections == 2
+
+    def test_unreachable_server_retries_whole_batch(self, settings):
+        settings.EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
+        settings.EMAIL_HOST = "127.0.0.1"
+        settings.EMAIL_PORT = 1
+        settings.EMAIL_USE_TLS = False
+        queue(2)
+
+        assert send_pending() == DeliveryResult(retried=2)
+        assert (
+            OutboxEmail.objects.filter(status=OutboxEmail.PENDING, attempts=0).count()
+            == 2
+        )
+
+    def test_outage_does_not_use_up_attempts(self, settings, monkeypatch):
+        settings.OUTBOX_MAX_ATTEMPTS = 2
+        settings.OUTBOX_RETRY_BACKOFF = 0
+        queue(2)
+
+        def refuse(self):
+            raise ConnectionRefusedError("SMTP server down")
+
+        monkeypatch.setattr(
+            "django.core.mail.backends.locmem.EmailBackend.open", refuse, raising=False
+        )
+        for _ in range(5):
+            assert send_pending() == DeliveryResult(retried=2)
+
+        assert not OutboxEmail.objects.filter(status=OutboxEmail.DEAD).exists()
+        assert set(OutboxEmail.objects.values_list("attempts", flat=True)) == {0}
+        assert OutboxEmail.objects.filter(last_error="SMTP server down").count() == 2
+
+    def test_batch_is_claimed_before_sending(self, smtp_stub, monkeypatch):
+        queue(2)
+        statuses = []
+        message = delivery._message
+
+        def recording_message(email, connection):
+            statuses.append(
+                sorted(OutboxEmail.objects.values_list("status", flat=True))
+            )
+            return message(email, connection)
+
+        monkeypatch.setattr(delivery, "_message", recording_message)
+
+        assert send_pending() == DeliveryResult(sent=2)
+        assert statuses == [
+            [OutboxEmail.SENDING, OutboxEmail.SENDING],
+            [OutboxEmail.SENDING, OutboxEmail.SENT],
+        ]
+
+    def test_expired_lease_is_claimed_again(self, smtp_stub):
+        stranded, leased = queue(2)
+        OutboxEmail.objects.filter(id=stranded.id).update(
+            status=OutboxEmail.SENDING,
+            next_attempt_at=timezone.now() - timedelta(seconds=1),
+        )
+        OutboxEmail.objects.filter(id=leased.id).update(
+            status=OutboxEmail.SENDING,
+            next_attempt_at=timezone.now() + timedelta(minutes=5),
+        )
+
+        assert send_pending() == DeliveryResult(sent=1)
+        assert [recipients for _, recipients, _ in smtp_stub.messages] == [
+            ["user0@example.com"]
+        ]
+        leased.refresh_from_db()
+        assert leased.status == OutboxEmail.SENDING
+
+    def test_stops_when_the_lease_runs_out(self, smtp_stub, settings):
+        settings.OUTBOX_LEASE = 0
+        queue(2)
+
+        assert send_pending() == DeliveryResult()
+        assert smtp_stub.messages == []
+        assert OutboxEmail.objects.filter(status=OutboxEmail.SENDING).count() == 2
+
+    def test_send_outbox_command_drains_queue(self, smtp_stub):
+        queue(3)
+        out = StringIO()
+
+        call_command("send_outbox", "--batch-size", "2", stdout=out)
+
+        assert "Outbox drained: 3 sent, 0 to retry, 0 dead-lettered" in out.getvalue()
+        assert len(smtp_stub.messages) == 3
+        assert smtp_stub.connections == 2
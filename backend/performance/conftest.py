@@ -0,0 +1,273 @@
+"""
+Fixtures for the performance suite.
+
+The suite only runs with ``--perf``. Each test runs once per selected dataset
+size (``--perf-sizes``). A size's dataset is seeded once, committed outside the
+per-test transactions so every test sees it, and deleted when the size's tests
+finish.
+
+``perf.check()`` asserts an endpoint's query count against ``baseline.json``
+and records its p50/p95 latency; the results are written to ``results.json``
+at the end of the run. Query counts mustn't grow with the data, so every size
+is held to the smallest size's recorded count, while latency is compared with
+the same size's baseline. ``--perf-update-baseline`` records the run as the
+new baseline instead.
+"""
+
+import json
+import math
+import random
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pytest
+from django.db import connection, reset_queries
+
+from preferences.models import Preferences
+from reviews.models import ReviewVote, Reviews, normalize_coach_name
+from schools.models import Schools
+from users.models import Users
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+RESULTS_PATH = Path(__file__).with_name("results.json")
+
+RATING_FIELDS = [
+    "head_coach",
+    "assistant_coaches",
+    "team_culture",
+    "campus_life",
+    "athletic_facilities",
+    "athletic_department",
+    "player_development",
+    "nil_opportunity",
+]
+SPORTS = ["fb", "mbb", "wbb"]
+
+
+@dataclass(frozen=True)
+class Size:
+    schools: int
+    reviews: int
+    votes: int
+    # Timed requests per endpoint, after one warm-up request
+    iterations: int
+
+
+SIZES = {
+    "small": Size(schools=10, reviews=100, votes=100, iterations=5),
+    "medium": Size(schools=100, reviews=10_000, votes=10_000, iterations=5),
+    "large": Size(schools=1000, reviews=100_000, votes=100_000, iterations=3),
+}
+
+
+@dataclass
+class Dataset:
+    size: str
+    schools: list
+    users: list
+    reviews: list = field(repr=False)
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of ``values`` (which must be sorted)."""
+    rank = max(math.ceil(pct / 100 * len(values)), 1)
+    return values[rank - 1]
+
+
+class QueryCounter:
+    """
+    Execute wrapper counting queries. Unlike ``CaptureQueriesContext`` it isn't
+    limited by the size of the connection's query log.
+    """
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def seed(name):
+    """Seed the named size's schools, users, reviews, votes and preferences."""
+    size = SIZES[name]
+    rng = random.Random(name)
+    schools = Schools.objects.bulk_create(
+        [
+            Schools(
+                school_name=f"Perf School {i}",
+                mbb=True,
+                wbb=True,
+                fb=True,
+                conference=f"Perf Conference {i % 10}",
+                location="Perf Location",
+            )
+            for i in range(size.schools)
+        ]
+    )
+    # Review i goes to school i % schools by user i // schools, so every
+    # (school, user) pair is unique
+    user_count = max(math.ceil(size.reviews / size.schools), 1)
+    users = Users.objects.bulk_create(
+        [
+            Users(email=f"perf-{name}-{i}@example.com", first_name="Perf")
+            for i in range(user_count)
+        ]
+    )
+    reviews = []
+    for i in range(size.reviews):
+        coach_name = f"Perf Coach {i % size.schools}"
+        reviews.append(
+            Reviews(
+                school=schools[i % size.schools],
+                user=users[i // size.schools],
+                sport=SPORTS[(i // size.schools) % len(SPORTS)],
+                head_coach_name=coach_name,
+                head_coach_name_normalized=normalize_coach_name(coach_name),
+                review_message=f"Perf review {i} about the coach and facilities.",
+                **{field: rng.randint(1, 10) for field in RATING_FIELDS},
+            )
+        )
+    reviews = Reviews.objects.bulk_create(reviews, batch_size=5000)
+    ReviewVote.objects.bulk_create(
+        [
+            ReviewVote(
+                review=reviews[v % size.reviews],
+                user=users[(v // size.reviews) % user_count],
+                vote=v % 2,
+            )
+            for v in range(size.votes)
+        ],
+        batch_size=5000,
+    )
+    Preferences.objects.create(
+        user=users[0],
+        sport="fb",
+        **{field: rng.randint(1, 10) for field in RATING_FIELDS},
+    )
+    return Dataset(size=name, schools=schools, users=users, reviews=reviews)
+
+
+def unseed(dataset):
+    users = Users.objects.filter(id__in=[user.id for user in dataset.users])
+    ReviewVote.objects.filter(user__in=users).delete()
+    Reviews.objects.filter(user__in=users).delete()
+    Preferences.objects.filter(user__in=users).delete()
+    users.delete()
+    Schools.objects.filter(id__in=[school.id for school in dataset.schools]).delete()
+
+
+def pytest_generate_tests(metafunc):
+    if "dataset" in metafunc.fixturenames:
+        sizes = metafunc.config.getoption("perf_sizes").split(",")
+        unknown = set(sizes) - set(SIZES)
+        if unknown:
+            raise pytest.UsageError(f"Unknown --perf-sizes: {', '.join(unknown)}")
+        metafunc.parametrize("dataset", sizes, indirect=True, scope="module")
+
+
+@pytest.fixture(scope="module")
+def dataset(request, django_db_setup, django_db_blocker):
+    with django_db_blocker.unblock():
+        data = seed(request.param)
+        try:
+            yield data
+        finally:
+            unseed(data)
+
+
+def _load_baseline():
+    if BASELINE_PATH.exists():
+        return json.loads(BASELINE_PATH.read_text())
+    return {}
+
+
+@pytest.fixture(scope="session")
+def perf_results(request):
+    results = {}
+    yield results
+    if not results:
+        return
+    RESULTS_PATH.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+    if request.config.getoption("perf_update_baseline"):
+        baseline = _load_baseline()
+        for size, endpoints in results.items():
+            baseline.setdefault(size, {}).update(
+                {
+                    name: {key: result[key] for key in ("queries", "p50_ms", "p95_ms")}
+                    for name, result in endpoints.items()
+                }
+            )
+        BASELINE_PATH.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+
+
+class PerfCheck:
+    def __init__(self, request, dataset, results, assert_max_queries):
+        self.config = request.config
+        self.dataset = dataset
+        self.results = results
+        self.assert_max_queries = assert_max_queries
+        baseline = _load_baseline()
+        self.baseline = baseline.get(dataset.size, {})
+        # The first size in SIZES order with a recorded count, per endpoint
+        self.query_bounds = {}
+        for size in reversed(SIZES):
+            for name, expected in baseline.get(size, {}).items():
+                self.query_bounds[name] = expected["queries"]
+
+    def check(self, name, send):
+        """
+        Send one request with ``send()`` under the baseline's query bound,
+        then time ``iterations`` more and record the latency percentiles.
+        """
+        updating = self.config.getoption("perf_update_baseline")
+        expected = self.baseline.get(name)
+        checking = expected and not updating
+        query_bound = None if updating else self.query_bounds.get(name)
+        if query_bound is not None:
+            reset_queries()
+            with self.assert_max_queries(query_bound):
+                response = send()
+        else:
+            response = send()
+        assert response.status_code < 400, response.content[:500]
+        counter = QueryCounter()
+        with connection.execute_wrapper(counter):
+            send()
+        queries = counter.count
+        if query_bound is not None:
+            # The log-based assertion above can't see past 9000 queries
+            assert queries <= query_bound, (
+                f"{name} ran {queries} queries, over the {query_bound} recorded "
+                "for the smallest size in the baseline"
+            )
+
+        durations = []
+        for _ in range(SIZES[self.dataset.size].iterations):
+            started = time.perf_counter()
+            send()
+            durations.append(time.perf_counter() - started)
+        durations.sort()
+        result = {
+            "queries": queries,
+            "p50_ms": round(percentile(durations, 50) * 1000, 2),
+            "p95_ms": round(percentile(durations, 95) * 1000, 2),
+        }
+        if checking:
+            tolerance = self.config.getoption("perf_tolerance")
+            limit = expected["p95_ms"] * tolerance
+            result["baseline_p95_ms"] = expected["p95_ms"]
+            result["regressed"] = result["p95_ms"] > limit
+            if self.config.getoption("perf_strict"):
+                assert not result["regressed"], (
+                    f"{name} p95 {result['p95_ms']}ms exceeds {tolerance}x the "
+                    f"baseline's {expected['p95_ms']}ms"
+                )
+        self.results.setdefault(self.dataset.size, {})[name] = result
+        return result
+
+
+@pytest.fixture
+def perf(request, dataset, perf_results, django_assert_max_num_queries):
+    return PerfCheck(request, dataset, perf_results, django_assert_max_num_queries)
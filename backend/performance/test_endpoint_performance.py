@@ -0,0 +1,39 @@
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+
+@pytest.mark.perf
+@pytest.mark.django_db
+class TestEndpointPerformance:
+    @pytest.fixture
+    def client(self, dataset):
+        client = APIClient()
+        # The first seeded user reviewed one school per sport and has
+        # preferences, so recommendations have work to do
+        client.force_authenticate(dataset.users[0])
+        return client
+
+    def test_get_schools(self, perf, client):
+        perf.check("get_schools", lambda: client.get(reverse("get_schools")))
+
+    def test_filter_schools(self, perf, client):
+        url = reverse("filter-schools")
+        perf.check(
+            "filter_schools",
+            lambda: client.get(url, {"sport": "Football", "head_coach": 5}),
+        )
+
+    def test_get_recommended_schools(self, perf, client):
+        url = reverse("recommended-schools")
+        perf.check("get_recommended_schools", lambda: client.get(url))
+
+    def test_get_school_reviews(self, perf, client, dataset):
+        url = reverse("school-reviews", args=[dataset.schools[0].id])
+        perf.check("get_school_reviews", lambda: client.get(url, {"sport": "fb"}))
+
+    def test_vote(self, perf, client, dataset):
+        url = reverse("review-vote", args=[dataset.reviews[-1].review_id])
+        # Voting the same way twice toggles the vote off, so the timed
+        # requests alternate between creating and deleting it
+        perf.check("vote", lambda: client.post(url, {"vote": 1}, format="json"))
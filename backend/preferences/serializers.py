@@ -18,11 +18,10 @@ class PreferencesSerializer(serializers.ModelSerializer):
             "Women's Soccer": "wsoc",
             "Wrestling": "wr",
         }
-        logger.info(
-            f"PreferencesSerializer.validate_sport: Converting '{value}' to code"
-        )
         code = sport_mapping.get(value, value)
-        logger.info(f"PreferencesSerializer.validate_sport: Converted to '{code}'")
+        logger.debug(
+            "PreferencesSerializer.validate_sport: Converted '%s' to '%s'", value, code
+        )
         return code
 
     def to_representation(self, instance):
@@ -40,8 +39,10 @@ class PreferencesSerializer(serializers.ModelSerializer):
         }
         original_sport = data["sport"]
         data["sport"] = display_mapping.get(data["sport"], data["sport"])
-        logger.info(
-            f"PreferencesSerializer.to_representation: Converting sport from '{original_sport}' to '{data['sport']}'"
+        logger.debug(
+            "PreferencesSerializer.to_representation: Converted sport from '%s' to '%s'",
+            original_sport,
+            data["sport"],
         )
         return data
 
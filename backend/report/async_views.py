@@ -0,0 +1,46 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from config.async_utils import bad_request, error_response, request_data
+from outbox.delivery import enqueue_email
+
+
+@csrf_exempt
+@require_POST
+async def report_issue(request):
+    """Async ``report.views.report_issue`` for ASGI mode."""
+    try:
+        data = request_data(request)
+    except APIException as e:
+        return error_response(e)
+    email = data.get("email")
+    name = data.get("name", "")
+    description = data.get("description", "")
+
+    if not email or not description:
+        return bad_request("Email and description are required.")
+
+    subject = "New Issue Reported"
+    message = f"Reporter Email: {email}\nReporter Name: {name}\nReport Description:\n{description}"
+
+    try:
+        await sync_to_async(enqueue_email)(
+            subject,
+            message,
+            settings.DEFAULT_FROM_EMAIL,
+            settings.REPORT_RECEIVER_EMAIL,
+        )
+    except Exception as e:
+        return JsonResponse(
+            {"error": f"Email sending failed: {e}"},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+    return JsonResponse(
+        {"message": "Issue reported successfully."}, status=status.HTTP_201_CREATED
+    )
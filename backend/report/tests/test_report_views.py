@@ -21,15 +21,15 @@ class TestReportIssue:
             "description": "This is a test issue report",
         }
 
-        # Mock the send_mail function to avoid actually sending emails during tests
-        with patch("report.views.send_mail") as mock_send_mail:
+        # Mock enqueue_email to check what goes into the outbox
+        with patch("report.views.enqueue_email") as mock_send_mail:
             response = api_client.post(url, data, format="json")
 
             # Assert the response is correct
             assert response.status_code == status.HTTP_201_CREATED
             assert response.data["message"] == "Issue reported successfully."
 
-            # Assert send_mail was called with the right parameters
+            # Assert enqueue_email was called with the right parameters
             mock_send_mail.assert_called_once()
             args, kwargs = mock_send_mail.call_args
             assert args[0] == "New Issue Reported"  # subject
@@ -70,8 +70,8 @@ class TestReportIssue:
             "description": "This is a test issue report",
         }
 
-        # Mock send_mail to raise an exception
-        with patch("report.views.send_mail") as mock_send_mail:
+        # Mock enqueue_email to raise an exception
+        with patch("report.views.enqueue_email") as mock_send_mail:
             mock_send_mail.side_effect = Exception("Email sending failed")
             response = api_client.post(url, data, format="json")
 
@@ -1,6 +1,10 @@
+from django.conf import settings
 from django.urls import path
 from .views import report_issue
 
+if settings.ASYNC_VIEWS:
+    from .async_views import report_issue  # noqa: F811
+
 urlpatterns = [
     path("report_issue/", report_issue, name="report_issue"),
 ]
@@ -4,7 +4,7 @@ from django.shortcuts import render
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from rest_framework import status
-from django.core.mail import send_mail
+from outbox.delivery import enqueue_email
 from django.conf import settings
 
 
@@ -26,14 +26,13 @@ def report_issue(request):
     subject = "New Issue Reported"
     message = f"Reporter Email: {email}\nReporter Name: {name}\nReport Description:\n{description}"
 
-    # Send email using Django's send_mail function
+    # Queue the email; the outbox worker sends it
     try:
-        send_mail(
+        enqueue_email(
             subject,
             message,
             settings.DEFAULT_FROM_EMAIL,  # sender email
             settings.REPORT_RECEIVER_EMAIL,  # receiver list
-            fail_silently=False,
         )
     except Exception as e:
         return Response(
@@ -0,0 +1,299 @@
+"""
+Coach catalog helpers: school-name aliases used to match tenure records to
+schools, and seeding of Coach rows from the tenure fixtures.
+"""
+
+import logging
+
+from schools.models import Schools
+from .models import Coach, Reviews, normalize_coach_name
+from .sports import sport_code
+from .services import read_coach_fixture
+
+logger = logging.getLogger(__name__)
+
+# Tenure fixture for each sport that has one
+COACH_FIXTURES = {
+    "mbb": "coach_tenures.json",
+    "wbb": "coach_tenures_wbb.json",
+    "fb": "coach_tenures_fb.json",
+}
+
+# Tenure records name schools the way the press does ("Illinois", "UCF");
+# these map our normalized school names to every spelling we've seen
+SPECIAL_CASE_SCHOOL_NAMES = {
+    "university of central florida": [
+        "ucf",
+        "university of central florida",
+        "central florida",
+    ],  # works
+    "central florida": [
+        "ucf",
+        "university of central florida",
+        "central florida",
+    ],  # works
+    "university of colorado boulder": [
+        "colorado",
+        "university of colorado boulder",
+    ],  # works
+    "university of texas at austin": [
+        "texas",
+        "university of texas at austin",
+    ],  # works
+    # Illinois
+    "university of illinois at urbana–champaign": [
+        "illinois",
+        "university of illinois at urbana–champaign",
+        "university of illinois at urbana-champaign",
+    ],
+    "university of illinois at urbana-champaign": [
+        "illinois",
+        "university of illinois at urbana–champaign",
+        "university of illinois at urbana-champaign",
+    ],
+    "illinois": [
+        "illinois",
+        "university of illinois at urbana–champaign",
+        "university of illinois at urbana-champaign",
+    ],
+    "illinois at urbana-champaign": [
+        "illinois",
+        "university of illinois at urbana–champaign",
+        "university of illinois at urbana-champaign",
+    ],
+    # Maryland
+    "university of maryland, college park": [
+        "maryland",
+        "university of maryland, college park",
+    ],
+    "maryland": [
+        "maryland",
+        "university of maryland, college park",
+    ],
+    # Nebraska
+    "university of nebraska–lincoln": [
+        "nebraska",
+        "university of nebraska–lincoln",
+        "university of nebraska-lincoln",
+    ],
+    "university of nebraska-lincoln": [
+        "nebraska",
+        "university of nebraska–lincoln",
+        "university of nebraska-lincoln",
+    ],
+    "nebraska": [
+        "nebraska",
+        "university of nebraska–lincoln",
+        "university of nebraska-lincoln",
+    ],
+    "nebraska-lincoln": [
+        "nebraska",
+        "university of nebraska–lincoln",
+        "university of nebraska-lincoln",
+    ],
+    # Wisconsin
+    "university of wisconsin–madison": [
+        "wisconsin",
+        "university of wisconsin–madison",
+        "university of wisconsin-madison",
+    ],
+    "university of wisconsin-madison": [
+        "wisconsin",
+        "university of wisconsin–madison",
+        "university of wisconsin-madison",
+    ],
+    "wisconsin": [
+        "wisconsin",
+        "university of wisconsin–madison",
+        "university of wisconsin-madison",
+    ],
+    "wisconsin-madison": [
+        "wisconsin",
+        "university of wisconsin–madison",
+        "university of wisconsin-madison",
+    ],
+    # Baylor
+    "baylor university": [
+        "baylor",
+        "baylor university",
+    ],
+    "baylor": [
+        "baylor",
+        "baylor university",
+    ],
+    # Auburn
+    "auburn university": [
+        "auburn",
+        "auburn university",
+    ],
+    "auburn": [
+        "auburn",
+        "auburn university",
+    ],
+    # BYU
+    "brigham young university": [
+        "byu",
+        "brigham young university",
+        "brigham young",
+    ],
+    "brigham young": [
+        "byu",
+        "brigham young university",
+        "brigham young",
+    ],
+    "byu": [
+        "byu",
+        "brigham young university",
+        "brigham young",
+    ],
+    # Purdue
+    "purdue university": [
+        "purdue",
+        "purdue university",
+    ],
+    "purdue": [
+        "purdue",
+        "purdue university",
+    ],
+    # Indiana
+    "indiana university bloomington": [
+        "indiana",
+        "indiana university",
+        "indiana university bloomington",
+    ],
+    "indiana university": [
+        "indiana",
+        "indiana university",
+        "indiana university bloomington",
+    ],
+    "indiana": [
+        "indiana",
+        "indiana university",
+        "indiana university bloomington",
+    ],
+}
+
+
+def _normalize_school_name(name):
+    if not name:
+        return [""]
+    # Replace en-dash and em-dash with hyphen for school names
+    name = name.lower().strip().replace("–", "-").replace("—", "-")
+
+    # Handle common university name patterns
+    normalized_names = [name]
+
+    # If it starts with "university of", add the version without it
+    if name.startswith("university of "):
+        normalized_names.append(name.replace("university of ", ""))
+
+    # If it ends with "university", add the version without it
+    if name.endswith(" university"):
+        normalized_names.append(name.replace(" university", ""))
+
+    # If it's just a single word, add "university" and "university of" versions
+    if " " not in name:
+        normalized_names.append(f"{name} university")
+        normalized_names.append(f"university of {name}")
+
+    return list(set(normalized_names))  # Remove any duplicates
+
+
+def school_aliases(school_name):
+    """Every lowercase spelling a tenure record might use for ``school_name``."""
+    aliases = set(_normalize_school_name(school_name))
+    for alias in list(aliases):
+        aliases.update(SPECIAL_CASE_SCHOOL_NAMES.get(alias, []))
+    return {alias.replace("–", "-").replace("—", "-") for alias in aliases}
+
+
+def build_school_alias_index(schools=None):
+    """Map each school alias to its school id (first school wins on clashes)."""
+    if schools is None:
+        schools = Schools.objects.only("id", "school_name").order_by("id")
+    index = {}
+    for school in schools:
+        for alias in school_aliases(school.school_name):
+            index.setdefault(alias, school.id)
+    return index
+
+
+def _institution_key(institution):
+    return (institution or "").lower().strip().replace("–", "-").replace("—", "-")
+
+
+def seed_coaches():
+    """
+    Upsert Coach rows from the tenure fixtures and link unlinked reviews.
+
+    Safe to re-run: existing coaches get their tenure and current school
+    refreshed. Returns ``(created, updated, linked_reviews)``.
+    """
+    alias_index = build_school_alias_index()
+    existing = {
+        (coach.sport, coach.normalized_name): coach for coach in Coach.objects.all()
+    }
+
+    to_create, to_update = [], []
+    for sport, filename in COACH_FIXTURES.items():
+        try:
+            entries = read_coach_fixture(filename)
+        except Exception as e:
+            logger.error(f"Error loading coach data from {filename}: {str(e)}")
+            continue
+        seen = set()
+        for entry in entries:
+            normalized = normalize_coach_name(entry.get("person"))
+            if not normalized or normalized in seen:
+                continue
+            seen.add(normalized)
+            current_school_id = alias_index.get(
+                _institution_key(entry.get("current_institution"))
+            )
+            tenure = entry.get("tenure") or ""
+            coach = existing.get((sport, normalized))
+            if coach is None:
+                to_create.append(
+                    Coach(
+                        name=entry["person"].strip(),
+                        normalized_name=normalized,
+                        sport=sport,
+                        tenure=tenure,
+                        current_school_id=current_school_id,
+                    )
+                )
+            elif (
+                coach.name,
+                coach.tenure,
+                coach.current_school_id,
+            ) != (entry["person"].strip(), tenure, current_school_id):
+                coach.name = entry["person"].strip()
+                coach.tenure = tenure
+                coach.current_school_id = current_school_id
+                to_update.append(coach)
+
+    Coach.objects.bulk_create(to_create, batch_size=1000, ignore_conflicts=True)
+    Coach.objects.bulk_update(
+        to_update, ["name", "tenure", "current_school"], batch_size=1000
+    )
+    return len(to_create), len(to_update), link_reviews()
+
+
+def link_reviews():
+    """Point reviews without a coach at their (possibly new) Coach row."""
+    unlinked = list(
+        Reviews.objects.filter(coach__isnull=True).values_list(
+            "id", "head_coach_name", "sport"
+        )
+    )
+    coaches = Coach.objects.resolve_many(
+        (name, sport) for _, name, sport in unlinked if name
+    )
+    review_ids_by_coach = {}
+    for review_id, name, sport in unlinked:
+        coach = coaches.get((sport_code(sport), normalize_coach_name(name)))
+        if coach is not None:
+            review_ids_by_coach.setdefault(coach.id, []).append(review_id)
+    for coach_id, review_ids in review_ids_by_coach.items():
+        Reviews.objects.filter(id__in=review_ids).update(coach_id=coach_id)
+    return len(unlinked)
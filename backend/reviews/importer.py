@@ -0,0 +1,389 @@
+"""
+Bulk review import.
+
+Reviews arrive as NDJSON (one JSON object per line) or CSV with a header row.
+Records are validated in chunks: every chunk resolves its schools, users and
+existing reviews with one query each, looks coaches and their tenure up
+through caches shared by the whole run, and is written with a single
+``INSERT ... ON CONFLICT DO NOTHING RETURNING``, so rows that lose a race with
+the review form are counted as duplicates rather than created.
+"""
+
+import csv
+import json
+import logging
+import uuid
+from dataclasses import dataclass, field
+from itertools import islice
+
+from django.db import connection
+from django.utils import timezone
+
+from schools import cache as school_cache
+from schools.models import Schools
+from users.models import Users
+from .models import Coach, Reviews, normalize_coach_name
+from .sports import SPORT_DISPLAY_TO_CODE
+from .services import CoachSearchService
+
+logger = logging.getLogger(__name__)
+
+RATING_FIELDS = [
+    "head_coach",
+    "assistant_coaches",
+    "team_culture",
+    "campus_life",
+    "athletic_facilities",
+    "athletic_department",
+    "player_development",
+    "nil_opportunity",
+]
+SPORT_CODES = set(SPORT_DISPLAY_TO_CODE.values())
+MIN_RATING = 1
+MAX_RATING = 10
+DEFAULT_CHUNK_SIZE = 1000
+# Cap on the number of row errors kept in an ImportResult
+MAX_REPORTED_ERRORS = 100
+# Columns written for each imported review, as Reviews field names
+INSERT_FIELDS = [
+    "review_id",
+    "school",
+    "user",
+    "sport",
+    "head_coach_name",
+    "head_coach_name_normalized",
+    "coach",
+    "review_message",
+    *RATING_FIELDS,
+    "created_at",
+    "updated_at",
+    "coach_no_longer_at_university",
+    "coach_history",
+]
+
+
+class ImportFormatError(ValueError):
+    """Raised when the input format is not one the importer understands."""
+
+
+@dataclass
+class ImportResult:
+    created: int = 0
+    duplicates: int = 0
+    invalid: int = 0
+    errors: list = field(default_factory=list)
+
+    def add_error(self, line, message):
+        self.invalid += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line, "error": message})
+
+    def as_dict(self):
+        return {
+            "created": self.created,
+            "duplicates": self.duplicates,
+            "invalid": self.invalid,
+            "errors": self.errors,
+        }
+
+
+def _decode(line, line_number):
+    if isinstance(line, bytes):
+        line = line.decode("utf-8")
+    if line_number == 1:
+        line = line.lstrip("\ufeff")
+    return line
+
+
+def _csv_lines(lines, undecodable):
+    """Decode ``lines`` up to the first one that isn't UTF-8, noting its number."""
+    for line_number, line in enumerate(lines, start=1):
+        try:
+            yield _decode(line, line_number)
+        except UnicodeDecodeError:
+            undecodable.append(line_number)
+            return
+
+
+def iter_records(lines, fmt):
+    """
+    Yield ``(line_number, record)`` pairs from an iterable of text or byte lines.
+
+    ``record`` is a dict, or an error message string when the line could not
+    be parsed; parse errors are reported per line instead of aborting the run.
+    A CSV line that isn't UTF-8 ends the file, since the rows after it can't
+    be trusted, and is reported as the last error.
+    """
+    if fmt == "ndjson":
+        for line_number, line in enumerate(lines, start=1):
+            try:
+                line = _decode(line, line_number)
+            except UnicodeDecodeError:
+                yield line_number, "Line is not valid UTF-8"
+                continue
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                yield line_number, f"Invalid JSON: {e}"
+                continue
+            if not isinstance(record, dict):
+                yield line_number, "Each line must be a JSON object"
+                continue
+            yield line_number, record
+    elif fmt == "csv":
+        undecodable = []
+        reader = csv.DictReader(_csv_lines(lines, undecodable))
+        for record in reader:
+            # Header is line 1, so data rows start at line 2
+            yield reader.line_num, record
+        if undecodable:
+            yield undecodable[0], (
+                "Line is not valid UTF-8; it and the lines after it were not imported"
+            )
+    else:
+        raise ImportFormatError(f"Unsupported import format: {fmt}")
+
+
+def _chunked(iterable, size):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class ReviewImporter:
+    """
+    Validate and insert review records in chunks.
+
+    Each record needs ``school`` (id or exact school name), ``user`` (id) or
+    ``user_email``, ``sport`` (code or display name), ``head_coach_name``,
+    ``review_message`` and the eight rating fields.
+    """
+
+    def __init__(self, chunk_size=DEFAULT_CHUNK_SIZE, dry_run=False):
+        self.chunk_size = chunk_size
+        self.dry_run = dry_run
+        self.coach_service = CoachSearchService()
+        self._history_cache = {}
+        self._coach_ids = {}
+
+    def run(self, records):
+        result = ImportResult()
+        for chunk in _chunked(records, self.chunk_size):
+            self._import_chunk(chunk, result)
+        logger.info(
+            f"Review import finished: {result.created} created, "
+            f"{result.duplicates} duplicates, {result.invalid} invalid"
+        )
+        return result
+
+    def _clean(self, record):
+        """Return a dict of cleaned values, or raise ValueError with a message."""
+        cleaned = {}
+
+        sport = str(record.get("sport") or "").strip()
+        sport = SPORT_DISPLAY_TO_CODE.get(sport, sport)
+        if sport not in SPORT_CODES:
+            raise ValueError(f"Unknown sport '{record.get('sport')}'")
+        cleaned["sport"] = sport
+
+        coach_name = str(record.get("head_coach_name") or "").strip()
+        if not coach_name:
+            raise ValueError("head_coach_name is required")
+        if len(coach_name) > Reviews._meta.get_field("head_coach_name").max_length:
+            raise ValueError("head_coach_name is too long")
+        cleaned["head_coach_name"] = coach_name
+
+        message = str(record.get("review_message") or "").strip()
+        if not message:
+            raise ValueError("review_message is required")
+        cleaned["review_message"] = message
+
+        for rating_field in RATING_FIELDS:
+            value = record.get(rating_field)
+            # CSV gives every value as a string; JSON must give a whole number
+            if isinstance(value, str) and value.strip().lstrip("-").isdigit():
+                value = int(value)
+            if not isinstance(value, int) or isinstance(value, bool):
+                raise ValueError(f"{rating_field} must be an integer")
+            if not MIN_RATING <= value <= MAX_RATING:
+                raise ValueError(
+                    f"{rating_field} must be between {MIN_RATING} and {MAX_RATING}"
+                )
+            cleaned[rating_field] = value
+
+        school = str(record.get("school") or "").strip()
+        if not school:
+            raise ValueError("school is required")
+        cleaned["school"] = int(school) if school.isdigit() else school
+
+        user_id = str(record.get("user") or "").strip()
+        user_email = str(record.get("user_email") or "").strip()
+        if user_id.isdigit():
+            cleaned["user"] = int(user_id)
+        elif user_email:
+            cleaned["user"] = user_email
+        else:
+            raise ValueError("user or user_email is required")
+
+        return cleaned
+
+    def _resolve_schools(self, rows):
+        ids = {row["school"] for row in rows if isinstance(row["school"], int)}
+        names = {row["school"] for row in rows if isinstance(row["school"], str)}
+        resolved = {}
+        if ids:
+            resolved.update(Schools.objects.in_bulk(ids))
+        if names:
+            for school in Schools.objects.filter(school_name__in=names):
+                # Reuse the instance if the same school was also referenced by id
+                resolved[school.school_name] = resolved.get(school.id, school)
+        return resolved
+
+    def _resolve_users(self, rows):
+        ids = {row["user"] for row in rows if isinstance(row["user"], int)}
+        emails = {row["user"] for row in rows if isinstance(row["user"], str)}
+        resolved = {}
+        if ids:
+            for user_id in Users.objects.filter(id__in=ids).values_list(
+                "id", flat=True
+            ):
+                resolved[user_id] = user_id
+        if emails:
+            for user_id, email in Users.objects.filter(email__in=emails).values_list(
+                "id", "email"
+            ):
+                resolved[email] = user_id
+        return resolved
+
+    def _existing_keys(self, rows):
+        """Normalized duplicate keys already stored for the chunk's reviewers."""
+        triples = {(row["school_id"], row["user_id"], row["sport"]) for row in rows}
+        if not triples:
+            return set()
+        existing = Reviews.objects.filter(
+            user_id__in={user_id for _, user_id, _ in triples},
+            school_id__in={school_id for school_id, _, _ in triples},
+        ).values_list("school_id", "user_id", "sport", "head_coach_name_normalized")
+        return {key for key in existing if key[:3] in triples}
+
+    def _coach_history(self, coach_name, school_name, sport):
+        key = (normalize_coach_name(coach_name), sport)
+        if key not in self._history_cache:
+            history, _ = self.coach_service.search_coach_history(
+                coach_name, school_name, sport
+            )
+            self._history_cache[key] = history
+        return self._history_cache[key]
+
+    def _coach_id_map(self, rows):
+        """Coach ids by ``(sport, normalized name)``, resolved once per run."""
+        missing = {
+            (row["head_coach_name"], row["sport"])
+            for row in rows
+            if (row["sport"], normalize_coach_name(row["head_coach_name"]))
+            not in self._coach_ids
+        }
+        if missing:
+            self._coach_ids.update(
+                (key, coach.id)
+                for key, coach in Coach.objects.resolve_many(missing).items()
+            )
+        return self._coach_ids
+
+    def _insert(self, values):
+        """Insert review rows, skipping conflicts; return how many went in."""
+        opts = Reviews._meta
+        quote = connection.ops.quote_name
+        columns = ", ".join(
+            quote(opts.get_field(name).column) for name in INSERT_FIELDS
+        )
+        placeholders = f"({', '.join(['%s'] * len(INSERT_FIELDS))})"
+        sql = (
+            f"INSERT INTO {quote(opts.db_table)} ({columns}) "
+            f"VALUES {', '.join([placeholders] * len(values))} "
+            f"ON CONFLICT DO NOTHING RETURNING {quote(opts.pk.column)}"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [value for row in values for value in row])
+            return len(cursor.fetchall())
+
+    def _import_chunk(self, chunk, result):
+        rows = []
+        for line_number, record in chunk:
+            if isinstance(record, str):
+                result.add_error(line_number, record)
+                continue
+            try:
+                cleaned = self._clean(record)
+            except ValueError as e:
+                result.add_error(line_number, str(e))
+                continue
+            cleaned["line"] = line_number
+            rows.append(cleaned)
+
+        schools = self._resolve_schools(rows)
+        users = self._resolve_users(rows)
+
+        resolved_rows = []
+        for row in rows:
+            school = schools.get(row["school"])
+            if school is None:
+                result.add_error(row["line"], f"School '{row['school']}' not found")
+                continue
+            user_id = users.get(row["user"])
+            if user_id is None:
+                result.add_error(row["line"], f"User '{row['user']}' not found")
+                continue
+            row["school_id"] = school.id
+            row["school_obj"] = school
+            row["user_id"] = user_id
+            resolved_rows.append(row)
+
+        seen = self._existing_keys(resolved_rows)
+        # A dry run must not create coaches as a side effect
+        coach_ids = {} if self.dry_run else self._coach_id_map(resolved_rows)
+        now = timezone.now()
+        values = []
+        for row in resolved_rows:
+            normalized_name = normalize_coach_name(row["head_coach_name"])
+            key = (row["school_id"], row["user_id"], row["sport"], normalized_name)
+            if key in seen:
+                result.duplicates += 1
+                continue
+            seen.add(key)
+            # Same values as Reviews.save() and the field defaults would give
+            values.append(
+                (
+                    uuid.uuid4(),
+                    row["school_id"],
+                    row["user_id"],
+                    row["sport"],
+                    row["head_coach_name"],
+                    normalized_name,
+                    coach_ids.get((row["sport"], normalized_name)),
+                    row["review_message"],
+                    *(row[name] for name in RATING_FIELDS),
+                    now,
+                    now,
+                    False,
+                    self._coach_history(
+                        row["head_coach_name"],
+                        row["school_obj"].school_name,
+                        row["sport"],
+                    ),
+                )
+            )
+
+        if not values or self.dry_run:
+            result.created += len(values)
+            return
+
+        # Rows racing in through the review form are skipped, not fatal. Stored
+        # summaries go stale on their own once newer reviews exist.
+        inserted = self._insert(values)
+        # The insert sends no post_save, so drop the cached payloads here
+        school_cache.invalidate()
+        result.created += inserted
+        result.duplicates += len(values) - inserted
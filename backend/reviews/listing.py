@@ -0,0 +1,113 @@
+"""
+Fast path for read-only review lists.
+
+``review_payloads()`` builds the same dicts as
+``ReviewsSerializer(many=True).data`` straight from ``.values()`` rows, skipping
+serializer instantiation and per-field dispatch. The field map below is built
+once at import and must follow ``ReviewsSerializer.Meta.fields``;
+``reviews/tests/test_review_listing.py`` checks the two stay identical.
+"""
+
+from operator import itemgetter
+
+from rest_framework import serializers
+
+from config.instrumentation import timed
+from .sports import SPORT_CODE_TO_DISPLAY
+
+_datetime = serializers.DateTimeField().to_representation
+
+
+def _column(name, convert=None):
+    get = itemgetter(name)
+    if convert is None:
+        return get
+    return lambda row: convert(get(row))
+
+
+def _user(row):
+    return {
+        "id": row["user_id"],
+        "is_school_verified": row["user__is_school_verified"],
+        "profile_picture": row["user__profile_picture"],
+    }
+
+
+def _sport(row):
+    return SPORT_CODE_TO_DISPLAY.get(row["sport"], row["sport"])
+
+
+def _nullable(convert):
+    return lambda value: None if value is None else convert(value)
+
+
+# (response key, row -> value), in ReviewsSerializer's field order
+REVIEW_FIELDS = (
+    ("id", _column("id")),
+    ("review_id", _column("review_id", str)),
+    ("school", _column("school_id")),
+    ("user", _user),
+    ("sport", _sport),
+    ("head_coach_name", _column("head_coach_name")),
+    ("review_message", _column("review_message")),
+    ("head_coach", _column("head_coach")),
+    ("assistant_coaches", _column("assistant_coaches")),
+    ("team_culture", _column("team_culture")),
+    ("campus_life", _column("campus_life")),
+    ("athletic_facilities", _column("athletic_facilities")),
+    ("athletic_department", _column("athletic_department")),
+    ("player_development", _column("player_development")),
+    ("nil_opportunity", _column("nil_opportunity")),
+    ("created_at", _column("created_at", _nullable(_datetime))),
+    ("updated_at", _column("updated_at", _nullable(_datetime))),
+    ("coach_no_longer_at_university", _column("coach_no_longer_at_university")),
+    ("coach_history", _column("coach_history")),
+    ("school_name", _column("school__school_name")),
+    ("helpful_count", _column("helpful_count")),
+    ("unhelpful_count", _column("unhelpful_count")),
+    ("my_vote", _column("user_vote")),
+)
+
+REVIEW_COLUMNS = (
+    "id",
+    "review_id",
+    "school_id",
+    "user_id",
+    "user__is_school_verified",
+    "user__profile_picture",
+    "sport",
+    "head_coach_name",
+    "review_message",
+    "head_coach",
+    "assistant_coaches",
+    "team_culture",
+    "campus_life",
+    "athletic_facilities",
+    "athletic_department",
+    "player_development",
+    "nil_opportunity",
+    "created_at",
+    "updated_at",
+    "coach_no_longer_at_university",
+    "coach_history",
+    "school__school_name",
+    "helpful_count",
+    "unhelpful_count",
+    "user_vote",
+)
+
+
+def review_rows(reviews, user=None):
+    """The ``.values()`` rows ``review_payload()`` reads, for ``user``."""
+    return reviews.for_listing(user).values(*REVIEW_COLUMNS)
+
+
+def review_payload(row):
+    return {key: get(row) for key, get in REVIEW_FIELDS}
+
+
+def review_payloads(reviews, request):
+    """``ReviewsSerializer(reviews, many=True).data`` without the serializer."""
+    rows = review_rows(reviews, getattr(request, "user", None))
+    with timed("serialize"):
+        return [review_payload(row) for row in rows]
@@ -0,0 +1,382 @@
+"""
+Gateway for calls to the OpenAI chat API.
+
+All calls share one pooled client. Each call gets a deadline covering its
+retries, retryable errors back off with full jitter, and a circuit breaker
+stops calling the API for a cooldown after repeated failures so callers can
+fall back to stored summaries immediately. A process-wide semaphore caps the
+number of calls in flight (``settings.LLM_MAX_CONCURRENCY``). Waiting for one
+of its slots is bounded separately (``settings.LLM_SLOT_WAIT``): the deadline
+only starts once a call holds a slot, and a call that never gets one isn't
+counted against the API by the breaker.
+
+Callers only need ``complete()`` (or ``acomplete()`` from async code),
+``available()`` and ``LLMUnavailable``. The async path keeps one client and
+semaphore per event loop and shares the circuit breaker with sync callers.
+
+The OpenAI SDK takes longer to import than the rest of the backend, so it is
+imported on the first call rather than at startup; workers and management
+commands that never call the model don't pay for it.
+"""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+import weakref
+
+from django.conf import settings
+
+from config.instrumentation import timed
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL = "gpt-3.5-turbo"
+
+
+def _openai():
+    """The ``openai`` module, imported on first use."""
+    import openai
+
+    return openai
+
+
+def _retryable_errors():
+    """Transient failures worth another attempt; anything else fails at once."""
+    openai = _openai()
+    return (
+        openai.APITimeoutError,
+        openai.APIConnectionError,
+        openai.RateLimitError,
+        openai.InternalServerError,
+    )
+
+
+def _api_failure(error):
+    """
+    Whether a non-retryable error says the API is unhealthy. A 4xx (a prompt
+    over the context length, a bad parameter) only says this request was bad,
+    so it shouldn't count towards opening the breaker for everyone.
+    """
+    openai = _openai()
+    if isinstance(error, openai.APIStatusError):
+        return error.status_code >= 500
+    return isinstance(error, openai.APIError)
+
+
+class LLMUnavailable(Exception):
+    """The model could not produce a completion in time."""
+
+
+class CircuitBreaker:
+    """
+    Opens after ``threshold`` consecutive failures and rejects calls until
+    ``cooldown`` seconds have passed. Then one trial call is let through: a
+    success closes the breaker, a failure opens it again.
+    """
+
+    def __init__(self, threshold, cooldown):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._opened_at = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self):
+        with self._lock:
+            return self._opened_at is not None and not self._cooled_down()
+
+    def _cooled_down(self):
+        return time.monotonic() - self._opened_at >= self.cooldown
+
+    def allow(self):
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._cooled_down() and not self._trial_running:
+                self._trial_running = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def release(self):
+        """Give back a trial slot for a call that never reached the API."""
+        with self._lock:
+            self._trial_running = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._trial_running = False
+            if self._opened_at is not None or self._failures >= self.threshold:
+                if self._opened_at is None:
+                    logger.warning(
+                        f"Opening LLM circuit breaker after {self._failures} failures"
+                    )
+                self._opened_at = time.monotonic()
+
+
+_client = None
+_breaker = None
+_slots = None
+_async_clients = weakref.WeakKeyDictionary()
+_async_slots = weakref.WeakKeyDictionary()
+_state_lock = threading.Lock()
+
+
+def _client_options():
+    return {
+        "api_key": settings.OPENAI_API_KEY,
+        "base_url": settings.OPENAI_BASE_URL,
+        "timeout": settings.LLM_TIMEOUT,
+        # Retries are handled here so they respect the call deadline
+        "max_retries": 0,
+    }
+
+
+def _limits():
+    import httpx
+
+    return httpx.Limits(
+        max_connections=settings.LLM_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.LLM_MAX_CONNECTIONS,
+    )
+
+
+def get_client():
+    """The shared OpenAI client, built on first use from settings."""
+    global _client
+    with _state_lock:
+        if _client is None:
+            openai = _openai()
+            _client = openai.OpenAI(
+                **_client_options(),
+                http_client=openai.DefaultHttpxClient(limits=_limits()),
+            )
+        return _client
+
+
+def get_async_client():
+    """The AsyncOpenAI client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _state_lock:
+        if loop not in _async_clients:
+            openai = _openai()
+            _async_clients[loop] = openai.AsyncOpenAI(
+                **_client_options(),
+                http_client=openai.DefaultAsyncHttpxClient(limits=_limits()),
+            )
+        return _async_clients[loop]
+
+
+def get_breaker():
+    global _breaker
+    with _state_lock:
+        if _breaker is None:
+            _breaker = CircuitBreaker(
+                settings.LLM_BREAKER_THRESHOLD, settings.LLM_BREAKER_COOLDOWN
+            )
+        return _breaker
+
+
+def get_slots():
+    """Semaphore bounding concurrent calls across all threads."""
+    global _slots
+    with _state_lock:
+        if _slots is None:
+            _slots = threading.BoundedSemaphore(settings.LLM_MAX_CONCURRENCY)
+        return _slots
+
+
+def get_async_slots():
+    """Semaphore bounding concurrent calls on the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _state_lock:
+        if loop not in _async_slots:
+            _async_slots[loop] = asyncio.Semaphore(settings.LLM_MAX_CONCURRENCY)
+        return _async_slots[loop]
+
+
+def reset():
+    """Drop the shared clients, breaker and semaphores, e.g. after settings change."""
+    global _client, _breaker, _slots
+    with _state_lock:
+        if _client is not None and hasattr(_client, "close"):
+            _client.close()
+        _client = None
+        _breaker = None
+        _slots = None
+        _async_clients.clear()
+        _async_slots.clear()
+
+
+def available():
+    """False while the circuit breaker is rejecting calls."""
+    return not get_breaker().is_open
+
+
+def _backoff(attempt):
+    return random.uniform(0, settings.LLM_RETRY_BACKOFF * 2**attempt)
+
+
+def _call(client, model, messages, deadline_at, options):
+    remaining = deadline_at - time.monotonic()
+    with timed("llm"):
+        response = client.chat.completions.create(
+            model=model,
+            messages=messages,
+            timeout=min(settings.LLM_TIMEOUT, remaining),
+            **options,
+        )
+    return _content(response)
+
+
+def _content(response):
+    content = response.choices[0].message.content
+    # None when the model refused or was cut off by a content filter
+    if content is None:
+        raise LLMUnavailable(
+            f"LLM returned no content ({response.choices[0].finish_reason})"
+        )
+    return content
+
+
+def _give_up(breaker, attempt, delay, deadline_at, error):
+    """Whether a retryable error ends the call, recording it if so."""
+    if attempt > settings.LLM_MAX_RETRIES or time.monotonic() + delay >= deadline_at:
+        breaker.record_failure()
+        return True
+    logger.warning(f"Retrying LLM call in {delay:.2f}s after: {error}")
+    return False
+
+
+def _deadline(deadline):
+    return time.monotonic() + (settings.LLM_DEADLINE if deadline is None else deadline)
+
+
+def complete(messages, model=DEFAULT_MODEL, deadline=None, **options):
+    """
+    Return the content of one chat completion.
+
+    ``deadline`` is the total number of seconds allowed for the call including
+    retries (defaults to ``settings.LLM_DEADLINE``), counted from when the call
+    gets a concurrency slot; each attempt also stops after
+    ``settings.LLM_TIMEOUT``. Raises ``LLMUnavailable`` when the breaker is
+    open, no slot frees up within ``settings.LLM_SLOT_WAIT``, the deadline
+    passes or the API keeps failing.
+    """
+    breaker = get_breaker()
+    if not breaker.allow():
+        raise LLMUnavailable("LLM circuit breaker is open")
+
+    slots = get_slots()
+    if not slots.acquire(timeout=settings.LLM_SLOT_WAIT):
+        # Busy here rather than failing upstream, so the breaker isn't told
+        breaker.release()
+        raise LLMUnavailable("Too many LLM calls in flight")
+    try:
+        return _complete(breaker, model, messages, deadline, options)
+    finally:
+        slots.release()
+
+
+def _complete(breaker, model, messages, deadline, options):
+    client = get_client()
+    retryable = _retryable_errors()
+    deadline_at = _deadline(deadline)
+    attempt = 0
+    while True:
+        try:
+            if deadline_at <= time.monotonic():
+                raise _openai().APITimeoutError(request=None)
+            content = _call(client, model, messages, deadline_at, options)
+        except retryable as e:
+            delay = _backoff(attempt)
+            attempt += 1
+            if _give_up(breaker, attempt, delay, deadline_at, e):
+                raise LLMUnavailable(
+                    f"LLM call failed after {attempt} attempts: {e}"
+                ) from e
+            time.sleep(delay)
+        except LLMUnavailable:
+            breaker.release()
+            raise
+        except Exception as e:
+            if _api_failure(e):
+                breaker.record_failure()
+            else:
+                breaker.release()
+            raise LLMUnavailable(f"LLM call failed: {e}") from e
+        else:
+            breaker.record_success()
+            return content
+
+
+async def _acall(client, model, messages, deadline_at, options):
+    remaining = deadline_at - time.monotonic()
+    with timed("llm"):
+        response = await client.chat.completions.create(
+            model=model,
+            messages=messages,
+            timeout=min(settings.LLM_TIMEOUT, remaining),
+            **options,
+        )
+    return _content(response)
+
+
+async def acomplete(messages, model=DEFAULT_MODEL, deadline=None, **options):
+    """Async ``complete()``, for use from async views."""
+    breaker = get_breaker()
+    if not breaker.allow():
+        raise LLMUnavailable("LLM circuit breaker is open")
+
+    slots = get_async_slots()
+    try:
+        await asyncio.wait_for(slots.acquire(), timeout=settings.LLM_SLOT_WAIT)
+    except asyncio.TimeoutError:
+        breaker.release()
+        raise LLMUnavailable("Too many LLM calls in flight")
+    try:
+        return await _acomplete(breaker, model, messages, deadline, options)
+    finally:
+        slots.release()
+
+
+async def _acomplete(breaker, model, messages, deadline, options):
+    client = get_async_client()
+    retryable = _retryable_errors()
+    deadline_at = _deadline(deadline)
+    attempt = 0
+    while True:
+        try:
+            if deadline_at <= time.monotonic():
+                raise _openai().APITimeoutError(request=None)
+            content = await _acall(client, model, messages, deadline_at, options)
+        except retryable as e:
+            delay = _backoff(attempt)
+            attempt += 1
+            if _give_up(breaker, attempt, delay, deadline_at, e):
+                raise LLMUnavailable(
+                    f"LLM call failed after {attempt} attempts: {e}"
+                ) from e
+            await asyncio.sleep(delay)
+        except LLMUnavailable:
+            breaker.release()
+            raise
+        except Exception as e:
+            if _api_failure(e):
+                breaker.record_failure()
+            else:
+                breaker.release()
+            raise LLMUnavailable(f"LLM call failed: {e}") from e
+        else:
+            breaker.record_success()
+            return content
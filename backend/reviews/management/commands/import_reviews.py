@@ -0,0 +1,70 @@
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from reviews.importer import (
+    DEFAULT_CHUNK_SIZE,
+    ImportFormatError,
+    ReviewImporter,
+    iter_records,
+)
+
+
+class Command(BaseCommand):
+    help = "Bulk import reviews from an NDJSON or CSV file ('-' reads stdin)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="File to import, or '-' for stdin")
+        parser.add_argument(
+            "--format",
+            dest="input_format",
+            choices=["ndjson", "csv"],
+            help="Input format (defaults to the file extension, else ndjson)",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help="Records validated and inserted per batch",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Validate the input without writing any reviews",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        fmt = options["input_format"] or (
+            "csv" if path.lower().endswith(".csv") else "ndjson"
+        )
+        importer = ReviewImporter(
+            chunk_size=options["chunk_size"], dry_run=options["dry_run"]
+        )
+
+        started = time.perf_counter()
+        try:
+            # Read bytes so the importer reports lines that aren't UTF-8
+            if path == "-":
+                result = importer.run(iter_records(sys.stdin.buffer, fmt))
+            else:
+                with open(path, "rb") as handle:
+                    result = importer.run(iter_records(handle, fmt))
+        except (OSError, ImportFormatError) as e:
+            raise CommandError(str(e))
+        elapsed = time.perf_counter() - started
+
+        for error in result.errors:
+            self.stderr.write(f"line {error['line']}: {error['error']}")
+
+        processed = result.created + result.duplicates + result.invalid
+        rate = processed / elapsed if elapsed else processed
+        verb = "Validated" if options["dry_run"] else "Imported"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{verb} {result.created} reviews "
+                f"({result.duplicates} duplicates, {result.invalid} invalid) "
+                f"in {elapsed:.2f}s ({rate:.0f} records/s)"
+            )
+        )
@@ -0,0 +1,157 @@
+import json
+import os
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from reviews.models import Reviews
+from reviews.summaries import RefreshResult, refresh_batch, stale_school_sports
+from schools.models import Schools
+
+
+class Command(BaseCommand):
+    help = (
+        "Regenerate stale review summaries for every school and sport, in "
+        "rate-limited parallel batches."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--school",
+            type=int,
+            action="append",
+            dest="schools",
+            help="Only refresh this school id (repeatable)",
+        )
+        parser.add_argument("--sport", help="Only refresh this sport")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=10,
+            help="School sports whose model calls are issued together",
+        )
+        parser.add_argument(
+            "--rate",
+            type=float,
+            default=0,
+            help="Most summaries generated per minute (0 for no limit)",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Regenerate summaries even when they are up to date",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            help="JSON file recording finished school sports after each batch",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Skip school sports already finished in --checkpoint",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="List stale school sports without generating anything",
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1")
+        if options["resume"] and not options["checkpoint"]:
+            raise CommandError("--resume needs --checkpoint")
+
+        if options["force"]:
+            pairs = self._all_school_sports(options["schools"], options["sport"])
+        else:
+            pairs = stale_school_sports(options["schools"], options["sport"])
+        pending = sorted(pairs)
+
+        done = set()
+        if options["resume"]:
+            done = self._load_checkpoint(options["checkpoint"])
+            pending = [pair for pair in pending if pair not in done]
+
+        if options["dry_run"]:
+            for school_id, sport in pending:
+                self.stdout.write(
+                    f"school {school_id} {sport}: {pairs[(school_id, sport)]} stale"
+                )
+            self.stdout.write(f"{len(pending)} school sports to refresh")
+            return
+
+        schools = Schools.objects.in_bulk({school_id for school_id, _ in pending})
+        total = RefreshResult()
+        started = time.perf_counter()
+        size = options["batch_size"]
+        for offset in range(0, len(pending), size):
+            batch = pending[offset : offset + size]
+            batch_started = time.perf_counter()
+            result = refresh_batch(
+                [
+                    (schools[school_id], sport)
+                    for school_id, sport in batch
+                    if school_id in schools
+                ],
+                force=options["force"],
+            )
+            total.add(result)
+            # Failed and skipped pairs stay pending for --resume; schools
+            # deleted since the run started have nothing left to do
+            done.update(result.done)
+            done.update(pair for pair in batch if pair[0] not in schools)
+            if options["checkpoint"]:
+                self._save_checkpoint(options["checkpoint"], done)
+            self.stdout.write(
+                f"Batch {offset // size + 1}: {result.regenerated} regenerated, "
+                f"{result.failed} failed, {result.skipped} skipped"
+            )
+            self._throttle(options["rate"], result, batch_started)
+
+        finished = all(pair in done for pair in pending)
+        if options["checkpoint"] and finished and os.path.exists(options["checkpoint"]):
+            os.remove(options["checkpoint"])
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Refreshed {total.regenerated} summaries for {len(pending)} "
+                f"school sports ({total.failed} failed, {total.skipped} skipped) "
+                f"in {elapsed:.2f}s"
+            )
+        )
+
+    def _all_school_sports(self, school_ids, sport):
+        reviews = Reviews.objects.all()
+        if school_ids:
+            reviews = reviews.filter(school_id__in=school_ids)
+        if sport:
+            reviews = reviews.filter(sport=sport)
+        return {
+            pair: 0 for pair in reviews.values_list("school_id", "sport").distinct()
+        }
+
+    def _throttle(self, rate, result, batch_started):
+        """Sleep so summaries are generated no faster than ``rate`` per minute."""
+        if rate <= 0:
+            return
+        generated = result.regenerated + result.failed
+        remaining = generated * 60 / rate - (time.perf_counter() - batch_started)
+        if remaining > 0:
+            time.sleep(remaining)
+
+    def _load_checkpoint(self, path):
+        try:
+            with open(path, encoding="utf-8") as handle:
+                return {tuple(pair) for pair in json.load(handle)["done"]}
+        except FileNotFoundError:
+            return set()
+        except (OSError, ValueError, KeyError) as e:
+            raise CommandError(f"Unreadable checkpoint {path}: {e}")
+
+    def _save_checkpoint(self, path, done):
+        # Write then rename, so an interrupted run never leaves a torn file
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump({"done": sorted(done)}, handle)
+        os.replace(tmp_path, path)
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from reviews.coaches import seed_coaches
+
+
+class Command(BaseCommand):
+    help = (
+        "Create or refresh coaches from the tenure fixtures and link reviews to them."
+    )
+
+    def handle(self, *args, **options):
+        created, updated, linked = seed_coaches()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Coaches: {created} created, {updated} updated; "
+                f"{linked} reviews linked"
+            )
+        )
@@ -0,0 +1,58 @@
+from django.db import migrations, models
+from django.db.models import Max
+
+
+def _normalize(name):
+    return " ".join(name.strip().lower().split()) if name else ""
+
+
+def backfill_normalized_names(apps, schema_editor):
+    Reviews = apps.get_model("reviews", "Reviews")
+
+    batch = []
+    for review in Reviews.objects.only("id", "head_coach_name").iterator(
+        chunk_size=2000
+    ):
+        review.head_coach_name_normalized = _normalize(review.head_coach_name)
+        batch.append(review)
+        if len(batch) >= 2000:
+            Reviews.objects.bulk_update(batch, ["head_coach_name_normalized"])
+            batch = []
+    if batch:
+        Reviews.objects.bulk_update(batch, ["head_coach_name_normalized"])
+
+
+def remove_normalized_duplicates(apps, schema_editor):
+    Reviews = apps.get_model("reviews", "Reviews")
+
+    # Keep the most recent review for each normalized coach name, like 0014
+    duplicates = (
+        Reviews.objects.values("school", "user", "sport", "head_coach_name_normalized")
+        .annotate(max_id=Max("id"), total=models.Count("id"))
+        .filter(total__gt=1)
+    )
+    for review in duplicates:
+        Reviews.objects.filter(
+            school=review["school"],
+            user=review["user"],
+            sport=review["sport"],
+            head_coach_name_normalized=review["head_coach_name_normalized"],
+        ).exclude(id=review["max_id"]).delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("reviews", "0015_add_unique_constraint"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="reviews",
+            name="head_coach_name_normalized",
+            field=models.CharField(
+                blank=True, default="", editable=False, max_length=100
+            ),
+        ),
+        migrations.RunPython(backfill_normalized_names, migrations.RunPython.noop),
+        migrations.RunPython(remove_normalized_duplicates, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("reviews", "0016_reviews_head_coach_name_normalized"),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name="reviews",
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name="reviews",
+            constraint=models.UniqueConstraint(
+                fields=("school", "user", "sport", "head_coach_name_normalized"),
+                name="unique_review_per_normalized_coach",
+            ),
+        ),
+    ]
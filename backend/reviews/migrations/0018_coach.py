@@ -0,0 +1,65 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reviews", "0017_reviews_unique_normalized_coach"),
+        ("schools", "0013_schools_msoc"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Coach",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=100)),
+                ("normalized_name", models.CharField(max_length=100)),
+                ("sport", models.CharField(max_length=50)),
+                ("tenure", models.TextField(blank=True, default="")),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "current_school",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="current_coaches",
+                        to="schools.schools",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Coach",
+                "verbose_name_plural": "Coaches",
+            },
+        ),
+        migrations.AddField(
+            model_name="reviews",
+            name="coach",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="reviews",
+                to="reviews.coach",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="coach",
+            constraint=models.UniqueConstraint(
+                fields=("sport", "normalized_name"), name="unique_coach_per_sport"
+            ),
+        ),
+    ]
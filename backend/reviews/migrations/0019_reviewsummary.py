@@ -0,0 +1,68 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reviews", "0018_coach"),
+        ("schools", "0013_schools_msoc"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ReviewSummary",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("sport", models.CharField(max_length=50)),
+                ("summary", models.TextField()),
+                ("reviewed_through", models.DateTimeField(blank=True, null=True)),
+                ("version", models.PositiveIntegerField(default=1)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "coach",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="summaries",
+                        to="reviews.coach",
+                    ),
+                ),
+                (
+                    "school",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="summaries",
+                        to="schools.schools",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Review summary",
+                "verbose_name_plural": "Review summaries",
+                "constraints": [
+                    models.UniqueConstraint(
+                        condition=models.Q(("coach__isnull", False)),
+                        fields=("school", "sport", "coach"),
+                        name="unique_coach_summary",
+                    ),
+                    models.UniqueConstraint(
+                        condition=models.Q(("coach__isnull", True)),
+                        fields=("school", "sport"),
+                        name="unique_program_summary",
+                    ),
+                ],
+            },
+        ),
+    ]
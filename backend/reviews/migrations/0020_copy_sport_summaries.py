@@ -0,0 +1,80 @@
+from django.db import migrations
+from django.utils.dateparse import parse_datetime
+
+SPORT_DISPLAY_TO_CODE = {
+    "Men's Basketball": "mbb",
+    "Women's Basketball": "wbb",
+    "Football": "fb",
+}
+
+
+def _normalize(name):
+    return " ".join(name.strip().lower().split()) if name else ""
+
+
+def copy_sport_summaries(apps, schema_editor):
+    """
+    Copy the summaries cached in ``Schools.sport_summaries`` into
+    ReviewSummary rows. Coaches are only seeded after migrating, so missing
+    ones are created here and filled in by the seed.
+    """
+    Schools = apps.get_model("schools", "Schools")
+    Coach = apps.get_model("reviews", "Coach")
+    ReviewSummary = apps.get_model("reviews", "ReviewSummary")
+
+    coaches = {
+        (coach.sport, coach.normalized_name): coach.id
+        for coach in Coach.objects.only("id", "sport", "normalized_name")
+    }
+    rows = []
+    for school in Schools.objects.exclude(sport_summaries={}).only(
+        "id", "sport_summaries", "sport_review_dates"
+    ):
+        if not isinstance(school.sport_summaries, dict):
+            continue
+        review_dates = school.sport_review_dates or {}
+        for sport, summaries in school.sport_summaries.items():
+            if not isinstance(summaries, dict):
+                continue
+            dates = review_dates.get(sport)
+            dates = dates if isinstance(dates, dict) else {}
+            code = SPORT_DISPLAY_TO_CODE.get(sport, sport)
+            for key, summary in summaries.items():
+                if not summary:
+                    continue
+                if key == "general_summary":
+                    coach_id = None
+                else:
+                    coach_key = (code, _normalize(key))
+                    if coach_key not in coaches:
+                        coaches[coach_key] = Coach.objects.create(
+                            name=" ".join(key.split()),
+                            normalized_name=coach_key[1],
+                            sport=code,
+                        ).id
+                    coach_id = coaches[coach_key]
+                reviewed_through = dates.get(key)
+                rows.append(
+                    ReviewSummary(
+                        school_id=school.id,
+                        sport=code,
+                        coach_id=coach_id,
+                        summary=summary,
+                        reviewed_through=(
+                            parse_datetime(reviewed_through)
+                            if isinstance(reviewed_through, str)
+                            else None
+                        ),
+                    )
+                )
+    ReviewSummary.objects.bulk_create(rows, batch_size=1000, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("reviews", "0019_reviewsummary"),
+    ]
+
+    operations = [
+        migrations.RunPython(copy_sport_summaries, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reviews", "0020_copy_sport_summaries"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ReviewChunkSummary",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("content_hash", models.CharField(max_length=64, unique=True)),
+                ("summary", models.TextField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+    ]
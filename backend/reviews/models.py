@@ -1,16 +1,177 @@
-from django.db import models
+from django.db import IntegrityError, models, transaction
 from django.conf import settings
+from django.utils import timezone
 from schools.models import Schools
 from users.models import Users
+from .sports import sport_code
 import uuid
 
 
+def normalize_coach_name(name):
+    """Collapse whitespace and lowercase a coach name for duplicate checks."""
+    return " ".join(name.strip().lower().split()) if name else ""
+
+
+def standardize_coach_name(name):
+    """Standardize coach name capitalization (e.g., 'jan JENSEN' -> 'Jan Jensen')."""
+    return " ".join(word.capitalize() for word in name.split())
+
+
+class CoachManager(models.Manager):
+    def resolve(self, name, sport):
+        """Return the coach for a review's coach name and sport, creating it if new."""
+        return self.resolve_many([(name, sport)])[
+            (sport_code(sport), normalize_coach_name(name))
+        ]
+
+    def resolve_many(self, names):
+        """
+        Resolve ``(name, sport)`` pairs in bulk.
+
+        Returns a dict keyed by ``(sport_code, normalized_name)``; coaches that
+        don't exist yet (e.g. not in the tenure fixtures) are created bare.
+        """
+        wanted = {}
+        for name, sport in names:
+            key = (sport_code(sport), normalize_coach_name(name))
+            wanted.setdefault(key, standardize_coach_name(name))
+        if not wanted:
+            return {}
+
+        def lookup():
+            return {
+                (coach.sport, coach.normalized_name): coach
+                for coach in self.filter(
+                    sport__in={sport for sport, _ in wanted},
+                    normalized_name__in={normalized for _, normalized in wanted},
+                )
+                if (coach.sport, coach.normalized_name) in wanted
+            }
+
+        found = lookup()
+        missing = [
+            self.model(
+                sport=sport,
+                normalized_name=normalized,
+                name=wanted[(sport, normalized)],
+            )
+            for sport, normalized in wanted.keys() - found.keys()
+        ]
+        if missing:
+            # Another request may create the same coach concurrently
+            self.bulk_create(missing, ignore_conflicts=True)
+            found = lookup()
+        return found
+
+
+class Coach(models.Model):
+    name = models.CharField(max_length=100)
+    normalized_name = models.CharField(max_length=100)
+    sport = models.CharField(max_length=50)
+    tenure = models.TextField(blank=True, default="")
+    current_school = models.ForeignKey(
+        Schools,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="current_coaches",
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = CoachManager()
+
+    class Meta:
+        verbose_name = "Coach"
+        verbose_name_plural = "Coaches"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["sport", "normalized_name"], name="unique_coach_per_sport"
+            ),
+        ]
+
+    def is_at_school(self, school):
+        return (
+            self.current_school_id is not None and self.current_school_id == school.id
+        )
+
+    def __str__(self):
+        return f"{self.name} ({self.sport})"
+
+
+class ReviewsQuerySet(models.QuerySet):
+    # The columns ReviewsSerializer reads
+    LISTING_FIELDS = (
+        "id",
+        "review_id",
+        "school_id",
+        "sport",
+        "head_coach_name",
+        "review_message",
+        "head_coach",
+        "assistant_coaches",
+        "team_culture",
+        "campus_life",
+        "athletic_facilities",
+        "athletic_department",
+        "player_development",
+        "nil_opportunity",
+        "created_at",
+        "updated_at",
+        "coach_no_longer_at_university",
+        "coach_history",
+        "school__school_name",
+        "user__id",
+        "user__is_school_verified",
+        "user__profile_picture",
+    )
+
+    def for_listing(self, user=None):
+        """
+        Reviews ready for ``ReviewsSerializer``: school and author joined in,
+        only the serialized columns loaded, and vote counts and ``user``'s own
+        vote annotated, so serializing any number of them is one query.
+        """
+        if user is not None and user.is_authenticated:
+            user_vote = models.Subquery(
+                ReviewVote.objects.filter(
+                    review=models.OuterRef("pk"), user=user
+                ).values("vote")[:1]
+            )
+        else:
+            user_vote = models.Value(None, output_field=models.IntegerField())
+        reviews = self
+        if not reviews.query.order_by:
+            # Meta.ordering doesn't apply to queries with aggregates
+            reviews = reviews.order_by(*self.model._meta.ordering)
+        return (
+            reviews.select_related("school", "user")
+            .only(*self.LISTING_FIELDS)
+            .annotate(
+                helpful_count=models.Count("votes", filter=models.Q(votes__vote=1)),
+                unhelpful_count=models.Count("votes", filter=models.Q(votes__vote=0)),
+                user_vote=user_vote,
+            )
+        )
+
+
 class Reviews(models.Model):
     review_id = models.UUIDField(default=uuid.uuid4, editable=False)
     school = models.ForeignKey(Schools, on_delete=models.CASCADE)
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     sport = models.CharField(max_length=50)
     head_coach_name = models.CharField(max_length=100)
+    # Lowercased, whitespace-collapsed copy of head_coach_name, kept in sync on
+    # save so duplicate detection is an index lookup instead of a regex scan
+    head_coach_name_normalized = models.CharField(
+        max_length=100, blank=True, default="", editable=False
+    )
+    coach = models.ForeignKey(
+        Coach,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="reviews",
+    )
     review_message = models.TextField()
     head_coach = models.IntegerField()
     assistant_coaches = models.IntegerField()
@@ -25,11 +186,35 @@ class Reviews(models.Model):
     coach_no_longer_at_university = models.BooleanField(default=False)
     coach_history = models.CharField(max_length=255, blank=True, null=True)
 
+    objects = ReviewsQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Review"
         verbose_name_plural = "Reviews"
         ordering = ["-created_at"]
-        unique_together = ["school", "user", "head_coach_name", "sport"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["school", "user", "sport", "head_coach_name_normalized"],
+                name="unique_review_per_normalized_coach",
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        self.head_coach_name_normalized = normalize_coach_name(self.head_coach_name)
+        if self.head_coach_name and (
+            self.coach_id is None
+            or self.coach.normalized_name != self.head_coach_name_normalized
+            or self.coach.sport != sport_code(self.sport)
+        ):
+            self.coach = Coach.objects.resolve(self.head_coach_name, self.sport)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "head_coach_name" in update_fields:
+            kwargs["update_fields"] = {
+                *update_fields,
+                "head_coach_name_normalized",
+                "coach",
+            }
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return f"Review by {self.user} for {self.school} - {self.sport}"
@@ -59,3 +244,109 @@ class ReviewVote(models.Model):
 
     def __str__(self):
         return f"{self.user} voted {self.get_vote_display()} on {self.review}"
+
+
+class ReviewSummaryManager(models.Manager):
+    def store(
+        self, school, sport, coach, summary, reviewed_through, expected_version=None
+    ):
+        """
+        Write one summary row with a single narrow UPDATE (or an INSERT for a
+        new key), bumping its version.
+
+        With ``expected_version`` the write only happens if the row is still at
+        that version (``0`` means the row must not exist yet), so a slow writer
+        can't overwrite a newer summary. Returns whether the write happened.
+        """
+        rows = self.filter(school=school, sport=sport, coach=coach)
+        if expected_version != 0:
+            if expected_version is not None:
+                rows = rows.filter(version=expected_version)
+            updated = rows.update(
+                summary=summary,
+                reviewed_through=reviewed_through,
+                version=models.F("version") + 1,
+                updated_at=timezone.now(),
+            )
+            if updated:
+                return True
+            if expected_version is not None:
+                return False
+        try:
+            with transaction.atomic():
+                self.create(
+                    school=school,
+                    sport=sport,
+                    coach=coach,
+                    summary=summary,
+                    reviewed_through=reviewed_through,
+                )
+            return True
+        except IntegrityError:
+            if expected_version is not None:
+                return False
+            # Created concurrently; overwrite it like any other update
+            return self.store(school, sport, coach, summary, reviewed_through)
+
+
+class ReviewSummary(models.Model):
+    """
+    Generated summary for one school and sport: a coach summary, or the
+    program overview when ``coach`` is null.
+    """
+
+    school = models.ForeignKey(
+        Schools, on_delete=models.CASCADE, related_name="summaries"
+    )
+    sport = models.CharField(max_length=50)
+    coach = models.ForeignKey(
+        Coach,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="summaries",
+    )
+    summary = models.TextField()
+    # created_at of the newest review the summary covers; null forces a rebuild
+    reviewed_through = models.DateTimeField(null=True, blank=True)
+    version = models.PositiveIntegerField(default=1)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = ReviewSummaryManager()
+
+    class Meta:
+        verbose_name = "Review summary"
+        verbose_name_plural = "Review summaries"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["school", "sport", "coach"],
+                condition=models.Q(coach__isnull=False),
+                name="unique_coach_summary",
+            ),
+            models.UniqueConstraint(
+                fields=["school", "sport"],
+                condition=models.Q(coach__isnull=True),
+                name="unique_program_summary",
+            ),
+        ]
+
+    def is_stale(self, latest_review_at):
+        return self.reviewed_through is None or self.reviewed_through < latest_review_at
+
+    def __str__(self):
+        subject = self.coach.name if self.coach else "Program overview"
+        return f"{subject} summary for {self.school} - {self.sport}"
+
+
+class ReviewChunkSummary(models.Model):
+    """
+    Cached summary of one fixed-size chunk of reviews, keyed by a hash of the
+    exact prompt, so unchanged chunks are never summarized twice.
+    """
+
+    content_hash = models.CharField(max_length=64, unique=True)
+    summary = models.TextField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"Chunk summary {self.content_hash[:12]}"
@@ -0,0 +1,13 @@
+from rest_framework.permissions import BasePermission
+
+
+class IsAdminRole(BasePermission):
+    """Allow superusers and accounts whose ``role`` is ``admin``."""
+
+    def has_permission(self, request, view):
+        user = request.user
+        return bool(
+            user
+            and user.is_authenticated
+            and (user.is_superuser or getattr(user, "role", "") == "admin")
+        )
@@ -0,0 +1,107 @@
+"""
+Prompt building for review summaries.
+
+Each review appears at most once, tagged with the aspects it mentions, and
+reviews are added most-helpful and newest first until the token budget
+(``settings.SUMMARY_PROMPT_TOKEN_BUDGET``) is spent.
+"""
+
+import math
+from dataclasses import dataclass
+
+from django.conf import settings
+
+# Rough size of an English token for GPT models; close enough for budgeting
+CHARS_PER_TOKEN = 4
+
+GENERAL_ASPECTS = [
+    ("Athletic Facilities", ("facilities",)),
+    ("NIL Opportunities", ("nil",)),
+    ("Campus Life", ("campus",)),
+    ("Athletic Department", ("department",)),
+    ("Team Culture", ("culture",)),
+]
+
+
+def coach_aspects(coach_name):
+    return [
+        ("Head Coach Performance", (coach_name.lower(),)),
+        ("Coaching Style", ("coach",)),
+        ("Player Development", ("development",)),
+    ]
+
+
+def estimate_tokens(text):
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+@dataclass
+class Prompt:
+    text: str
+    tokens: int
+    included: int
+    total: int
+
+    @property
+    def dropped(self):
+        return self.total - self.included
+
+
+def rank_reviews(reviews):
+    """Most helpful first, newest first among equally helpful reviews."""
+    return sorted(
+        reviews,
+        key=lambda review: (getattr(review, "helpful_votes", 0), review.created_at),
+        reverse=True,
+    )
+
+
+def _review_line(message, aspects):
+    if aspects is None:
+        return " ".join(message.split())
+    lowered = message.lower()
+    labels = [
+        label
+        for label, keywords in aspects
+        if any(keyword in lowered for keyword in keywords)
+    ]
+    if not labels:
+        return None
+    return f"[{', '.join(labels)}] {' '.join(message.split())}"
+
+
+def build_prompt(reviews, aspects, budget=None, ranked=True):
+    """
+    Build the user prompt for ``reviews`` from the ones mentioning ``aspects``,
+    or from every review, untagged, when ``aspects`` is None.
+
+    Duplicate messages are dropped and lines that would exceed the budget are
+    skipped; the best-ranked line is truncated rather than dropped so the
+    prompt is never empty while a relevant review exists. With ``ranked`` off
+    the reviews keep their given order.
+    """
+    budget = settings.SUMMARY_PROMPT_TOKEN_BUDGET if budget is None else budget
+    lines, seen, used, total = [], set(), 0, 0
+    for review in rank_reviews(reviews) if ranked else reviews:
+        key = " ".join(review.review_message.lower().split())
+        if key in seen:
+            continue
+        seen.add(key)
+        line = _review_line(review.review_message, aspects)
+        if line is None:
+            continue
+        total += 1
+        # +1 for the newline joining the lines
+        cost = estimate_tokens(line) + (1 if lines else 0)
+        if used + cost > budget:
+            if lines:
+                continue
+            line = line[: budget * CHARS_PER_TOKEN]
+            cost = estimate_tokens(line)
+        lines.append(line)
+        used += cost
+
+    text = "\n".join(lines)
+    return Prompt(
+        text=text, tokens=estimate_tokens(text), included=len(lines), total=total
+    )
@@ -1,6 +1,8 @@
 from rest_framework import serializers
-from .models import Reviews, ReviewVote
+from .models import Reviews, ReviewVote, normalize_coach_name
+from .sports import SPORT_CODE_TO_DISPLAY, SPORT_DISPLAY_TO_CODE
 from users.models import Users
+from config.instrumentation import TimedSerializerMixin
 import logging
 
 logger = logging.getLogger(__name__)
@@ -18,7 +20,7 @@ class ReviewVoteSerializer(serializers.ModelSerializer):
         fields = ("review", "vote")
 
 
-class ReviewsSerializer(serializers.ModelSerializer):
+class ReviewsSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     school_name = serializers.ReadOnlyField(source="school.school_name")
     user = ReviewUserSerializer(read_only=True)
 
@@ -28,42 +30,21 @@ class ReviewsSerializer(serializers.ModelSerializer):
 
     def validate_sport(self, value):
         # Convert display names to database codes
-        sport_mapping = {
-            "Men's Basketball": "mbb",
-            "Men’s Basketball": "mbb",  # Handle both apostrophe types
-            "Women's Basketball": "wbb",
-            "Women’s Basketball": "wbb",  # Handle both apostrophe types
-            "Football": "fb",
-            "Volleyball": "vb",
-            "Baseball": "ba",
-            "Men's Soccer": "msoc",
-            "Men’s Soccer": "msoc",
-            "Women's Soccer": "wsoc",
-            "Women’s Soccer": "wsoc",
-            "Wrestling": "wr",
-        }
-        logger.info(f"ReviewsSerializer.validate_sport: Converting '{value}' to code")
-        code = sport_mapping.get(value, value)
-        logger.info(f"ReviewsSerializer.validate_sport: Converted to '{code}'")
+        code = SPORT_DISPLAY_TO_CODE.get(value, value)
+        logger.debug(
+            "ReviewsSerializer.validate_sport: Converted '%s' to '%s'", value, code
+        )
         return code
 
     def to_representation(self, instance):
         # Convert database codes back to display names when sending response
         data = super().to_representation(instance)
-        display_mapping = {
-            "mbb": "Men's Basketball",
-            "wbb": "Women's Basketball",
-            "fb": "Football",
-            "vb": "Volleyball",
-            "ba": "Baseball",
-            "msoc": "Men's Soccer",
-            "wsoc": "Women's Soccer",
-            "wr": "Wrestling",
-        }
         original_sport = data["sport"]
-        data["sport"] = display_mapping.get(data["sport"], data["sport"])
-        logger.info(
-            f"ReviewsSerializer.to_representation: Converting sport from '{original_sport}' to '{data['sport']}'"
+        data["sport"] = SPORT_CODE_TO_DISPLAY.get(data["sport"], data["sport"])
+        logger.debug(
+            "ReviewsSerializer.to_representation: Converted sport from '%s' to '%s'",
+            original_sport,
+            data["sport"],
         )
         return data
 
@@ -71,29 +52,20 @@ class ReviewsSerializer(serializers.ModelSerializer):
         """
         Validate the review data
         """
-
-        # Normalize coach name for duplicate check
-        def normalize_name(name):
-            return " ".join(name.strip().lower().split()) if name else ""
-
         user = self.context["request"].user
         school = data.get("school")
         head_coach_name = data.get("head_coach_name")
         sport = data.get("sport")
 
-        normalized_coach_name = normalize_name(head_coach_name)
+        normalized_coach_name = normalize_coach_name(head_coach_name)
 
         # Check for duplicate review for this user, school, sport, and normalized coach name
-        existing_review = (
-            Reviews.objects.filter(user=user, school=school, sport=sport)
-            .extra(
-                where=[
-                    "LOWER(TRIM(REGEXP_REPLACE(head_coach_name, '\\s+', ' ', 'g'))) = %s"
-                ],
-                params=[normalized_coach_name],
-            )
-            .exists()
-        )
+        existing_review = Reviews.objects.filter(
+            user=user,
+            school=school,
+            sport=sport,
+            head_coach_name_normalized=normalized_coach_name,
+        ).exists()
 
         if existing_review:
             raise serializers.ValidationError(
@@ -114,6 +86,9 @@ class ReviewsSerializer(serializers.ModelSerializer):
         return data
 
     def get_my_vote(self, obj):
+        # Annotated by Reviews.objects.for_listing()
+        if hasattr(obj, "user_vote"):
+            return obj.user_vote
         user = self.context["request"].user
         if not user.is_authenticated:
             return None
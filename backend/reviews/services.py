@@ -1,16 +1,31 @@
 import os
 import json
 import logging
+from functools import lru_cache
 from pathlib import Path
-from openai import OpenAI
-from dotenv import load_dotenv
 
-# Set up logging to always show info level messages
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Load API key from .env
-load_dotenv()
+
+@lru_cache(maxsize=None)
+def read_coach_fixture(filename):
+    """Read a tenure fixture once per process; every service instance shares it."""
+    fixtures_path = Path(__file__).parent / "fixtures" / filename
+    with open(fixtures_path, "r") as file:
+        return json.load(file)
+
+
+# Normalized coach name -> tenure entry per sport, shared by every service in
+# the process (see CoachSearchService._tenure_index)
+_tenure_indexes = {}
+
+
+def preload_tenure_indexes():
+    """Build the tenure indexes now rather than on the first coach lookup."""
+    service = CoachSearchService()
+    for sport_code in ("mbb", "wbb"):
+        service._tenure_index(sport_code)
+    return sum(len(index) for index in _tenure_indexes.values())
 
 
 class CoachSearchService:
@@ -31,10 +46,7 @@ class CoachSearchService:
 
     def _load_coach_data(self, filename):
         try:
-            # Get the absolute path to the fixtures directory
-            fixtures_path = Path(__file__).parent / "fixtures" / filename
-            with open(fixtures_path, "r") as file:
-                return json.load(file)
+            return read_coach_fixture(filename)
         except Exception as e:
             logger.error(f"Error loading coach data from {filename}: {str(e)}")
             return []
@@ -90,40 +102,53 @@ class CoachSearchService:
 
         return [normalized]
 
+    def _tenure_index(self, sport_code):
+        """Map normalized coach name -> tenure for the sport's data set.
+
+        Built once per process and shared by every service instance, so
+        lookups are a dict hit instead of re-normalizing every coach in the
+        fixture.
+        """
+        key = "wbb" if sport_code == "wbb" else "mbb"
+        if key not in _tenure_indexes:
+            coach_data = self.wbb_coach_data if key == "wbb" else self.mbb_coach_data
+            index = {}
+            for coach in coach_data:
+                # Keep the first match, like the linear search this replaces
+                index.setdefault(self._normalize_name(coach["person"])[0], coach)
+            if not coach_data:
+                # The fixture failed to load; try again next time
+                return index
+            _tenure_indexes[key] = index
+        return _tenure_indexes[key]
+
     def search_coach_history(self, coach_name, school_name=None, sport=None):
         try:
             if not coach_name:
                 return "", None
 
-            logger.info(
-                f"Starting tenure search for coach: {coach_name} (sport: {sport})"
+            logger.debug(
+                "Starting tenure search for coach: %s (sport: %s)", coach_name, sport
             )
 
             # Convert sport to code and select the appropriate coach data
             sport_code = self._convert_sport_to_code(sport)
-            logger.info(f"Converted sport '{sport}' to code '{sport_code}'")
-
-            if sport_code == "wbb":
-                coach_data = self.wbb_coach_data
-                logger.info("Using women's basketball coach data")
-            else:  # Default to men's basketball
-                coach_data = self.mbb_coach_data
-                logger.info("Using men's basketball coach data")
+            logger.debug("Converted sport '%s' to code '%s'", sport, sport_code)
 
             # Normalize the search name
             search_name = self._normalize_name(coach_name)[
                 0
             ]  # Take first normalized form
 
-            # Search for the coach in the data
-            for coach in coach_data:
-                if self._normalize_name(coach["person"])[0] == search_name:
-                    history = coach["tenure"]
-                    logger.info(f"Found tenure history for {coach_name}: {history}")
-                    return history, None
+            # Look the coach up in the normalized-name index
+            coach = self._tenure_index(sport_code).get(search_name)
+            if coach is not None:
+                history = coach["tenure"]
+                logger.debug("Found tenure history for %s: %s", coach_name, history)
+                return history, None
 
             # If coach not found in database, return "No tenure found"
-            logger.info(f"No tenure found in database for {coach_name}")
+            logger.debug("No tenure found in database for %s", coach_name)
             return "No tenure found", None
 
         except Exception as e:
@@ -0,0 +1,14 @@
+from django.db.models.signals import post_migrate
+from django.dispatch import receiver
+from reviews.coaches import seed_coaches
+from reviews.models import Coach
+
+
+@receiver(post_migrate)
+def load_initial_coaches(sender, **kwargs):
+    # Runs after the schools app has loaded its fixtures, so current schools resolve
+    if sender.name == "reviews":
+        # Migrations may create bare coaches (0020), so look for seeded tenure
+        if not Coach.objects.exclude(tenure="").exists():
+            print("Seeding coaches from tenure fixtures...")
+            seed_coaches()
@@ -0,0 +1,32 @@
+# Display names (as sent by the review form) -> database sport codes
+SPORT_DISPLAY_TO_CODE = {
+    "Men's Basketball": "mbb",
+    "Men’s Basketball": "mbb",  # Handle both apostrophe types
+    "Women's Basketball": "wbb",
+    "Women’s Basketball": "wbb",  # Handle both apostrophe types
+    "Football": "fb",
+    "Volleyball": "vb",
+    "Baseball": "ba",
+    "Men's Soccer": "msoc",
+    "Men’s Soccer": "msoc",
+    "Women's Soccer": "wsoc",
+    "Women’s Soccer": "wsoc",
+    "Wrestling": "wr",
+}
+
+# Database sport codes -> display names (as sent back to the frontend)
+SPORT_CODE_TO_DISPLAY = {
+    "mbb": "Men's Basketball",
+    "wbb": "Women's Basketball",
+    "fb": "Football",
+    "vb": "Volleyball",
+    "ba": "Baseball",
+    "msoc": "Men's Soccer",
+    "wsoc": "Women's Soccer",
+    "wr": "Wrestling",
+}
+
+
+def sport_code(sport):
+    """Return the database code for a sport display name (codes pass through)."""
+    return SPORT_DISPLAY_TO_CODE.get(sport, sport)
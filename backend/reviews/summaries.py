@@ -0,0 +1,778 @@
+"""
+Generation and storage of the AI review summaries shown on school pages.
+
+Summaries live in ``ReviewSummary``, one row per (school, sport, coach) plus a
+program overview row with no coach. A row is stale once a review newer than its
+``reviewed_through`` exists; new reviews never have to touch stored summaries.
+
+Programs whose reviews don't fit one prompt are summarized map-reduce style:
+chronological chunks of reviews are summarized in parallel, each chunk summary
+is cached by a hash of its prompt, and the chunk summaries are reduced into the
+final summary. A new review only changes the last chunk.
+
+Independent summaries (the overview and each stale coach) are generated
+concurrently as ``SummaryJob``s. Jobs touch the database only on the calling
+thread, before and after the model calls. All the model calls of a request or
+refresh batch, chunk summaries included, share one thread pool sized to the
+gateway's cap on calls in flight.
+
+Regeneration is single-flight per (school, sport): one worker holds an advisory
+lock and calls the model while concurrent requests wait briefly for its result,
+then fall back to whatever is stored.
+
+``abuild_review_summary`` is the same flow for async views: database work runs
+in the request's sync thread and the model calls are awaited on the event loop.
+"""
+
+import asyncio
+import contextvars
+import hashlib
+import logging
+import time
+import zlib
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import ExitStack, asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connection
+from django.db.models import Count, Max, Q
+
+from . import llm
+from .models import ReviewChunkSummary, Reviews, ReviewSummary
+from .prompts import GENERAL_ASPECTS, build_prompt, coach_aspects, estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+CODE_TO_DISPLAY = {
+    "mbb": "Men's Basketball",
+    "wbb": "Women's Basketball",
+    "fb": "Football",
+}
+
+BASKETBALL_SPORTS = ["Men's Basketball", "Women's Basketball", "mbb", "wbb"]
+
+LOCK_POLL_INTERVAL = 0.1
+
+MAP_SYSTEM_PROMPT = (
+    "You condense one batch of reviews into notes for a final summary. The "
+    'final summary\'s instructions are: "{task}" Reply with the key points '
+    "from this batch in at most 4 sentences."
+)
+REDUCE_HEADER = "Summaries of review batches, oldest first:"
+
+COMPLETION_OPTIONS = {
+    "max_tokens": 250,
+    "temperature": 0.7,
+    "presence_penalty": 0.6,
+    "frequency_penalty": 0.6,
+}
+
+
+def coach_tenure_parts(coach, school, sport):
+    """Tenure lines and the "no longer at this school" flag for a coach summary."""
+    parts = []
+    if coach.tenure:
+        parts.extend(["Tenure:", coach.tenure])
+        # Only check if coach is no longer at school for basketball coaches
+        if sport in BASKETBALL_SPORTS and not coach.is_at_school(school):
+            parts.append("*No longer at this school*")
+    elif sport in BASKETBALL_SPORTS:
+        # Only show no tenure message for basketball coaches
+        parts.append("*No longer at this school*")
+    return parts
+
+
+def group_reviews_by_coach(reviews):
+    """Map coach id to its coach and reviews, keeping newest-first order."""
+    coach_reviews = {}
+    for review in reviews:
+        if review.coach_id not in coach_reviews:
+            coach_reviews[review.coach_id] = {"coach": review.coach, "reviews": []}
+        coach_reviews[review.coach_id]["reviews"].append(review)
+    return coach_reviews
+
+
+def general_system_prompt(display_sport):
+    return f"You are a helpful assistant that summarizes general aspects of {display_sport} programs (excluding coach-specific information). Focus on athletic facilities, NIL opportunities, campus life, athletic department support, and team culture. Provide a concise 2-3 sentence summary that captures the overall sentiment about these aspects from the reviews."
+
+
+def coach_system_prompt(display_sport, coach_name):
+    return f"You are a helpful assistant that summarizes {display_sport} program reviews for {coach_name}. Provide a concise summary in exactly 2 sentences, focusing on coaching style, player development, and overall coaching performance. Always talk about it from a reviews perspective, like 'reviewers state...' or 'according to reviews...', and always refer to the coach by their actual name ('{coach_name}'). Focus only on coach-specific aspects."
+
+
+def _lock_key(school_id, sport):
+    # One signed bigint: the school id in the high half, the sport's CRC below
+    return ((school_id & 0x7FFFFFFF) << 32) | zlib.crc32(sport.encode())
+
+
+def _locks_supported():
+    # Session-level locks need a dedicated server connection
+    return (
+        connection.vendor == "postgresql" and not settings.PGBOUNCER_TRANSACTION_POOLING
+    )
+
+
+def _try_lock(key):
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_try_advisory_lock(%s)", [key])
+        return cursor.fetchone()[0]
+
+
+def _unlock(key):
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_advisory_unlock(%s)", [key])
+
+
+@contextmanager
+def summary_lock(school_id, sport, wait=None):
+    """
+    Single-flight guard around generating one school and sport's summaries.
+
+    Yields True once this connection holds a session-level advisory lock, or
+    False if another worker still holds it after ``wait`` seconds (defaults to
+    ``settings.SUMMARY_LOCK_WAIT``).
+    """
+    if not _locks_supported():
+        yield True
+        return
+
+    wait = settings.SUMMARY_LOCK_WAIT if wait is None else wait
+    key = _lock_key(school_id, sport)
+    deadline = time.monotonic() + wait
+    while not (acquired := _try_lock(key)) and time.monotonic() < deadline:
+        time.sleep(LOCK_POLL_INTERVAL)
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            _unlock(key)
+
+
+@asynccontextmanager
+async def asummary_lock(school_id, sport, wait=None):
+    """``summary_lock`` for async code; waits without blocking the event loop."""
+    if not _locks_supported():
+        yield True
+        return
+
+    wait = settings.SUMMARY_LOCK_WAIT if wait is None else wait
+    key = _lock_key(school_id, sport)
+    deadline = time.monotonic() + wait
+    # Session-level locks: the thread-sensitive executor keeps every call on
+    # the request's own connection
+    while (
+        not (acquired := await sync_to_async(_try_lock)(key))
+        and time.monotonic() < deadline
+    ):
+        await asyncio.sleep(LOCK_POLL_INTERVAL)
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            await sync_to_async(_unlock)(key)
+
+
+def _messages(system_prompt, user_content):
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_content},
+    ]
+
+
+def _complete(system_prompt, user_content):
+    return llm.complete(_messages(system_prompt, user_content), **COMPLETION_OPTIONS)
+
+
+async def _acomplete(system_prompt, user_content):
+    return await llm.acomplete(
+        _messages(system_prompt, user_content), **COMPLETION_OPTIONS
+    )
+
+
+def _content_hash(system_prompt, text):
+    return hashlib.sha256(f"{system_prompt}\n\n{text}".encode()).hexdigest()
+
+
+def _chunked(items, size):
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def _attempt(system_prompt, user_content):
+    """The completion, or the ``LLMUnavailable`` it raised."""
+    try:
+        return _complete(system_prompt, user_content)
+    except llm.LLMUnavailable as e:
+        return e
+
+
+def _run_jobs(jobs):
+    """
+    Run the model calls of ``jobs`` in one bounded thread pool, returning
+    each job's summary or the ``LLMUnavailable`` it raised, in order.
+
+    A job's calls depend on the previous round's results, so each job is
+    advanced as soon as its own round finishes rather than in lockstep.
+    """
+    results = [None] * len(jobs)
+    steps = [job.steps() for job in jobs]
+    rounds = {}
+    waiting = {}
+
+    def advance(pool, index, sent):
+        prompts = []
+        while not prompts:
+            try:
+                prompts = steps[index].send(sent)
+            except StopIteration as done:
+                results[index] = done.value
+                return
+            except llm.LLMUnavailable as e:
+                results[index] = e
+                return
+            sent = []
+        rounds[index] = {"results": [None] * len(prompts), "left": len(prompts)}
+        for position, prompt in enumerate(prompts):
+            # Each call keeps the request's context, e.g. its timings
+            future = pool.submit(contextvars.copy_context().run, _attempt, *prompt)
+            waiting[future] = (index, position)
+
+    if not jobs:
+        return results
+    with ThreadPoolExecutor(max_workers=settings.LLM_MAX_CONCURRENCY) as pool:
+        for index in range(len(jobs)):
+            advance(pool, index, None)
+        while waiting:
+            finished, _ = wait(waiting, return_when=FIRST_COMPLETED)
+            for future in finished:
+                index, position = waiting.pop(future)
+                round_ = rounds[index]
+                round_["results"][position] = future.result()
+                round_["left"] -= 1
+                if not round_["left"]:
+                    del rounds[index]
+                    advance(pool, index, round_["results"])
+    return results
+
+
+async def _arun(job):
+    """Drive one job's ``steps()`` with calls gathered on the running loop."""
+    steps = job.steps()
+    sent = None
+    while True:
+        try:
+            prompts = steps.send(sent)
+        except StopIteration as done:
+            return done.value
+        sent = await asyncio.gather(
+            *(_acomplete(*prompt) for prompt in prompts), return_exceptions=True
+        )
+        for result in sent:
+            if isinstance(result, BaseException) and not isinstance(
+                result, llm.LLMUnavailable
+            ):
+                raise result
+
+
+async def _arun_jobs(jobs):
+    """``_run_jobs`` for async views, gathered on the running loop."""
+    results = await asyncio.gather(
+        *(_arun(job) for job in jobs), return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, BaseException) and not isinstance(
+            result, llm.LLMUnavailable
+        ):
+            raise result
+    return results
+
+
+class SummaryJob:
+    """
+    One summary to generate from a set of reviews.
+
+    Create and ``save()`` the job on the request thread. ``steps()`` only
+    calls the model, through ``_run_jobs`` on a thread pool or ``_arun_jobs``
+    on an event loop.
+    """
+
+    def __init__(self, system_prompt, reviews, aspects, subject):
+        self.system_prompt = system_prompt
+        self.prompt_text = None
+        self.chunks = []
+        self.cached = {}
+        self.generated = {}
+
+        prompt = build_prompt(reviews, aspects)
+        if not prompt.included:
+            # Nothing mentions the aspects; let the model see the reviews as is
+            aspects = None
+            prompt = build_prompt(reviews, None)
+        logger.info(
+            f"Summary prompt for {subject}: {prompt.tokens} tokens, "
+            f"{prompt.included}/{prompt.total} reviews"
+        )
+        if not prompt.dropped:
+            self.prompt_text = prompt.text
+            return
+
+        # Oldest first, so new reviews only ever change the last chunk
+        self.map_prompt = MAP_SYSTEM_PROMPT.format(task=system_prompt)
+        chronological = sorted(
+            reviews, key=lambda review: (review.created_at, review.id)
+        )
+        for chunk in _chunked(chronological, settings.SUMMARY_CHUNK_SIZE):
+            text = build_prompt(chunk, aspects, ranked=False).text
+            if text:
+                self.chunks.append((_content_hash(self.map_prompt, text), text))
+        self.cached = dict(
+            ReviewChunkSummary.objects.filter(
+                content_hash__in=[content_hash for content_hash, _ in self.chunks]
+            ).values_list("content_hash", "summary")
+        )
+
+    def steps(self):
+        """
+        The job's model calls, as a generator: each round yields a list of
+        ``(system_prompt, text)`` prompts and is sent back their results,
+        text or ``LLMUnavailable``. Returns the summary, or raises the first
+        ``LLMUnavailable``. Run it with ``_run_jobs`` or ``_arun_jobs``.
+        """
+        if self.prompt_text is not None:
+            results = yield [(self.system_prompt, self.prompt_text)]
+            return self._raise_first(results)[0]
+
+        missing = self._missing()
+        self._record(
+            missing, (yield [(self.map_prompt, text) for text in missing.values()])
+        )
+        partials = self._partials()
+        # Condense further while the chunk summaries themselves are over budget
+        while self._over_budget(partials):
+            partials = self._raise_first(
+                (
+                    yield [
+                        (self.map_prompt, text)
+                        for text in self._condense_texts(partials)
+                    ]
+                )
+            )
+        results = yield [(self.system_prompt, self._reduce_text(partials))]
+        return self._raise_first(results)[0]
+
+    def _missing(self):
+        missing = {
+            content_hash: text
+            for content_hash, text in self.chunks
+            if content_hash not in self.cached
+        }
+        logger.info(
+            f"Summarizing {len(missing)} of {len(self.chunks)} review chunks "
+            f"({len(self.chunks) - len(missing)} cached)"
+        )
+        return missing
+
+    def _record(self, missing, results):
+        """Keep the chunk summaries that succeeded, then raise the first error."""
+        for content_hash, result in zip(missing, results):
+            if not isinstance(result, llm.LLMUnavailable):
+                self.generated[content_hash] = result
+        self._raise_first(results)
+
+    @staticmethod
+    def _raise_first(results):
+        for result in results:
+            if isinstance(result, llm.LLMUnavailable):
+                raise result
+        return results
+
+    def _partials(self):
+        summaries = {**self.cached, **self.generated}
+        return [summaries[content_hash] for content_hash, _ in self.chunks]
+
+    @staticmethod
+    def _over_budget(partials):
+        return (
+            len(partials) > 1
+            and settings.SUMMARY_CHUNK_SIZE > 1
+            and estimate_tokens("\n\n".join(partials))
+            > settings.SUMMARY_PROMPT_TOKEN_BUDGET
+        )
+
+    @staticmethod
+    def _condense_texts(partials):
+        return [
+            "\n\n".join(group)
+            for group in _chunked(partials, settings.SUMMARY_CHUNK_SIZE)
+        ]
+
+    @staticmethod
+    def _reduce_text(partials):
+        return "\n\n".join([REDUCE_HEADER, *partials])
+
+    def save(self):
+        """Cache the chunk summaries generated by ``run()``, even partial ones."""
+        if self.generated:
+            ReviewChunkSummary.objects.bulk_create(
+                [
+                    ReviewChunkSummary(content_hash=content_hash, summary=summary)
+                    for content_hash, summary in self.generated.items()
+                ],
+                ignore_conflicts=True,
+            )
+
+
+def _version(row):
+    return row.version if row is not None else 0
+
+
+def _coach_fallback(school, sport, coach, reviews):
+    """Basic fallback summary from the raw reviews."""
+    return "\n".join(
+        [
+            f"**{coach.name}**:",
+            *coach_tenure_parts(coach, school, sport),
+            "\n".join(
+                f"Review from {review.created_at.strftime('%Y-%m-%d')}: {review.review_message}"
+                for review in reviews
+            ),
+        ]
+    )
+
+
+def _prepare_jobs(school, sport, targets):
+    """One SummaryJob per target, built on the calling thread."""
+    display_sport = CODE_TO_DISPLAY.get(sport, sport)
+    jobs = []
+    for coach, reviews, _ in targets:
+        if coach is None:
+            jobs.append(
+                SummaryJob(
+                    general_system_prompt(display_sport),
+                    reviews,
+                    GENERAL_ASPECTS,
+                    f"{school.school_name} {sport}",
+                )
+            )
+        else:
+            logger.info(f"Generating new summary for {coach.name} due to new review")
+            jobs.append(
+                SummaryJob(
+                    coach_system_prompt(display_sport, coach.name),
+                    reviews,
+                    coach_aspects(coach.name),
+                    coach.name,
+                )
+            )
+    return jobs
+
+
+def _store_results(school, sport, targets, results):
+    """
+    Store generated summaries, or fall back for targets whose job failed.
+
+    Returns ``(texts, failures)`` where ``texts`` maps coach id (None for the
+    overview) to the text to show.
+    """
+    texts, failures = {}, 0
+    for (coach, reviews, row), result in zip(targets, results):
+        key = coach.id if coach else None
+        if isinstance(result, llm.LLMUnavailable):
+            failures += 1
+            subject = coach.name if coach else "general summary"
+            logger.error(f"Error generating summary for {subject}: {str(result)}")
+            if row is not None:
+                texts[key] = row.summary
+            elif coach is None:
+                texts[key] = ""
+            else:
+                # Stored without a reviewed_through so the next request tries again
+                texts[key] = _coach_fallback(school, sport, coach, reviews)
+                ReviewSummary.objects.store(
+                    school, sport, coach, texts[key], None, expected_version=0
+                )
+            continue
+
+        if coach is None:
+            texts[key] = result
+        else:
+            texts[key] = "\n".join(
+                [
+                    f"**{coach.name}**:",
+                    *coach_tenure_parts(coach, school, sport),
+                    result,
+                ]
+            )
+        ReviewSummary.objects.store(
+            school,
+            sport,
+            coach,
+            texts[key],
+            reviews[0].created_at,
+            expected_version=_version(row),
+        )
+    return texts, failures
+
+
+def _generate(school, sport, targets):
+    """
+    Regenerate and store summaries for ``targets``, a list of
+    ``(coach or None, reviews newest first, stored row or None)``, with the
+    model calls for all of them issued concurrently.
+    """
+    jobs = _prepare_jobs(school, sport, targets)
+    results = _run_jobs(jobs)
+    return _save_results(school, sport, targets, jobs, results)
+
+
+def _save_results(school, sport, targets, jobs, results):
+    for job in jobs:
+        job.save()
+    return _store_results(school, sport, targets, results)
+
+
+def _load_reviews(school, sport):
+    """Reviews newest first, each linked to its coach."""
+    reviews = list(
+        Reviews.objects.filter(school=school, sport=sport)
+        .select_related("coach")
+        .annotate(helpful_votes=Count("votes", filter=Q(votes__vote=1)))
+        .order_by("-created_at")
+    )
+    for review in reviews:
+        if review.coach is None:
+            # Reviews written before coaches existed get linked lazily
+            review.save(update_fields=["coach"])
+    return reviews
+
+
+def _stored_summaries(school, sport):
+    return {
+        row.coach_id: row
+        for row in ReviewSummary.objects.filter(school=school, sport=sport)
+    }
+
+
+def _is_stale(target):
+    _, reviews, row = target
+    return row is None or row.is_stale(reviews[0].created_at)
+
+
+def _page_targets(reviews, stored):
+    """The overview and the most recently reviewed coach."""
+    latest = group_reviews_by_coach(reviews)[reviews[0].coach_id]
+    return [
+        (None, reviews, stored.get(None)),
+        (latest["coach"], latest["reviews"], stored.get(reviews[0].coach_id)),
+    ]
+
+
+def _all_targets(reviews, stored):
+    """The overview and every reviewed coach."""
+    return [(None, reviews, stored.get(None))] + [
+        (data["coach"], data["reviews"], stored.get(coach_id))
+        for coach_id, data in group_reviews_by_coach(reviews).items()
+    ]
+
+
+def build_review_summary(school, sport):
+    """
+    Return the combined summary for a school's sport, regenerating the program
+    overview and the most recently reviewed coach when they are stale.
+
+    Other coaches only ever use summaries that are already stored.
+    """
+    display_sport = CODE_TO_DISPLAY.get(sport, sport)
+    reviews = _load_reviews(school, sport)
+    if not reviews:
+        return f"No reviews available for {display_sport} at {school.school_name} yet."
+
+    stored = _stored_summaries(school, sport)
+    stale = [target for target in _page_targets(reviews, stored) if _is_stale(target)]
+    # With the breaker open there is nothing to wait for: serve what we have.
+    # Deployments refreshing summaries in batch can turn request-time
+    # generation off entirely.
+    if not stale or not llm.available() or not settings.SUMMARY_GENERATE_ON_REQUEST:
+        return _compose(school, sport, reviews, stored, {})
+
+    with summary_lock(school.id, sport) as acquired:
+        # Another worker may have finished generating while we waited, even
+        # if it still held the lock when the wait ran out
+        stored = _stored_summaries(school, sport)
+        if not acquired:
+            logger.info(
+                f"Summary for {school.school_name} {sport} is being generated "
+                "elsewhere; serving the stored version"
+            )
+            return _compose(school, sport, reviews, stored, {})
+        stale = [
+            target for target in _page_targets(reviews, stored) if _is_stale(target)
+        ]
+        texts, _ = _generate(school, sport, stale) if stale else ({}, 0)
+        return _compose(school, sport, reviews, stored, texts)
+
+
+async def abuild_review_summary(school, sport):
+    """``build_review_summary`` for async views."""
+    display_sport = CODE_TO_DISPLAY.get(sport, sport)
+    reviews = await sync_to_async(_load_reviews)(school, sport)
+    if not reviews:
+        return f"No reviews available for {display_sport} at {school.school_name} yet."
+
+    stored = await sync_to_async(_stored_summaries)(school, sport)
+    stale = [target for target in _page_targets(reviews, stored) if _is_stale(target)]
+    if not stale or not llm.available() or not settings.SUMMARY_GENERATE_ON_REQUEST:
+        return _compose(school, sport, reviews, stored, {})
+
+    async with asummary_lock(school.id, sport) as acquired:
+        stored = await sync_to_async(_stored_summaries)(school, sport)
+        if not acquired:
+            logger.info(
+                f"Summary for {school.school_name} {sport} is being generated "
+                "elsewhere; serving the stored version"
+            )
+            return _compose(school, sport, reviews, stored, {})
+        stale = [
+            target for target in _page_targets(reviews, stored) if _is_stale(target)
+        ]
+        texts = {}
+        if stale:
+            jobs = await sync_to_async(_prepare_jobs)(school, sport, stale)
+            results = await _arun_jobs(jobs)
+            texts, _ = await sync_to_async(_save_results)(
+                school, sport, stale, jobs, results
+            )
+        return _compose(school, sport, reviews, stored, texts)
+
+
+@dataclass
+class RefreshResult:
+    regenerated: int = 0
+    failed: int = 0
+    skipped: int = 0
+    # ``(school_id, sport)`` pairs left with every summary stored and fresh
+    done: list = field(default_factory=list, compare=False)
+
+    def add(self, other):
+        self.regenerated += other.regenerated
+        self.failed += other.failed
+        self.skipped += other.skipped
+        self.done.extend(other.done)
+
+
+def refresh_batch(school_sports, force=False, wait=0):
+    """
+    Regenerate every stale summary (the overview and all coaches, not only the
+    most recently reviewed one) for a batch of ``(school, sport)`` pairs, with
+    the model calls for the whole batch issued concurrently. With ``force``
+    fresh summaries are regenerated too.
+
+    Pairs another worker is already generating are skipped. Only pairs whose
+    summaries were all stored are listed in the result's ``done``.
+    """
+    result = RefreshResult()
+    with ExitStack() as locks:
+        work = []
+        for school, sport in school_sports:
+            reviews = _load_reviews(school, sport)
+            if not reviews:
+                result.done.append((school.id, sport))
+                continue
+            if not locks.enter_context(summary_lock(school.id, sport, wait=wait)):
+                result.skipped += 1
+                continue
+            stored = _stored_summaries(school, sport)
+            targets = [
+                target
+                for target in _all_targets(reviews, stored)
+                if force or _is_stale(target)
+            ]
+            if targets:
+                work.append(
+                    (school, sport, targets, _prepare_jobs(school, sport, targets))
+                )
+            else:
+                result.done.append((school.id, sport))
+
+        results = iter(_run_jobs([job for *_, jobs in work for job in jobs]))
+        for school, sport, targets, jobs in work:
+            _, failures = _save_results(
+                school, sport, targets, jobs, [next(results) for _ in jobs]
+            )
+            result.regenerated += len(targets) - failures
+            result.failed += failures
+            if not failures:
+                result.done.append((school.id, sport))
+    return result
+
+
+def refresh_summaries(school, sport, force=False, wait=0):
+    """Refresh one school's sport; see ``refresh_batch``."""
+    return refresh_batch([(school, sport)], force=force, wait=wait)
+
+
+def stale_school_sports(school_ids=None, sport=None):
+    """
+    ``(school_id, sport)`` pairs with at least one stale or missing summary,
+    found by comparing each coach's newest review with its summary's
+    ``reviewed_through``. Returns ``{(school_id, sport): stale_count}``.
+    """
+    reviews = Reviews.objects.all()
+    summaries = ReviewSummary.objects.all()
+    if school_ids:
+        reviews = reviews.filter(school_id__in=school_ids)
+        summaries = summaries.filter(school_id__in=school_ids)
+    if sport:
+        reviews = reviews.filter(sport=sport)
+        summaries = summaries.filter(sport=sport)
+
+    reviewed_through = {
+        (school_id, row_sport, coach_id): through
+        for school_id, row_sport, coach_id, through in summaries.values_list(
+            "school_id", "sport", "coach_id", "reviewed_through"
+        )
+    }
+    newest = {}
+    for school_id, row_sport, coach_id, latest in (
+        reviews.values_list("school_id", "sport", "coach_id")
+        .annotate(latest=Max("created_at"))
+        .order_by()
+    ):
+        newest[(school_id, row_sport, coach_id)] = latest
+        # The overview covers every review of the school's sport
+        overview = (school_id, row_sport, None)
+        newest[overview] = max(latest, newest.get(overview, latest))
+
+    stale = {}
+    for key, latest in newest.items():
+        through = reviewed_through.get(key)
+        if through is None or through < latest:
+            pair = key[:2]
+            stale[pair] = stale.get(pair, 0) + 1
+    return stale
+
+
+def _compose(school, sport, reviews, stored, texts):
+    """
+    Join the coach summaries and program overview, preferring freshly
+    generated ``texts`` over stored rows. The latest coach falls back to the
+    raw reviews when it has no summary at all.
+    """
+    coach_reviews = group_reviews_by_coach(reviews)
+    latest_coach_id = reviews[0].coach_id
+    summaries = {coach_id: row.summary for coach_id, row in stored.items()}
+    summaries.update(texts)
+
+    latest = coach_reviews[latest_coach_id]
+    coach_summaries = [
+        summaries.get(latest_coach_id)
+        or _coach_fallback(school, sport, latest["coach"], latest["reviews"])
+    ]
+    for coach_id in coach_reviews:
+        if coach_id != latest_coach_id and coach_id in summaries:
+            coach_summaries.append(summaries[coach_id])
+
+    return "\n\n".join(
+        coach_summaries + ["**Program Overview**:", summaries.get(None, "")]
+    )
@@ -0,0 +1,260 @@
+import json
+import pytest
+from io import StringIO
+from django.core.management import call_command
+from rest_framework import status
+from rest_framework.test import APIClient
+from schools.models import Schools
+from reviews.models import Reviews
+from reviews.importer import ReviewImporter, iter_records
+
+RATINGS = {
+    "head_coach": 8,
+    "assistant_coaches": 7,
+    "team_culture": 9,
+    "campus_life": 6,
+    "athletic_facilities": 8,
+    "athletic_department": 7,
+    "player_development": 9,
+    "nil_opportunity": 5,
+}
+
+
+def ndjson(records):
+    return "\n".join(json.dumps(record) for record in records) + "\n"
+
+
+@pytest.mark.django_db
+class TestBulkReviewImport:
+    @pytest.fixture
+    def school(self):
+        return Schools.objects.create(
+            school_name="Import University",
+            mbb=True,
+            wbb=True,
+            fb=True,
+            conference="Test Conference",
+            location="Test Location",
+        )
+
+    @pytest.fixture
+    def users(self, django_user_model):
+        return [
+            django_user_model.objects.create_user(
+                email=f"importer{i}@example.com",
+                first_name="Import",
+                last_name=f"User{i}",
+                password="Password123",
+            )
+            for i in range(3)
+        ]
+
+    def make_record(self, school, user, coach="John Doe", **overrides):
+        return {
+            "school": school.id,
+            "user": user.id,
+            "sport": "Men's Basketball",
+            "head_coach_name": coach,
+            "review_message": "Solid program.",
+            **RATINGS,
+            **overrides,
+        }
+
+    def test_import_creates_reviews_in_chunks(self, school, users):
+        records = [self.make_record(school, user) for user in users]
+        result = ReviewImporter(chunk_size=2).run(
+            iter_records(StringIO(ndjson(records)), "ndjson")
+        )
+
+        assert result.created == 3
+        assert result.invalid == 0
+        assert Reviews.objects.filter(school=school, sport="mbb").count() == 3
+
+    def test_import_skips_normalized_duplicates(self, school, users):
+        Reviews.objects.create(
+            school=school,
+            user=users[0],
+            sport="mbb",
+            head_coach_name="John Doe",
+            review_message="Existing",
+            **RATINGS,
+        )
+        records = [
+            self.make_record(school, users[0], coach="  john   DOE "),
+            self.make_record(school, users[1]),
+            self.make_record(school, users[1], coach="JOHN DOE"),
+        ]
+        result = ReviewImporter().run(iter_records(StringIO(ndjson(records)), "ndjson"))
+
+        assert result.created == 1
+        assert result.duplicates == 2
+        assert Reviews.objects.count() == 2
+
+    def test_import_reports_invalid_rows(self, school, users):
+        lines = (
+            ndjson(
+                [
+                    self.make_record(school, users[0], head_coach=11),
+                    self.make_record(school, users[1], sport="Curling"),
+                    {**self.make_record(school, users[2]), "school": 999999},
+                ]
+            )
+            + "not json\n"
+        )
+        result = ReviewImporter().run(iter_records(StringIO(lines), "ndjson"))
+
+        assert result.created == 0
+        assert result.invalid == 4
+        assert sorted(error["line"] for error in result.errors) == [1, 2, 3, 4]
+
+    def test_import_rejects_fractional_and_boolean_ratings(self, school, users):
+        records = [
+            self.make_record(school, users[0], head_coach=7.5),
+            self.make_record(school, users[1], team_culture=True),
+        ]
+        result = ReviewImporter().run(iter_records(StringIO(ndjson(records)), "ndjson"))
+
+        assert result.created == 0
+        assert [error["error"] for error in result.errors] == [
+            "head_coach must be an integer",
+            "team_culture must be an integer",
+        ]
+
+    def test_import_counts_rows_lost_to_conflicts_as_duplicates(
+        self, school, users, monkeypatch
+    ):
+        records = [self.make_record(school, user) for user in users[:2]]
+        # A review that lands between the duplicate check and the insert
+        monkeypatch.setattr(ReviewImporter, "_existing_keys", lambda self, rows: set())
+        Reviews.objects.create(
+            school=school,
+            user=users[0],
+            sport="mbb",
+            head_coach_name="John Doe",
+            review_message="Existing",
+            **RATINGS,
+        )
+
+        result = ReviewImporter().run(iter_records(StringIO(ndjson(records)), "ndjson"))
+
+        assert result.created == 1
+        assert result.duplicates == 1
+        assert Reviews.objects.count() == 2
+
+    def test_imported_rows_match_saved_reviews(self, school, users):
+        records = [
+            self.make_record(school, user, coach="  john   DOE ") for user in users[:2]
+        ]
+        ReviewImporter(chunk_size=1).run(
+            iter_records(StringIO(ndjson(records)), "ndjson")
+        )
+        saved = Reviews.objects.create(
+            school=school,
+            user=users[2],
+            sport="mbb",
+            head_coach_name="John Doe",
+            review_message="Solid program.",
+            **RATINGS,
+        )
+
+        imported = list(Reviews.objects.exclude(pk=saved.pk))
+        assert len({review.review_id for review in imported}) == 2
+        for review in imported:
+            assert review.coach_id == saved.coach_id
+            assert review.head_coach_name_normalized == "john doe"
+            assert review.created_at is not None
+            assert review.updated_at is not None
+            assert review.coach_no_longer_at_university is False
+
+    def test_import_reports_lines_that_are_not_utf8(self, school, users):
+        lines = [
+            ndjson([self.make_record(school, users[0])]).encode(),
+            b'{"school": "\xff"}\n',
+            ndjson([self.make_record(school, users[1])]).encode(),
+        ]
+        result = ReviewImporter().run(iter_records(lines, "ndjson"))
+
+        assert result.created == 2
+        assert result.errors == [{"line": 2, "error": "Line is not valid UTF-8"}]
+
+    def test_import_csv_stops_at_a_line_that_is_not_utf8(self, school, users):
+        header = "school,user,sport,head_coach_name,review_message," + ",".join(RATINGS)
+        ratings = ",".join(str(value) for value in RATINGS.values())
+        lines = [
+            f"{header}\n".encode(),
+            f"{school.id},{users[0].id},fb,Jane Roe,Good,{ratings}\n".encode(),
+            b"\xff\n",
+            f"{school.id},{users[1].id},fb,Jane Roe,Good,{ratings}\n".encode(),
+        ]
+        result = ReviewImporter().run(iter_records(lines, "csv"))
+
+        assert result.created == 1
+        assert result.errors[0]["line"] == 3
+        assert Reviews.objects.get().user == users[0]
+
+    def test_import_csv_resolves_school_name_and_user_email(self, school, users):
+        header = "school,user_email,sport,head_coach_name,review_message," + ",".join(
+            RATINGS
+        )
+        row = (
+            f'"{school.school_name}",{users[0].email},fb,Jane Roe,"Great, really",'
+            + ",".join(str(value) for value in RATINGS.values())
+        )
+        result = ReviewImporter().run(
+            iter_records(StringIO(f"{header}\n{row}\n"), "csv")
+        )
+
+        assert result.created == 1
+        review = Reviews.objects.get()
+        assert review.school == school
+        assert review.user == users[0]
+        assert review.review_message == "Great, really"
+
+    def test_dry_run_writes_nothing(self, school, users):
+        records = [self.make_record(school, user) for user in users]
+        result = ReviewImporter(dry_run=True).run(
+            iter_records(StringIO(ndjson(records)), "ndjson")
+        )
+
+        assert result.created == 3
+        assert Reviews.objects.count() == 0
+
+    def test_management_command(self, school, users, tmp_path):
+        path = tmp_path / "reviews.ndjson"
+        path.write_text(ndjson([self.make_record(school, user) for user in users]))
+        out = StringIO()
+
+        call_command("import_reviews", str(path), stdout=out)
+
+        assert "Imported 3 reviews" in out.getvalue()
+        assert Reviews.objects.count() == 3
+
+    def test_bulk_endpoint_requires_admin(self, school, users):
+        client = APIClient()
+        client.force_authenticate(user=users[0])
+
+        response = client.post(
+            "/api/reviews/bulk-import/",
+            ndjson([self.make_record(school, users[0])]),
+            content_type="application/x-ndjson",
+        )
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert Reviews.objects.count() == 0
+
+    def test_bulk_endpoint_imports_ndjson_body(self, school, users):
+        admin = users[0]
+        admin.role = "admin"
+        admin.save()
+        client = APIClient()
+        client.force_authenticate(user=admin)
+
+        response = client.post(
+            "/api/reviews/bulk-import/",
+            ndjson([self.make_record(school, user) for user in users]),
+            content_type="application/x-ndjson",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["created"] == 3
+        assert Reviews.objects.count() == 3
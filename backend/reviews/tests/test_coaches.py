@@ -0,0 +1,166 @@
+import pytest
+from io import StringIO
+from unittest.mock import patch
+from django.core.management import call_command
+from rest_framework import status
+from rest_framework.test import APIClient
+from schools.models import Schools
+from reviews.coaches import school_aliases, seed_coaches
+from reviews.models import Coach, Reviews
+
+RATINGS = {
+    "head_coach": 5,
+    "assistant_coaches": 5,
+    "team_culture": 5,
+    "campus_life": 5,
+    "athletic_facilities": 5,
+    "athletic_department": 5,
+    "player_development": 5,
+    "nil_opportunity": 5,
+}
+
+
+@pytest.mark.django_db
+class TestCoaches:
+    @pytest.fixture
+    def api_client(self):
+        return APIClient()
+
+    @pytest.fixture
+    def create_school(self):
+        def _create_school(name):
+            return Schools.objects.create(
+                school_name=name,
+                mbb=True,
+                wbb=True,
+                fb=True,
+                conference="Test Conference",
+                location="Test Location",
+            )
+
+        return _create_school
+
+    @pytest.fixture
+    def user(self, django_user_model):
+        return django_user_model.objects.create_user(
+            email="reviewer@example.com",
+            first_name="Review",
+            last_name="Er",
+            password="password123",
+        )
+
+    def create_review(self, school, user, coach_name, sport="mbb"):
+        return Reviews.objects.create(
+            school=school,
+            user=user,
+            sport=sport,
+            head_coach_name=coach_name,
+            review_message="Tough but fair coach.",
+            **RATINGS,
+        )
+
+    def test_coaches_seeded_from_tenure_fixtures(self):
+        coach = Coach.objects.get(sport="mbb", normalized_name="lennie acuff")
+        assert coach.name == "Lennie Acuff"
+        assert coach.tenure.endswith("@Samford")
+        assert Coach.objects.filter(sport="wbb").exists()
+        assert Coach.objects.filter(sport="fb").exists()
+
+    def test_school_aliases_include_special_cases(self):
+        assert {"illinois", "university of illinois at urbana-champaign"} <= (
+            school_aliases("University of Illinois at Urbana–Champaign")
+        )
+        assert "iowa" in school_aliases("University of Iowa")
+
+    def test_seed_links_current_school(self, create_school):
+        school = create_school("Samford University")
+
+        seed_coaches()
+
+        coach = Coach.objects.get(sport="mbb", normalized_name="lennie acuff")
+        assert coach.current_school == school
+        assert coach.is_at_school(school)
+
+    def test_review_save_links_coach_by_normalized_name(self, create_school, user):
+        school = create_school("Test University")
+
+        review = self.create_review(
+            school, user, "  lennie   ACUFF", sport="Men's Basketball"
+        )
+
+        assert review.coach == Coach.objects.get(
+            sport="mbb", normalized_name="lennie acuff"
+        )
+
+    def test_unknown_coach_is_created(self, create_school, user):
+        school = create_school("Test University")
+
+        review = self.create_review(school, user, "jan JENSEN", sport="vb")
+
+        assert review.coach.name == "Jan Jensen"
+        assert review.coach.sport == "vb"
+        assert review.coach.tenure == ""
+
+    def test_seed_command_links_unlinked_reviews(self, create_school, user):
+        school = create_school("Test University")
+        review = self.create_review(school, user, "Lennie Acuff")
+        Reviews.objects.filter(id=review.id).update(coach=None)
+        out = StringIO()
+
+        call_command("seed_coaches", stdout=out)
+
+        review.refresh_from_db()
+        assert review.coach.normalized_name == "lennie acuff"
+        assert "1 reviews linked" in out.getvalue()
+
+    def test_school_reviews_flag_coach_at_other_school(
+        self, api_client, create_school, user
+    ):
+        school = create_school("Test University")
+        self.create_review(school, user, "Lennie Acuff")
+
+        response = api_client.get(f"/api/reviews/school/{school.id}/?sport=mbb")
+
+        assert response.status_code == status.HTTP_200_OK
+        body = response.json()
+        assert body[0]["coach_history"].endswith("@Samford")
+        assert body[0]["is_no_longer_at_school"] is True
+
+    @patch("openai.OpenAI")
+    def test_summary_marks_coach_no_longer_at_school(
+        self, mock_openai, api_client, create_school, user
+    ):
+        mock_openai.return_value.chat.completions.create.side_effect = Exception(
+            "offline"
+        )
+        school = create_school("Test University")
+        self.create_review(school, user, "Lennie Acuff")
+
+        response = api_client.get(
+            f"/api/public/schools/{school.id}/reviews/summary/?sport=mbb"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        summary = response.data["summary"]
+        assert "**Lennie Acuff**:" in summary
+        assert "*No longer at this school*" in summary
+
+    @patch("openai.OpenAI")
+    def test_summary_flags_basketball_coach_without_tenure(
+        self, mock_openai, api_client, create_school, user
+    ):
+        mock_openai.return_value.chat.completions.create.side_effect = Exception(
+            "offline"
+        )
+        school = create_school("Test University")
+        self.create_review(school, user, "Untracked Coach")
+
+        response = api_client.get(
+            f"/api/public/schools/{school.id}/reviews/summary/?sport=mbb"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        summary = response.data["summary"]
+        assert "**Untracked Coach**:" in summary
+        # Untracked basketball coaches are flagged, as they always were
+        assert "*No longer at this school*" in summary
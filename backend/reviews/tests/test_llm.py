@@ -0,0 +1,435 @@
+import threading
+import time
+from asgiref.sync import async_to_sync
+import pytest
+from rest_framework.test import APIClient
+from schools.models import Schools
+from reviews import llm
+from reviews.models import ReviewChunkSummary, Reviews, ReviewSummary
+from reviews.summaries import RefreshResult, refresh_summaries
+
+MESSAGES = [{"role": "user", "content": "Summarize these reviews."}]
+
+
+def is_overview(body):
+    return "general aspects" in body["messages"][0]["content"]
+
+
+def by_prompt(body):
+    return "Overview from stub" if is_overview(body) else "Coach summary from stub"
+
+
+class TestLLMGateway:
+    def test_complete_returns_content(self, llm_stub):
+        llm_stub.reply("Reviewers love it.")
+
+        assert llm.complete(MESSAGES) == "Reviewers love it."
+        assert llm_stub.requests[0]["messages"] == MESSAGES
+
+    def test_client_is_shared(self, llm_stub):
+        assert llm.get_client() is llm.get_client()
+
+    def test_retries_server_errors(self, llm_stub):
+        llm_stub.fail(500)
+        llm_stub.fail(429)
+        llm_stub.reply("Third time lucky")
+
+        assert llm.complete(MESSAGES) == "Third time lucky"
+        assert len(llm_stub.requests) == 3
+
+    def test_retries_dropped_connections(self, llm_stub):
+        llm_stub.drop()
+        llm_stub.reply("Recovered")
+
+        assert llm.complete(MESSAGES) == "Recovered"
+
+    def test_client_errors_are_not_retried(self, llm_stub):
+        llm_stub.fail(400)
+
+        with pytest.raises(llm.LLMUnavailable):
+            llm.complete(MESSAGES)
+        assert len(llm_stub.requests) == 1
+
+    def test_client_errors_do_not_open_breaker(self, llm_stub, settings):
+        settings.LLM_BREAKER_THRESHOLD = 2
+        for _ in range(3):
+            llm_stub.fail(400)
+
+        for _ in range(3):
+            with pytest.raises(llm.LLMUnavailable):
+                llm.complete(MESSAGES)
+
+        assert llm.available()
+        assert llm.complete(MESSAGES) == "Stub summary"
+
+    def test_missing_content_is_a_failure(self, llm_stub):
+        llm_stub.reply(None)
+
+        with pytest.raises(llm.LLMUnavailable, match="no content"):
+            llm.complete(MESSAGES)
+        assert llm.available()
+
+    def test_gives_up_after_max_retries(self, llm_stub, settings):
+        settings.LLM_MAX_RETRIES = 1
+        for _ in range(3):
+            llm_stub.fail(503)
+
+        with pytest.raises(llm.LLMUnavailable):
+            llm.complete(MESSAGES)
+        assert len(llm_stub.requests) == 2
+
+    def test_deadline_bounds_slow_calls(self, llm_stub, settings):
+        settings.LLM_TIMEOUT = 0.2
+        for _ in range(3):
+            llm_stub.delay(2)
+
+        started = time.monotonic()
+        with pytest.raises(llm.LLMUnavailable):
+            llm.complete(MESSAGES, deadline=0.5)
+
+        assert time.monotonic() - started < 1.5
+
+    def test_waiting_for_a_slot_does_not_use_the_deadline(self, llm_stub, settings):
+        settings.LLM_MAX_CONCURRENCY = 1
+        slots = llm.get_slots()
+        slots.acquire()
+        threading.Timer(0.5, slots.release).start()
+
+        assert llm.complete(MESSAGES, deadline=0.3) == "Stub summary"
+
+    def test_slot_wait_is_bounded_and_spares_the_breaker(self, llm_stub, settings):
+        settings.LLM_MAX_CONCURRENCY = 1
+        settings.LLM_SLOT_WAIT = 0.1
+        settings.LLM_BREAKER_THRESHOLD = 1
+        slots = llm.get_slots()
+        slots.acquire()
+        try:
+            with pytest.raises(llm.LLMUnavailable, match="in flight"):
+                llm.complete(MESSAGES)
+        finally:
+            slots.release()
+
+        assert llm.available()
+        assert llm_stub.requests == []
+
+    def test_breaker_opens_and_recovers(self, llm_stub, settings):
+        settings.LLM_MAX_RETRIES = 0
+        settings.LLM_BREAKER_THRESHOLD = 2
+        settings.LLM_BREAKER_COOLDOWN = 0.2
+        llm_stub.fail(500)
+        llm_stub.fail(500)
+
+        for _ in range(2):
+            with pytest.raises(llm.LLMUnavailable):
+                llm.complete(MESSAGES)
+        assert not llm.available()
+
+        # Fails fast without reaching the server while open
+        with pytest.raises(llm.LLMUnavailable, match="circuit breaker"):
+            llm.complete(MESSAGES)
+        assert len(llm_stub.requests) == 2
+
+        time.sleep(0.25)
+        assert llm.complete(MESSAGES) == "Stub summary"
+        assert llm.available()
+
+    def test_failed_trial_reopens_breaker(self, llm_stub, settings):
+        settings.LLM_MAX_RETRIES = 0
+        settings.LLM_BREAKER_THRESHOLD = 1
+        settings.LLM_BREAKER_COOLDOWN = 0.2
+        llm_stub.fail(500)
+        llm_stub.fail(500)
+
+        with pytest.raises(llm.LLMUnavailable):
+            llm.complete(MESSAGES)
+        time.sleep(0.25)
+        with pytest.raises(llm.LLMUnavailable):
+            llm.complete(MESSAGES)
+
+        assert not llm.available()
+        assert len(llm_stub.requests) == 2
+
+
+@pytest.mark.django_db
+class TestSummaryFallback:
+    @pytest.fixture
+    def school(self, django_user_model):
+        school = Schools.objects.create(
+            school_name="Gateway University",
+            mbb=True,
+            wbb=True,
+            fb=True,
+            conference="Test Conference",
+            location="Test Location",
+        )
+        user = django_user_model.objects.create_user(
+            email="gateway@example.com",
+            first_name="Gate",
+            last_name="Way",
+            password="password123",
+        )
+        Reviews.objects.create(
+            school=school,
+            user=user,
+            sport="fb",
+            head_coach_name="Pat Coach",
+            review_message="Great coaching staff.",
+            head_coach=8,
+            assistant_coaches=8,
+            team_culture=8,
+            campus_life=8,
+            athletic_facilities=8,
+            athletic_department=8,
+            player_development=8,
+            nil_opportunity=8,
+        )
+        return school
+
+    def get_summary(self, school):
+        return APIClient().get(
+            f"/api/public/schools/{school.id}/reviews/summary/?sport=fb"
+        )
+
+    def test_summary_uses_stub_model(self, llm_stub, school):
+        llm_stub.default_reply = by_prompt
+
+        summary = self.get_summary(school).data["summary"]
+
+        assert "Coach summary from stub" in summary
+        assert summary.endswith("Overview from stub")
+
+    def test_open_breaker_serves_fallback_without_calls(
+        self, llm_stub, settings, school
+    ):
+        settings.LLM_MAX_RETRIES = 0
+        settings.LLM_BREAKER_THRESHOLD = 1
+        settings.LLM_BREAKER_COOLDOWN = 60
+        llm_stub.fail(500)
+        llm_stub.fail(500)
+
+        first = self.get_summary(school)
+        second = self.get_summary(school)
+
+        assert first.status_code == second.status_code == 200
+        assert "Great coaching staff." in second.data["summary"]
+        assert len(llm_stub.requests) == 2
+
+    def test_summary_prompt_lists_each_review_once(self, llm_stub, school):
+        self.get_summary(school)
+
+        general, coach = sorted(
+            (request for request in llm_stub.requests),
+            key=lambda request: not is_overview(request),
+        )
+        general, coach = general["messages"][1], coach["messages"][1]
+        assert general["content"] == "Great coaching staff."
+        assert coach["content"] == ("[Coaching Style] Great coaching staff.")
+
+    def test_overview_and_coach_calls_run_concurrently(self, llm_stub, school):
+        llm_stub.delay(0.5)
+        llm_stub.delay(0.5)
+
+        started = time.monotonic()
+        response = self.get_summary(school)
+
+        assert response.status_code == 200
+        assert time.monotonic() - started < 0.9
+
+    def test_concurrency_limit_is_respected(self, llm_stub, settings, school):
+        settings.LLM_MAX_CONCURRENCY = 1
+        llm_stub.delay(0.3)
+        llm_stub.delay(0.3)
+
+        started = time.monotonic()
+        self.get_summary(school)
+
+        assert time.monotonic() - started >= 0.6
+
+    def test_refresh_summaries_covers_every_coach(
+        self, llm_stub, school, django_user_model
+    ):
+        llm_stub.default_reply = by_prompt
+        user = django_user_model.objects.create(email="second@example.com")
+        Reviews.objects.create(
+            school=school,
+            user=user,
+            sport="fb",
+            head_coach_name="Former Coach",
+            review_message="Former coach built the program.",
+            head_coach=6,
+            assistant_coaches=6,
+            team_culture=6,
+            campus_life=6,
+            athletic_facilities=6,
+            athletic_department=6,
+            player_development=6,
+            nil_opportunity=6,
+        )
+
+        assert refresh_summaries(school, "fb") == RefreshResult(regenerated=3)
+        assert refresh_summaries(school, "fb") == RefreshResult()
+        assert set(
+            ReviewSummary.objects.filter(school=school).values_list(
+                "coach__name", flat=True
+            )
+        ) == {None, "Pat Coach", "Former Coach"}
+        assert len(llm_stub.requests) == 3
+
+
+@pytest.mark.django_db
+class TestMapReduceSummary:
+    @pytest.fixture
+    def school(self, settings):
+        settings.SUMMARY_PROMPT_TOKEN_BUDGET = 80
+        settings.SUMMARY_CHUNK_SIZE = 4
+        return Schools.objects.create(
+            school_name="Big Program University",
+            mbb=True,
+            wbb=True,
+            fb=True,
+            conference="Test Conference",
+            location="Test Location",
+        )
+
+    def add_reviews(self, school, django_user_model, start, count):
+        for i in range(start, start + count):
+            # No password: hashing one per user would dominate the test
+            user = django_user_model.objects.create(
+                email=f"bigprogram{i}@example.com",
+                first_name="Big",
+                last_name=f"Program{i}",
+            )
+            Reviews.objects.create(
+                school=school,
+                user=user,
+                sport="fb",
+                head_coach_name="Pat Coach",
+                review_message=f"Review {i}: the coaching staff and facilities are solid.",
+                head_coach=7,
+                assistant_coaches=7,
+                team_culture=7,
+                campus_life=7,
+                athletic_facilities=7,
+                athletic_department=7,
+                player_development=7,
+                nil_opportunity=7,
+            )
+
+    def get_summary(self, school):
+        return APIClient().get(
+            f"/api/public/schools/{school.id}/reviews/summary/?sport=fb"
+        )
+
+    def test_large_programs_are_summarized_in_chunks(
+        self, llm_stub, school, django_user_model
+    ):
+        self.add_reviews(school, django_user_model, 0, 12)
+
+        response = self.get_summary(school)
+
+        assert response.status_code == 200
+        # 3 chunks plus a reduce step, for the overview and for the coach
+        assert len(llm_stub.requests) == 8
+        assert ReviewChunkSummary.objects.count() == 6
+        reduce_prompts = [
+            request["messages"][1]["content"]
+            for request in llm_stub.requests
+            if request["messages"][1]["content"].startswith("Summaries of review")
+        ]
+        assert len(reduce_prompts) == 2
+        assert all(prompt.count("Stub summary") == 3 for prompt in reduce_prompts)
+
+    def test_refresh_shares_one_bounded_pool(
+        self, llm_stub, settings, school, django_user_model
+    ):
+        settings.LLM_MAX_CONCURRENCY = 2
+        settings.LLM_DEADLINE = 0.5
+        self.add_reviews(school, django_user_model, 0, 12)
+        in_flight, peak = [0], [0]
+        lock = threading.Lock()
+
+        def slow_reply(body):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.2)
+            with lock:
+                in_flight[0] -= 1
+            return "Stub summary"
+
+        llm_stub.default_reply = slow_reply
+
+        # 8 calls take longer than one deadline in total, but queueing for a
+        # slot doesn't count against it
+        assert refresh_summaries(school, "fb") == RefreshResult(regenerated=2)
+        assert len(llm_stub.requests) == 8
+        assert peak[0] == 2
+
+    def test_new_review_only_resummarizes_last_chunk(
+        self, llm_stub, school, django_user_model
+    ):
+        self.add_reviews(school, django_user_model, 0, 12)
+        self.get_summary(school)
+        llm_stub.requests.clear()
+
+        self.add_reviews(school, django_user_model, 12, 1)
+        self.get_summary(school)
+
+        # One new chunk plus the reduce step, for the overview and the coach
+        assert len(llm_stub.requests) == 4
+        assert ReviewChunkSummary.objects.count() == 8
+
+    def test_failed_chunk_keeps_finished_chunks(
+        self, llm_stub, settings, school, django_user_model
+    ):
+        settings.LLM_MAX_RETRIES = 0
+        settings.LLM_MAX_CONCURRENCY = 1
+        self.add_reviews(school, django_user_model, 0, 12)
+        llm_stub.reply("Chunk one")
+        llm_stub.fail(400)
+
+        response = self.get_summary(school)
+
+        assert response.status_code == 200
+        assert ReviewChunkSummary.objects.filter(summary="Chunk one").exists()
+
+
+class TestAsyncLLMGateway:
+    def test_acomplete_returns_content(self, llm_stub):
+        llm_stub.reply("Reviewers love it.")
+
+        assert async_to_sync(llm.acomplete)(MESSAGES) == "Reviewers love it."
+        assert llm_stub.requests[0]["messages"] == MESSAGES
+
+    def test_acomplete_retries_server_errors(self, llm_stub):
+        llm_stub.fail(500)
+        llm_stub.reply("Second time lucky.")
+
+        assert async_to_sync(llm.acomplete)(MESSAGES) == "Second time lucky."
+        assert len(llm_stub.requests) == 2
+
+    def test_acomplete_client_errors_do_not_open_breaker(self, llm_stub, settings):
+        settings.LLM_BREAKER_THRESHOLD = 1
+        llm_stub.fail(400)
+
+        with pytest.raises(llm.LLMUnavailable):
+            async_to_sync(llm.acomplete)(MESSAGES)
+        assert llm.available()
+
+    def test_acomplete_missing_content_is_a_failure(self, llm_stub):
+        llm_stub.reply(None)
+
+        with pytest.raises(llm.LLMUnavailable, match="no content"):
+            async_to_sync(llm.acomplete)(MESSAGES)
+
+    def test_acomplete_shares_the_breaker(self, llm_stub, settings):
+        settings.LLM_MAX_RETRIES = 0
+        settings.LLM_BREAKER_THRESHOLD = 1
+        settings.LLM_BREAKER_COOLDOWN = 60
+        llm_stub.fail(500)
+
+        with pytest.raises(llm.LLMUnavailable):
+            async_to_sync(llm.acomplete)(MESSAGES)
+        with pytest.raises(llm.LLMUnavailable):
+            llm.complete(MESSAGES)
+        assert len(llm_stub.requests) == 1
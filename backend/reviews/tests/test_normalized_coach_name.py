@@ -0,0 +1,106 @@
+import pytest
+from django.db import IntegrityError, connection, transaction
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+from schools.models import Schools
+from reviews.models import Reviews
+
+RATINGS = {
+    "head_coach": 4,
+    "assistant_coaches": 4,
+    "team_culture": 5,
+    "campus_life": 5,
+    "athletic_facilities": 5,
+    "athletic_department": 4,
+    "player_development": 5,
+    "nil_opportunity": 3,
+}
+
+
+@pytest.mark.django_db
+class TestNormalizedCoachName:
+    @pytest.fixture
+    def school(self):
+        return Schools.objects.create(
+            school_name="Test University",
+            mbb=True,
+            wbb=False,
+            fb=True,
+            conference="Test Conference",
+            location="The Moon",
+        )
+
+    @pytest.fixture
+    def user(self, django_user_model):
+        return django_user_model.objects.create_user(
+            email="coachfan@example.com",
+            first_name="Coach",
+            last_name="Fan",
+            password="password123",
+        )
+
+    def test_save_fills_normalized_name(self, school, user):
+        review = Reviews.objects.create(
+            school=school,
+            user=user,
+            sport="fb",
+            head_coach_name="  John\tDOE  ",
+            review_message="Good",
+            **RATINGS,
+        )
+
+        review.refresh_from_db()
+        assert review.head_coach_name_normalized == "john doe"
+
+        review.head_coach_name = "Jane Roe"
+        review.save(update_fields=["head_coach_name"])
+        review.refresh_from_db()
+        assert review.head_coach_name_normalized == "jane roe"
+
+    def test_constraint_rejects_normalized_duplicate(self, school, user):
+        Reviews.objects.create(
+            school=school,
+            user=user,
+            sport="fb",
+            head_coach_name="John Doe",
+            review_message="First",
+            **RATINGS,
+        )
+
+        with pytest.raises(IntegrityError), transaction.atomic():
+            Reviews.objects.create(
+                school=school,
+                user=user,
+                sport="fb",
+                head_coach_name="john  doe",
+                review_message="Second",
+                **RATINGS,
+            )
+
+    def test_duplicate_check_uses_normalized_column(self, school, user):
+        Reviews.objects.create(
+            school=school,
+            user=user,
+            sport="fb",
+            head_coach_name="John Doe",
+            review_message="First",
+            **RATINGS,
+        )
+        client = APIClient()
+        client.force_authenticate(user=user)
+        data = {
+            "school": school.id,
+            "sport": "Football",
+            "head_coach_name": " JOHN   doe ",
+            "review_message": "Second",
+            **RATINGS,
+        }
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.post("/api/reviews/review-form/", data, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "already submitted a review" in str(response.data)
+        assert Reviews.objects.count() == 1
+        assert not any("REGEXP_REPLACE" in query["sql"] for query in queries)
@@ -0,0 +1,84 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from reviews.prompts import (
+    GENERAL_ASPECTS,
+    build_prompt,
+    coach_aspects,
+    estimate_tokens,
+)
+
+NOW = datetime(2025, 3, 1, tzinfo=timezone.utc)
+
+
+def review(message, days_ago=0, helpful_votes=0):
+    return SimpleNamespace(
+        review_message=message,
+        created_at=NOW - timedelta(days=days_ago),
+        helpful_votes=helpful_votes,
+    )
+
+
+class TestPromptBuilder:
+    def test_each_review_appears_once_with_its_aspects(self):
+        prompt = build_prompt(
+            [review("Great facilities and a strong team culture.")], GENERAL_ASPECTS
+        )
+
+        assert prompt.text == (
+            "[Athletic Facilities, Team Culture] "
+            "Great facilities and a strong team culture."
+        )
+        assert prompt.included == prompt.total == 1
+
+    def test_duplicates_and_unrelated_reviews_are_dropped(self):
+        prompt = build_prompt(
+            [
+                review("Nice campus."),
+                review("  nice   CAMPUS. "),
+                review("The bus rides were long."),
+            ],
+            GENERAL_ASPECTS,
+        )
+
+        assert prompt.text == "[Campus Life] Nice campus."
+        assert prompt.total == 1
+
+    def test_without_aspects_every_review_is_used(self):
+        prompt = build_prompt([review("The bus rides were long.")], None)
+
+        assert prompt.text == "The bus rides were long."
+
+    def test_ranks_helpful_then_recent(self):
+        prompt = build_prompt(
+            [
+                review("Old coach review.", days_ago=30),
+                review("New coach review.", days_ago=1),
+                review("Helpful coach review.", days_ago=60, helpful_votes=3),
+            ],
+            coach_aspects("Pat Coach"),
+        )
+
+        assert [line.split("] ")[1] for line in prompt.text.splitlines()] == [
+            "Helpful coach review.",
+            "New coach review.",
+            "Old coach review.",
+        ]
+
+    def test_budget_limits_prompt_and_reports_tokens(self):
+        reviews = [
+            review(f"Coach review number {i}. " * 5, days_ago=i) for i in range(50)
+        ]
+
+        prompt = build_prompt(reviews, coach_aspects("Pat Coach"), budget=100)
+
+        assert prompt.tokens <= 100
+        assert prompt.tokens == estimate_tokens(prompt.text)
+        assert 0 < prompt.included < 50
+        assert prompt.dropped == 50 - prompt.included
+        assert "number 0." in prompt.text
+
+    def test_oversized_top_review_is_truncated(self):
+        prompt = build_prompt([review("Facilities " * 200)], GENERAL_ASPECTS, budget=10)
+
+        assert prompt.included == 1
+        assert prompt.tokens <= 10
@@ -0,0 +1,181 @@
+import json
+import pytest
+from datetime import timedelta
+from io import StringIO
+from django.core.management import call_command
+from rest_framework.test import APIClient
+from schools.models import Schools
+from reviews.models import Reviews, ReviewSummary
+from reviews.summaries import stale_school_sports
+
+RATINGS = {
+    "head_coach": 6,
+    "assistant_coaches": 6,
+    "team_culture": 6,
+    "campus_life": 6,
+    "athletic_facilities": 6,
+    "athletic_department": 6,
+    "player_development": 6,
+    "nil_opportunity": 6,
+}
+
+
+@pytest.mark.django_db
+class TestRefreshSummaries:
+    @pytest.fixture
+    def schools(self):
+        return [
+            Schools.objects.create(
+                school_name=f"Refresh University {i}",
+                mbb=True,
+                wbb=True,
+                fb=True,
+                conference="Test Conference",
+                location="Test Location",
+            )
+            for i in range(3)
+        ]
+
+    @pytest.fixture
+    def user(self, django_user_model):
+        return django_user_model.objects.create(email="refresher@example.com")
+
+    def review(self, school, user, coach, sport="fb"):
+        return Reviews.objects.create(
+            school=school,
+            user=user,
+            sport=sport,
+            head_coach_name=coach,
+            review_message=f"{coach} is a strong coach.",
+            **RATINGS,
+        )
+
+    def test_stale_detection_compares_timestamps(self, schools, user):
+        fresh = self.review(schools[0], user, "Fresh Coach")
+        stale = self.review(schools[1], user, "Stale Coach")
+        for review in (fresh, stale):
+            ReviewSummary.objects.store(
+                review.school, "fb", None, "Overview", review.created_at
+            )
+        ReviewSummary.objects.store(
+            schools[0], "fb", fresh.coach, "Fresh", fresh.created_at
+        )
+        ReviewSummary.objects.store(
+            schools[1],
+            "fb",
+            stale.coach,
+            "Stale",
+            stale.created_at - timedelta(days=1),
+        )
+
+        assert stale_school_sports() == {(schools[1].id, "fb"): 1}
+
+    def test_missing_summaries_are_stale(self, schools, user):
+        self.review(schools[0], user, "Coach One")
+        self.review(schools[0], user, "Coach Two")
+
+        assert stale_school_sports() == {(schools[0].id, "fb"): 3}
+        assert stale_school_sports(sport="mbb") == {}
+
+    def test_command_refreshes_every_coach(self, llm_stub, schools, user):
+        self.review(schools[0], user, "Coach One")
+        self.review(schools[0], user, "Coach Two")
+        self.review(schools[1], user, "Coach Three", sport="mbb")
+        out = StringIO()
+
+        call_command("refresh_summaries", "--batch-size", "1", stdout=out)
+
+        assert "Refreshed 5 summaries for 2 school sports" in out.getvalue()
+        assert ReviewSummary.objects.filter(reviewed_through__isnull=False).count() == 5
+        assert stale_school_sports() == {}
+        assert len(llm_stub.requests) == 5
+
+    def test_dry_run_lists_without_generating(self, llm_stub, schools, user):
+        self.review(schools[0], user, "Coach One")
+        out = StringIO()
+
+        call_command("refresh_summaries", "--dry-run", stdout=out)
+
+        assert f"school {schools[0].id} fb: 2 stale" in out.getvalue()
+        assert not ReviewSummary.objects.exists()
+        assert llm_stub.requests == []
+
+    def test_resume_skips_checkpointed_pairs(self, llm_stub, schools, user, tmp_path):
+        for school in schools:
+            self.review(school, user, "Coach One")
+        checkpoint = tmp_path / "refresh.json"
+        checkpoint.write_text(json.dumps({"done": [[schools[0].id, "fb"]]}))
+
+        call_command(
+            "refresh_summaries",
+            "--checkpoint",
+            str(checkpoint),
+            "--resume",
+            stdout=StringIO(),
+        )
+
+        refreshed = set(
+            ReviewSummary.objects.values_list("school_id", flat=True).distinct()
+        )
+        assert refreshed == {schools[1].id, schools[2].id}
+        # Removed once the run finishes
+        assert not checkpoint.exists()
+
+    def test_checkpoint_leaves_failed_pairs_for_resume(
+        self, llm_stub, settings, schools, user, tmp_path
+    ):
+        settings.LLM_MAX_RETRIES = 0
+        # One school sport per batch; the first one's two summaries fail
+        for _ in range(2):
+            llm_stub.fail(500)
+        for school in schools[:2]:
+            self.review(school, user, "Coach One")
+        checkpoint = tmp_path / "refresh.json"
+
+        call_command(
+            "refresh_summaries",
+            "--checkpoint",
+            str(checkpoint),
+            "--batch-size",
+            "1",
+            stdout=StringIO(),
+        )
+
+        assert json.loads(checkpoint.read_text()) == {"done": [[schools[1].id, "fb"]]}
+
+        call_command(
+            "refresh_summaries",
+            "--checkpoint",
+            str(checkpoint),
+            "--resume",
+            stdout=StringIO(),
+        )
+
+        assert (
+            ReviewSummary.objects.filter(
+                school=schools[0], reviewed_through__isnull=False
+            ).count()
+            == 2
+        )
+        assert not checkpoint.exists()
+
+    def test_failed_batches_are_reported(self, llm_stub, settings, schools, user):
+        settings.LLM_MAX_RETRIES = 0
+        for _ in range(2):
+            llm_stub.fail(500)
+        self.review(schools[0], user, "Coach One")
+        out = StringIO()
+
+        call_command("refresh_summaries", stdout=out)
+
+        assert "(2 failed, 0 skipped)" in out.getvalue()
+
+    def test_page_loads_can_skip_generation(self, llm_stub, settings, schools, user):
+        settings.SUMMARY_GENERATE_ON_REQUEST = False
+        self.review(schools[0], user, "Coach One")
+        response = APIClient().get(
+            f"/api/public/schools/{schools[0].id}/reviews/summary/?sport=fb"
+        )
+
+        assert "Coach One is a strong coach." in response.data["summary"]
+        assert llm_stub.requests == []
@@ -0,0 +1,90 @@
+import json
+import pytest
+from rest_framework.renderers import JSONRenderer
+from django.contrib.auth.models import AnonymousUser
+from rest_framework.test import APIRequestFactory
+from rest_framework.request import Request
+from schools.models import Schools
+from reviews.listing import review_payloads
+from reviews.models import Reviews, ReviewVote
+from reviews.serializers import ReviewsSerializer
+
+
+@pytest.mark.django_db
+class TestReviewListingFastPath:
+    @pytest.fixture
+    def school(self):
+        return Schools.objects.create(
+            school_name="Listing University",
+            mbb=True,
+            wbb=True,
+            fb=True,
+            conference="Test Conference",
+            location="Test Location",
+        )
+
+    @pytest.fixture
+    def users(self, django_user_model):
+        return [
+            django_user_model.objects.create(
+                email=f"listing{i}@example.com",
+                is_school_verified=i == 0,
+                profile_picture=f"pic{i}.png",
+            )
+            for i in range(3)
+        ]
+
+    @pytest.fixture
+    def reviews(self, school, users):
+        reviews = [
+            Reviews.objects.create(
+                school=school,
+                user=user,
+                sport=sport,
+                head_coach_name=f"Coach {i}",
+                review_message="Good program.",
+                head_coach=i + 1,
+                assistant_coaches=5,
+                team_culture=6,
+                campus_life=7,
+                athletic_facilities=8,
+                athletic_department=9,
+                player_development=3,
+                nil_opportunity=2,
+                coach_history="Coach since 2020" if i else None,
+            )
+            for i, (user, sport) in enumerate(zip(users, ["fb", "mbb", "unknown"]))
+        ]
+        ReviewVote.objects.create(review=reviews[0], user=users[1], vote=1)
+        ReviewVote.objects.create(review=reviews[0], user=users[2], vote=0)
+        ReviewVote.objects.create(review=reviews[1], user=users[0], vote=0)
+        return reviews
+
+    def request(self, user=None):
+        request = Request(APIRequestFactory().get("/"))
+        request.user = user or AnonymousUser()
+        return request
+
+    def render_both(self, request):
+        serialized = ReviewsSerializer(
+            Reviews.objects.all().for_listing(request.user),
+            many=True,
+            context={"request": request},
+        ).data
+        fast = review_payloads(Reviews.objects.all(), request)
+        return JSONRenderer().render(serialized), JSONRenderer().render(fast)
+
+    def test_fast_path_matches_serializer(self, reviews, users):
+        serialized, fast = self.render_both(self.request(users[0]))
+
+        assert fast == serialized
+        assert b'"my_vote":0' in fast
+        # Newest first, as Reviews.Meta.ordering asks
+        assert [row["id"] for row in json.loads(fast)] == [
+            review.id for review in reversed(reviews)
+        ]
+
+    def test_fast_path_matches_serializer_anonymously(self, reviews):
+        serialized, fast = self.render_both(self.request())
+
+        assert fast == serialized
@@ -0,0 +1,126 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+from schools.models import Schools
+from reviews.models import Reviews, ReviewVote
+
+RATINGS = {
+    "head_coach": 7,
+    "assistant_coaches": 6,
+    "team_culture": 8,
+    "campus_life": 7,
+    "athletic_facilities": 9,
+    "athletic_department": 7,
+    "player_development": 6,
+    "nil_opportunity": 5,
+}
+
+
+@pytest.mark.django_db
+class TestReviewListingQueries:
+    """Listing reviews costs the same number of queries for any page size."""
+
+    @pytest.fixture
+    def viewer(self, django_user_model):
+        return django_user_model.objects.create(email="viewer@example.com")
+
+    @pytest.fixture
+    def client(self, viewer):
+        client = APIClient()
+        client.force_authenticate(user=viewer)
+        return client
+
+    @pytest.fixture
+    def make_reviews(self, django_user_model, viewer):
+        counter = iter(range(1000))
+
+        def make(count, school=None, user=None):
+            reviews = []
+            for _ in range(count):
+                i = next(counter)
+                reviews.append(
+                    Reviews.objects.create(
+                        school=school
+                        or Schools.objects.create(
+                            school_name=f"Query School {i}",
+                            mbb=True,
+                            wbb=True,
+                            fb=True,
+                            conference="Test Conference",
+                            location="Test Location",
+                        ),
+                        user=user
+                        or django_user_model.objects.create(
+                            email=f"author{i}@example.com"
+                        ),
+                        sport="fb",
+                        head_coach_name=f"Coach {i}",
+                        review_message="Solid program.",
+                        **RATINGS,
+                    )
+                )
+            for review in reviews:
+                ReviewVote.objects.create(review=review, user=viewer, vote=1)
+            return reviews
+
+        return make
+
+    def count_queries(self, client, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(url)
+        assert response.status_code == 200
+        return len(queries)
+
+    def test_user_reviews_query_count_is_constant(self, client, viewer, make_reviews):
+        url = reverse("user-reviews")
+        make_reviews(2, user=viewer)
+        few = self.count_queries(client, url)
+
+        make_reviews(8, user=viewer)
+        many = self.count_queries(client, url)
+
+        assert many == few
+
+    def test_school_list_query_count_is_constant(self, client, make_reviews):
+        url = reverse("get_schools")
+        make_reviews(2)
+        few = self.count_queries(client, url)
+
+        make_reviews(10)
+        many = self.count_queries(client, url)
+
+        assert many == few
+
+    def test_school_detail_query_count_is_constant(self, client, make_reviews):
+        school = make_reviews(1)[0].school
+        url = reverse("public-school-detail", args=[school.id])
+        few = self.count_queries(client, url)
+
+        make_reviews(10, school=school)
+        many = self.count_queries(client, url)
+
+        assert many == few
+
+    def test_listing_annotations_match_votes(self, client, viewer, make_reviews):
+        review = make_reviews(1)[0]
+        ReviewVote.objects.create(review=review, user=review.user, vote=0)
+
+        response = client.get(reverse("public-school-detail", args=[review.school.id]))
+
+        listed = response.data["reviews"][0]
+        assert listed["school_name"] == review.school.school_name
+        assert listed["user"]["id"] == review.user.id
+        assert listed["helpful_count"] == 1
+        assert listed["unhelpful_count"] == 1
+        assert listed["my_vote"] == 1
+        assert response.data["review_count"] == 1
+        assert response.data["average_rating"] == 6.9
+
+    def test_anonymous_listing_has_no_vote(self, make_reviews):
+        school = make_reviews(1)[0].school
+
+        response = APIClient().get(reverse("public-school-detail", args=[school.id]))
+
+        assert response.data["reviews"][0]["my_vote"] is None
@@ -0,0 +1,325 @@
+import pytest
+from datetime import timedelta
+from importlib import import_module
+from unittest.mock import MagicMock, patch
+from django.apps import apps
+from django.db import connections
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+from schools.models import Schools
+from reviews import summaries
+from reviews.models import Coach, Reviews, ReviewSummary
+from reviews.summaries import _lock_key, summary_lock
+
+RATINGS = {
+    "head_coach": 7,
+    "assistant_coaches": 7,
+    "team_culture": 7,
+    "campus_life": 7,
+    "athletic_facilities": 7,
+    "athletic_department": 7,
+    "player_development": 7,
+    "nil_opportunity": 7,
+}
+
+
+def completion(text):
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = text
+    return response
+
+
+def replies(overviews, coach_summaries):
+    """Mock side effect answering by prompt, since both calls run concurrently."""
+    overviews, coach_summaries = iter(overviews), iter(coach_summaries)
+
+    def create(messages, **kwargs):
+        general = "general aspects" in messages[0]["content"]
+        return completion(next(overviews if general else coach_summaries))
+
+    return create
+
+
+@pytest.mark.django_db
+class TestReviewSummaries:
+    @pytest.fixture
+    def school(self):
+        return Schools.objects.create(
+            school_name="Summary University",
+            mbb=True,
+            wbb=True,
+            fb=True,
+            conference="Test Conference",
+            location="Test Location",
+        )
+
+    @pytest.fixture
+    def users(self, django_user_model):
+        return [
+            django_user_model.objects.create_user(
+                email=f"summary{i}@example.com",
+                first_name="Summary",
+                last_name=f"User{i}",
+                password="password123",
+            )
+            for i in range(2)
+        ]
+
+    @pytest.fixture
+    def other_worker(self):
+        """A second database session, standing in for another worker."""
+        connection = connections.create_connection("default")
+        yield connection
+        connection.close()
+
+    def hold_lock(self, connection, school, sport="fb"):
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_lock(%s)", [_lock_key(school.id, sport)])
+
+    @pytest.fixture
+    def coach(self):
+        return Coach.objects.create(
+            name="Pat Coach", normalized_name="pat coach", sport="fb"
+        )
+
+    def create_review(self, school, user, coach_name="Pat Coach"):
+        return Reviews.objects.create(
+            school=school,
+            user=user,
+            sport="fb",
+            head_coach_name=coach_name,
+            review_message="Great coach and facilities.",
+            **RATINGS,
+        )
+
+    def get_summary(self, school):
+        return APIClient().get(
+            f"/api/public/schools/{school.id}/reviews/summary/?sport=fb"
+        )
+
+    def test_store_inserts_then_bumps_version(self, school, coach):
+        now = timezone.now()
+
+        assert ReviewSummary.objects.store(school, "fb", coach, "First", now)
+        assert ReviewSummary.objects.store(school, "fb", coach, "Second", now)
+
+        row = ReviewSummary.objects.get(school=school, sport="fb", coach=coach)
+        assert row.summary == "Second"
+        assert row.version == 2
+
+    def test_store_rejects_outdated_version(self, school, coach):
+        now = timezone.now()
+        ReviewSummary.objects.store(school, "fb", coach, "First", now)
+        ReviewSummary.objects.store(
+            school, "fb", coach, "Newer", now, expected_version=1
+        )
+
+        # A slower writer that read version 1 must not clobber the newer row
+        assert not ReviewSummary.objects.store(
+            school, "fb", coach, "Stale", now, expected_version=1
+        )
+        assert not ReviewSummary.objects.store(
+            school, "fb", coach, "Stale", now, expected_version=0
+        )
+        assert ReviewSummary.objects.get(coach=coach).summary == "Newer"
+
+    def test_rows_are_independent_of_each_other_and_the_school(self, school, coach):
+        school_updated_at = school.updated_at
+        now = timezone.now()
+
+        ReviewSummary.objects.store(school, "fb", None, "Overview", now)
+        ReviewSummary.objects.store(school, "fb", coach, "Coach", now)
+
+        assert ReviewSummary.objects.filter(school=school).count() == 2
+        assert ReviewSummary.objects.get(coach=None).summary == "Overview"
+        school.refresh_from_db()
+        assert school.updated_at == school_updated_at
+
+    @patch("openai.OpenAI")
+    def test_summary_reuses_fresh_rows(self, mock_openai, school, users):
+        create = mock_openai.return_value.chat.completions.create
+        create.side_effect = replies(["Overview"], ["Coach summary"])
+        self.create_review(school, users[0])
+
+        first = self.get_summary(school)
+        second = self.get_summary(school)
+
+        assert first.status_code == status.HTTP_200_OK
+        assert second.data["summary"] == first.data["summary"]
+        assert "Coach summary" in first.data["summary"]
+        assert create.call_count == 2
+        assert ReviewSummary.objects.filter(school=school, sport="fb").count() == 2
+
+    @patch("openai.OpenAI")
+    def test_new_review_makes_summaries_stale(self, mock_openai, school, users):
+        create = mock_openai.return_value.chat.completions.create
+        create.side_effect = replies(
+            ["Overview", "Overview 2"], ["Coach summary", "Coach summary 2"]
+        )
+        self.create_review(school, users[0])
+        self.get_summary(school)
+        school_updated_at = Schools.objects.get(id=school.id).updated_at
+
+        client = APIClient()
+        client.force_authenticate(user=users[1])
+        response = client.post(
+            "/api/reviews/review-form/",
+            {
+                "school": school.id,
+                "sport": "Football",
+                "head_coach_name": "Pat Coach",
+                "review_message": "Still great.",
+                **RATINGS,
+            },
+            format="json",
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        # Posting a review no longer rewrites the school row
+        assert Schools.objects.get(id=school.id).updated_at == school_updated_at
+
+        summary = self.get_summary(school).data["summary"]
+
+        assert "Coach summary 2" in summary
+        assert summary.endswith("Overview 2")
+        assert ReviewSummary.objects.get(coach=None, school=school).version == 2
+
+    @patch("openai.OpenAI")
+    def test_fallback_summary_is_retried(self, mock_openai, school, users):
+        create = mock_openai.return_value.chat.completions.create
+        create.side_effect = [
+            Exception("offline"),
+            Exception("offline"),
+            completion("Overview"),
+            completion("Coach summary"),
+        ]
+        self.create_review(school, users[0])
+
+        fallback = self.get_summary(school).data["summary"]
+        recovered = self.get_summary(school).data["summary"]
+
+        assert "Great coach and facilities." in fallback
+        assert "Coach summary" in recovered
+
+    def test_summary_lock_is_single_flight(self, school, other_worker):
+        self.hold_lock(other_worker, school)
+
+        with summary_lock(school.id, "fb", wait=0.2) as acquired:
+            assert not acquired
+        with summary_lock(school.id, "mbb", wait=0) as acquired:
+            assert acquired
+
+        with other_worker.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_unlock_all()")
+        with summary_lock(school.id, "fb", wait=0) as acquired:
+            assert acquired
+
+    @override_settings(PGBOUNCER_TRANSACTION_POOLING=True)
+    def test_summary_lock_skipped_behind_transaction_pooler(self, school, other_worker):
+        self.hold_lock(other_worker, school)
+
+        with summary_lock(school.id, "fb", wait=0) as acquired:
+            assert acquired
+
+    @override_settings(SUMMARY_LOCK_WAIT=0)
+    @patch("openai.OpenAI")
+    def test_locked_summary_serves_stored_rows(
+        self, mock_openai, school, users, other_worker
+    ):
+        review = self.create_review(school, users[0])
+        earlier = review.created_at - timedelta(days=1)
+        ReviewSummary.objects.store(school, "fb", None, "Stored overview", earlier)
+        ReviewSummary.objects.store(
+            school, "fb", review.coach, "Stored coach summary", earlier
+        )
+        self.hold_lock(other_worker, school)
+
+        summary = self.get_summary(school).data["summary"]
+
+        mock_openai.assert_not_called()
+        assert summary == (
+            "Stored coach summary\n\n**Program Overview**:\n\nStored overview"
+        )
+
+    @override_settings(SUMMARY_LOCK_WAIT=0)
+    @patch("openai.OpenAI")
+    def test_timed_out_waiter_serves_rows_stored_during_the_wait(
+        self, mock_openai, school, users, other_worker, monkeypatch
+    ):
+        review = self.create_review(school, users[0])
+        self.hold_lock(other_worker, school)
+        try_lock = summaries._try_lock
+
+        def holder_finishes_first(key):
+            # The lock holder stores its results while this request waits
+            ReviewSummary.objects.store(
+                school, "fb", None, "Fresh overview", review.created_at
+            )
+            ReviewSummary.objects.store(
+                school, "fb", review.coach, "Fresh coach summary", review.created_at
+            )
+            return try_lock(key)
+
+        monkeypatch.setattr(summaries, "_try_lock", holder_finishes_first)
+
+        summary = self.get_summary(school).data["summary"]
+
+        mock_openai.assert_not_called()
+        assert summary == (
+            "Fresh coach summary\n\n**Program Overview**:\n\nFresh overview"
+        )
+
+    @override_settings(SUMMARY_LOCK_WAIT=0)
+    @patch("openai.OpenAI")
+    def test_locked_summary_without_rows_uses_fallback(
+        self, mock_openai, school, users, other_worker
+    ):
+        self.create_review(school, users[0])
+        self.hold_lock(other_worker, school)
+
+        summary = self.get_summary(school).data["summary"]
+
+        mock_openai.assert_not_called()
+        assert "Great coach and facilities." in summary
+        assert not ReviewSummary.objects.exists()
+
+    def test_migration_copies_school_json(self, school, coach):
+        reviewed_at = timezone.now() - timedelta(days=1)
+        school.sport_summaries = {
+            "fb": {
+                "general_summary": "Old overview",
+                "Pat  Coach": "Old coach summary",
+                "Gone Coach": "Summary for an unseeded coach",
+            }
+        }
+        school.sport_review_dates = {"fb": {"Pat  Coach": reviewed_at.isoformat()}}
+        school.save()
+        migration = import_module("reviews.migrations.0020_copy_sport_summaries")
+
+        migration.copy_sport_summaries(apps, None)
+
+        rows = {
+            row.coach.name if row.coach else None: row
+            for row in ReviewSummary.objects.filter(school=school)
+        }
+        assert rows[None].summary == "Old overview"
+        assert rows[None].reviewed_through is None
+        assert rows["Pat Coach"].summary == "Old coach summary"
+        assert rows["Pat Coach"].reviewed_through == reviewed_at
+        assert rows["Gone Coach"].coach.normalized_name == "gone coach"
+
+    def test_migration_stores_display_name_keys_under_codes(self, school, coach):
+        school.sport_summaries = {
+            "Football": {"general_summary": "Old overview", "Pat Coach": "Old"}
+        }
+        school.save()
+        migration = import_module("reviews.migrations.0020_copy_sport_summaries")
+
+        migration.copy_sport_summaries(apps, None)
+
+        rows = ReviewSummary.objects.filter(school=school)
+        assert {row.sport for row in rows} == {"fb"}
+        assert rows.get(coach=None).summary == "Old overview"
+        assert rows.get(coach__isnull=False).coach_id == coach.id
@@ -3,11 +3,13 @@ from .views import (
     ReviewCreateView,
     UserReviewsView,
     ReviewVoteAPIView,
+    BulkReviewImportView,
     get_school_reviews,
 )
 
 urlpatterns = [
     path("review-form/", ReviewCreateView.as_view(), name="create-review"),
+    path("bulk-import/", BulkReviewImportView.as_view(), name="bulk-import-reviews"),
     path("user-reviews/", UserReviewsView.as_view(), name="user-reviews"),
     path("school/<int:school_id>/", get_school_reviews, name="school-reviews"),
     path("<uuid:review_id>/vote/", ReviewVoteAPIView.as_view(), name="review-vote"),
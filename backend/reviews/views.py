@@ -12,11 +12,14 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from .models import Reviews, ReviewVote
 from .serializers import ReviewsSerializer, ReviewVoteSerializer
+from .listing import review_payloads
 from .services import CoachSearchService
+from .importer import ImportFormatError, ReviewImporter, iter_records
+from .permissions import IsAdminRole
 from schools.models import Schools
 from django.http import JsonResponse
 from django.views.decorators.http import require_http_methods
-from django.db.models import Count, Q
+from django.db import IntegrityError
 from django.shortcuts import get_object_or_404
 import logging
 
@@ -42,27 +45,21 @@ class ReviewCreateView(generics.CreateAPIView):
             )
 
             # Only save the review with coach history if it exists in JSON
-            review = serializer.save(
+            serializer.save(
                 user=self.request.user,
                 coach_history=history,  # Will be None if not in JSON
                 coach_no_longer_at_university=False,  # This will be determined by frontend display logic
             )
 
-            # Only clear the summary for this specific coach
-            school = review.school
-            if school.sport_summaries and sport in school.sport_summaries:
-                # Get the existing summaries for this sport
-                sport_summaries = school.sport_summaries[sport]
-                # Only remove the summary for the coach being reviewed
-                if coach_name in sport_summaries:
-                    sport_summaries.pop(coach_name)
-                    school.sport_summaries[sport] = sport_summaries
-                    school.save()
-
             logger.info(
                 f"Successfully created review for {coach_name} at {school.school_name}"
             )
 
+        except IntegrityError:
+            # Lost a race with a concurrent submission for the same coach
+            raise serializers.ValidationError(
+                "You have already submitted a review for this coach at this school."
+            )
         except Exception as e:
             logger.error(f"Error creating review: {str(e)}")
             raise serializers.ValidationError(str(e))
@@ -73,16 +70,64 @@ class UserReviewsView(generics.ListAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        return Reviews.objects.filter(user=self.request.user)
+        return Reviews.objects.filter(user=self.request.user).for_listing(
+            self.request.user
+        )
+
+    def list(self, request, *args, **kwargs):
+        reviews = Reviews.objects.filter(user=request.user)
+        return Response(review_payloads(reviews, request))
 
 
 class ReviewViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = Reviews.objects.all().annotate(
-        helpful_count=Count("votes", filter=Q(votes__vote=1)),
-        unhelpful_count=Count("votes", filter=Q(votes__vote=0)),
-    )
+    queryset = Reviews.objects.all()
     serializer_class = ReviewsSerializer
 
+    def get_queryset(self):
+        return super().get_queryset().for_listing(self.request.user)
+
+    def list(self, request, *args, **kwargs):
+        return Response(review_payloads(self.queryset.all(), request))
+
+
+class BulkReviewImportView(APIView):
+    """
+    Admin-only bulk import. Accepts an NDJSON or CSV request body (or a
+    multipart upload in ``file``) and streams it through the chunked importer.
+    """
+
+    permission_classes = [IsAdminRole]
+
+    def post(self, request):
+        upload = None
+        if request.content_type.startswith("multipart/"):
+            upload = request.FILES.get("file")
+            if upload is None:
+                return Response(
+                    {"detail": "Upload the reviews in a 'file' field."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            is_csv = upload.name.lower().endswith(".csv")
+        else:
+            is_csv = request.content_type.startswith("text/csv")
+
+        stream = upload if upload is not None else request.stream
+        if stream is None:
+            return Response(
+                {"detail": "Request body is empty."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        fmt = "csv" if is_csv else "ndjson"
+        try:
+            result = ReviewImporter(dry_run="dry_run" in request.query_params).run(
+                iter_records(stream, fmt)
+            )
+        except ImportFormatError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(result.as_dict(), status=status.HTTP_200_OK)
+
 
 class ReviewVoteAPIView(APIView):
     permission_classes = [permissions.IsAuthenticated]
@@ -134,35 +179,20 @@ def get_school_reviews(request, school_id):
             return JsonResponse({"error": "Sport parameter is required"}, status=400)
 
         school = Schools.objects.get(id=school_id)
-        reviews = Reviews.objects.filter(school=school, sport=sport).order_by(
-            "-created_at"
+        reviews = (
+            Reviews.objects.filter(school=school, sport=sport)
+            .select_related("coach")
+            .order_by("-created_at")
         )
 
-        # Initialize coach service for checking tenure
-        coach_service = CoachSearchService()
-
         reviews_data = []
         for review in reviews:
-            # Check if coach is still at the school
-            history, _ = coach_service.search_coach_history(
-                review.head_coach_name, school.school_name, sport
+            # Tenure and current school come from the linked coach
+            coach = review.coach
+            history = coach.tenure if coach and coach.tenure else "No tenure found"
+            is_no_longer_at_school = bool(
+                coach and coach.tenure and not coach.is_at_school(school)
             )
-            is_no_longer_at_school = False
-
-            if history and history != "No tenure found":
-                tenure_entries = history.split("\n")
-                if tenure_entries:
-                    most_recent_tenure = tenure_entries[-1].lower()
-                    normalized_school_name = coach_service._normalize_name(
-                        school.school_name
-                    )
-                    logger.info(
-                        f"Comparing schools - Most recent tenure: {most_recent_tenure}, Normalized school name: {normalized_school_name}"
-                    )
-                    is_no_longer_at_school = not most_recent_tenure.endswith(
-                        f"@{normalized_school_name}"
-                    )
-                    logger.info(f"Is no longer at school: {is_no_longer_at_school}")
 
             review_data = {
                 "id": review.id,
@@ -0,0 +1,34 @@
+import logging
+
+from django.http import JsonResponse
+from django.shortcuts import aget_object_or_404
+from django.views.decorators.http import require_GET
+from rest_framework import status
+
+from reviews.summaries import abuild_review_summary
+
+from .models import Schools
+
+logger = logging.getLogger(__name__)
+
+
+@require_GET
+async def get_review_summary(request, school_id):
+    """Async ``schools.views.get_review_summary`` for ASGI mode."""
+    try:
+        sport = request.GET.get("sport")
+        if not sport:
+            return JsonResponse(
+                {"error": "Sport parameter is required"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        school = await aget_object_or_404(Schools, id=school_id)
+
+        return JsonResponse({"summary": await abuild_review_summary(school, sport)})
+
+    except Exception as e:
+        logger.error(f"Error in get_review_summary: {str(e)}")
+        return JsonResponse(
+            {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
@@ -0,0 +1,105 @@
+"""
+Shared-cache copies of the public school payloads.
+
+Anonymous requests for the school list and a school's detail are served from
+entries in the shared cache, kept for ``settings.SCHOOL_CACHE_TIMEOUT``
+seconds. Signed-in visitors skip the cache, since their payloads carry their
+own votes.
+
+Each school's payload is one entry, and the list is put together from the
+same entries. Entries are keyed by a catalog version and the school's own
+version. A write to a review, a vote or a reviewer's rendered fields replaces
+only that school's version (see ``schools/signals.py``), so the next request
+rebuilds just that school. Writes to schools themselves, and bulk writes that
+skip model signals, replace the catalog version with ``invalidate()``. The
+``warm_caches`` command fills the entries at deploy time.
+"""
+
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count
+
+from schools.listing import school_payloads
+from schools.models import Schools
+
+VERSION_KEY = "schools:payloads:version"
+
+
+def _school_version_key(pk):
+    return f"{VERSION_KEY}:{pk}"
+
+
+def _versions(keys):
+    """The version stored under each of ``keys``, creating missing ones."""
+    versions = cache.get_many(keys)
+    missing = [key for key in keys if key not in versions]
+    if missing:
+        for key in missing:
+            cache.add(key, uuid.uuid4().hex, None)
+        versions.update(cache.get_many(missing))
+    return versions
+
+
+def invalidate(school_ids=None):
+    """Stop serving the cached payloads of ``school_ids``, or of every school."""
+    if school_ids is None:
+        cache.set(VERSION_KEY, uuid.uuid4().hex, None)
+    elif school_ids:
+        cache.set_many(
+            {_school_version_key(pk): uuid.uuid4().hex for pk in school_ids}, None
+        )
+
+
+def _payloads(pks):
+    """``{pk: payload}`` for the schools among ``pks`` that exist."""
+    # Versions are read before building, so an entry built from rows that a
+    # concurrent write has since replaced is stored under the old version
+    version_keys = [VERSION_KEY, *(_school_version_key(pk) for pk in pks)]
+    versions = _versions(version_keys)
+    catalog = versions[VERSION_KEY]
+    keys = {
+        pk: f"schools:payloads:{catalog}:{versions[_school_version_key(pk)]}:{pk}"
+        for pk in pks
+    }
+    found = cache.get_many(keys.values())
+    payloads = {pk: found[key] for pk, key in keys.items() if key in found}
+    missing = [pk for pk in pks if pk not in payloads]
+    if missing:
+        built = {
+            payload["id"]: payload
+            for payload in school_payloads(Schools.objects.filter(pk__in=missing), None)
+        }
+        cache.set_many(
+            {keys[pk]: payload for pk, payload in built.items()},
+            settings.SCHOOL_CACHE_TIMEOUT,
+        )
+        payloads.update(built)
+    return payloads
+
+
+def school_list():
+    """Every school's payload, as an anonymous visitor sees it."""
+    ids_key = f"schools:payloads:{_versions([VERSION_KEY])[VERSION_KEY]}:ids"
+    ids = cache.get(ids_key)
+    if ids is None:
+        ids = list(Schools.objects.values_list("id", flat=True))
+        cache.set(ids_key, ids, settings.SCHOOL_CACHE_TIMEOUT)
+    payloads = _payloads(ids)
+    # A school deleted since the ids were cached has no payload
+    return [payloads[pk] for pk in ids if pk in payloads]
+
+
+def school_detail(pk):
+    """One school's payload as an anonymous visitor sees it, or None."""
+    return _payloads([pk]).get(pk)
+
+
+def most_reviewed(limit):
+    """Ids of the ``limit`` schools with the most reviews."""
+    return list(
+        Schools.objects.annotate(review_total=Count("reviews"))
+        .order_by("-review_total", "id")
+        .values_list("id", flat=True)[:limit]
+    )
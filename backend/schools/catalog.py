@@ -0,0 +1,73 @@
+"""
+Seeding of the school catalog from ``schools/fixtures``.
+
+Every ``*.json`` fixture there is read and its schools upserted by primary
+key in a single ``INSERT ... ON CONFLICT`` statement, so seeding is cheap
+enough to run on every migrate and deploy. Rows that already match their
+fixture aren't written, which leaves their ``updated_at`` alone.
+"""
+
+import json
+from pathlib import Path
+
+from django.core.management.color import no_style
+from django.db import connection, transaction
+from django.utils import timezone
+
+from schools import cache
+from schools.models import Schools
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def read_catalog(fixtures_dir=FIXTURES_DIR):
+    """The schools in every fixture, as ``{pk: fields}``."""
+    catalog = {}
+    for path in sorted(Path(fixtures_dir).glob("*.json")):
+        with open(path, "r") as file:
+            for entry in json.load(file):
+                if entry.get("model", "").lower() == "schools.schools":
+                    catalog[entry["pk"]] = entry["fields"]
+    return catalog
+
+
+def seed_catalog(fixtures_dir=FIXTURES_DIR):
+    """
+    Upsert the fixture schools. Safe to re-run: only new or changed schools
+    are written. Returns ``(created, updated)``.
+    """
+    catalog = read_catalog(fixtures_dir)
+    columns = sorted({name for fields in catalog.values() for name in fields})
+    existing = {
+        row[0]: row[1:]
+        for row in Schools.objects.filter(pk__in=catalog).values_list("pk", *columns)
+    }
+
+    now = timezone.now()
+    changed, created = [], 0
+    for pk, fields in catalog.items():
+        school = Schools(pk=pk, created_at=now, updated_at=now, **fields)
+        values = tuple(getattr(school, name) for name in columns)
+        if pk not in existing:
+            created += 1
+        elif existing[pk] == values:
+            continue
+        changed.append(school)
+
+    if changed:
+        with transaction.atomic():
+            Schools.objects.bulk_create(
+                changed,
+                batch_size=1000,
+                update_conflicts=True,
+                unique_fields=["id"],
+                update_fields=[*columns, "updated_at"],
+            )
+            # Rows were inserted with explicit ids, so move the sequence past
+            # them like loaddata does
+            with connection.cursor() as cursor:
+                for sql in connection.ops.sequence_reset_sql(no_style(), [Schools]):
+                    cursor.execute(sql)
+        # bulk_create sends no post_save, so drop the cached payloads here
+        cache.invalidate()
+    return created, len(changed) - created
@@ -0,0 +1,81 @@
+"""
+Fast path for read-only school lists.
+
+``school_payloads()`` builds the same dicts as
+``SchoolSerializer(many=True).data`` from ``.values()`` rows: one query for
+the schools and one for all of their reviews, with the reviews built by
+``reviews.listing``. ``schools/tests/test_school_listing.py`` checks the
+output stays identical to the serializer's.
+"""
+
+from collections import defaultdict
+
+from config.instrumentation import timed
+from reviews.listing import review_payload, review_rows
+from reviews.models import Reviews
+
+# (flag column, display name), in the order of get_available_sports()
+SPORT_FLAGS = (
+    ("mbb", "Men's Basketball"),
+    ("wbb", "Women's Basketball"),
+    ("fb", "Football"),
+    ("vb", "Volleyball"),
+    ("ba", "Baseball"),
+    ("msoc", "Men's Soccer"),
+    ("wsoc", "Women's Soccer"),
+    ("wr", "Wrestling"),
+)
+
+SCHOOL_COLUMNS = (
+    "id",
+    "school_name",
+    *(flag for flag, _ in SPORT_FLAGS),
+    "conference",
+    "location",
+)
+
+RATING_COLUMNS = (
+    "head_coach",
+    "assistant_coaches",
+    "team_culture",
+    "campus_life",
+    "athletic_facilities",
+    "athletic_department",
+    "player_development",
+    "nil_opportunity",
+)
+
+
+def _average_rating(reviews):
+    # Same arithmetic, in the same order, as SchoolSerializer.get_average_rating
+    if not reviews:
+        return 0
+    total_avg = 0
+    for review in reviews:
+        total_avg += sum(review[column] for column in RATING_COLUMNS) / 8
+    return round(total_avg / len(reviews), 1)
+
+
+def school_payload(row, reviews):
+    """One school's response dict, given its review rows newest first."""
+    payload = {column: row[column] for column in SCHOOL_COLUMNS}
+    payload["available_sports"] = [
+        display for flag, display in SPORT_FLAGS if row[flag]
+    ]
+    payload["reviews"] = [review_payload(review) for review in reviews]
+    payload["review_count"] = len(reviews)
+    payload["average_rating"] = _average_rating(reviews)
+    return payload
+
+
+def school_payloads(schools, request):
+    """``SchoolSerializer(schools, many=True).data`` without the serializer."""
+    rows = list(schools.values(*SCHOOL_COLUMNS))
+    reviews = Reviews.objects.filter(
+        school_id__in=[row["id"] for row in rows]
+    ).order_by("-created_at")
+    by_school = defaultdict(list)
+    for review in review_rows(reviews, getattr(request, "user", None)):
+        by_school[review["school_id"]].append(review)
+    with timed("serialize"):
+        return [school_payload(row, by_school[row["id"]]) for row in rows]
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from schools.catalog import seed_catalog
+
+
+class Command(BaseCommand):
+    help = "Create or refresh schools from every fixture in schools/fixtures."
+
+    def handle(self, *args, **options):
+        created, updated = seed_catalog()
+        self.stdout.write(
+            self.style.SUCCESS(f"Schools: {created} created, {updated} updated")
+        )
@@ -0,0 +1,104 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from reviews.services import preload_tenure_indexes
+from reviews.summaries import refresh_batch, stale_school_sports
+from schools import cache
+from schools.models import Schools
+
+
+def _detail(pk):
+    try:
+        return cache.school_detail(pk) is not None
+    finally:
+        # Each pool thread has its own connection; don't leave it open
+        connections.close_all()
+
+
+class Command(BaseCommand):
+    help = (
+        "Fill the caches after a deploy: the coach tenure index, the school "
+        "list and the most reviewed schools' details."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--top",
+            type=int,
+            default=None,
+            help="Schools to precompute details for, most reviewed first "
+            "(defaults to WARM_CACHE_TOP_SCHOOLS)",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Threads building entries (defaults to WARM_CACHE_WORKERS)",
+        )
+        parser.add_argument(
+            "--summaries",
+            action="store_true",
+            help="Also regenerate the top schools' stale review summaries "
+            "(calls the model)",
+        )
+
+    def handle(self, *args, **options):
+        top = (
+            settings.WARM_CACHE_TOP_SCHOOLS
+            if options["top"] is None
+            else options["top"]
+        )
+        workers = (
+            settings.WARM_CACHE_WORKERS
+            if options["workers"] is None
+            else options["workers"]
+        )
+        if top < 0 or workers < 1:
+            raise CommandError(
+                "--top can't be negative and --workers must be at least 1"
+            )
+        if isinstance(caches["default"], LocMemCache):
+            self.stderr.write(
+                "The cache is local to this process, so the server's workers "
+                "won't see these entries; set REDIS_URL to share them."
+            )
+
+        started = time.perf_counter()
+        # Entries from the previous release may have a different shape
+        cache.invalidate()
+        self._step("tenure index", lambda: f"{preload_tenure_indexes()} coaches")
+        self._step("school list", lambda: f"{len(cache.school_list())} schools")
+
+        school_ids = cache.most_reviewed(top) if top else []
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            self._step(
+                "school details",
+                lambda: f"{sum(pool.map(_detail, school_ids))} schools",
+            )
+
+        if options["summaries"] and school_ids:
+            self._step("summaries", lambda: self._summaries(school_ids))
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Caches warmed in {time.perf_counter() - started:.2f}s")
+        )
+
+    def _step(self, name, run):
+        started = time.perf_counter()
+        detail = run()
+        elapsed = (time.perf_counter() - started) * 1000
+        self.stdout.write(f"{name:<16}{elapsed:>10.1f} ms   {detail}")
+
+    def _summaries(self, school_ids):
+        schools = Schools.objects.in_bulk(school_ids)
+        pending = stale_school_sports(school_ids)
+        result = refresh_batch(
+            [(schools[school_id], sport) for school_id, sport in sorted(pending)]
+        )
+        return f"{result.regenerated} regenerated, {result.failed} failed"
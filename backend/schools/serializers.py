@@ -2,13 +2,29 @@ from rest_framework import serializers
 from .models import Schools
 from reviews.models import Reviews
 from reviews.serializers import ReviewsSerializer
-from django.db.models import Count, Q
+from django.db.models import Prefetch
+from config.instrumentation import TimedSerializerMixin
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-class SchoolSerializer(serializers.ModelSerializer):
+def with_listed_reviews(schools, request):
+    """
+    Prefetch what ``SchoolSerializer`` shows of each school's reviews, so a
+    list of schools serializes in two queries however many there are.
+    """
+    user = getattr(request, "user", None)
+    return schools.prefetch_related(
+        Prefetch(
+            "reviews_set",
+            queryset=Reviews.objects.for_listing(user).order_by("-created_at"),
+            to_attr="listed_reviews",
+        )
+    )
+
+
+class SchoolSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     available_sports = serializers.SerializerMethodField()
     reviews = serializers.SerializerMethodField()
     review_count = serializers.SerializerMethodField()
@@ -55,23 +71,28 @@ class SchoolSerializer(serializers.ModelSerializer):
             sports.append("Wrestling")
         return sports
 
-    def get_reviews(self, obj):
-        qs = (
-            Reviews.objects.filter(school=obj)
-            .annotate(
-                helpful_count=Count("votes", filter=Q(votes__vote=1)),
-                unhelpful_count=Count("votes", filter=Q(votes__vote=0)),
+    def _reviews(self, obj):
+        # Prefetched by with_listed_reviews(), or loaded once per school
+        if not hasattr(obj, "listed_reviews"):
+            request = self.context.get("request")
+            obj.listed_reviews = list(
+                Reviews.objects.filter(school=obj)
+                .for_listing(getattr(request, "user", None))
+                .order_by("-created_at")
             )
-            .order_by("-created_at")
-        )
-        return ReviewsSerializer(qs, many=True, context=self.context).data
+        return obj.listed_reviews
+
+    def get_reviews(self, obj):
+        return ReviewsSerializer(
+            self._reviews(obj), many=True, context=self.context
+        ).data
 
     def get_review_count(self, obj):
-        return Reviews.objects.filter(school=obj.id).count()
+        return len(self._reviews(obj))
 
     def get_average_rating(self, obj):
-        reviews = Reviews.objects.filter(school=obj.id)
-        if not reviews.exists():
+        reviews = self._reviews(obj)
+        if not reviews:
             return 0
 
         # Calculate the average of all rating fields
@@ -1,14 +1,76 @@
-from django.core.management import call_command
-from django.db.models.signals import post_migrate
-from django.dispatch import receiver
-from schools.models import Schools
-
-
-@receiver(post_migrate)
-def load_initial_data(sender, **kwargs):
-    if sender.name == "schools":
-        if not Schools.objects.exists():
-            print("Auto-loading fixture data...")
-            call_command("loaddata", "schools/fixtures/big10.json")
-            call_command("loaddata", "schools/fixtures/big12.json")
-            call_command("loaddata", "schools/fixtures/sec.json")
+from django.db import transaction
+from django.db.models.signals import post_delete, post_migrate, post_save
+from django.dispatch import receiver
+from reviews.models import Reviews, ReviewVote
+from schools import cache
+from schools.catalog import seed_catalog
+from schools.models import Schools
+from users.models import Users
+
+
+@receiver(post_migrate)
+def load_initial_data(sender, **kwargs):
+    # Cheap when nothing changed, so it runs on every migrate
+    if sender.name == "schools":
+        created, updated = seed_catalog()
+        if created or updated:
+            print(f"Seeded school catalog: {created} created, {updated} updated")
+
+
+# Fields of a reviewer that appear in the payloads of the schools they reviewed
+RENDERED_USER_FIELDS = {"is_school_verified", "profile_picture"}
+
+# Review fields that are filled in lazily and don't change the payload
+UNRENDERED_REVIEW_FIELDS = {"coach", "head_coach_name_normalized"}
+
+
+def _invalidate(school_ids=None):
+    # Now, and again once committed in case a request cached the old rows
+    # in between
+    cache.invalidate(school_ids)
+    transaction.on_commit(lambda: cache.invalidate(school_ids))
+
+
+@receiver(post_save, sender=Schools)
+@receiver(post_delete, sender=Schools)
+def invalidate_school_payloads(sender, **kwargs):
+    _invalidate()
+
+
+@receiver(post_save, sender=Reviews)
+@receiver(post_delete, sender=Reviews)
+def invalidate_reviewed_school(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and update_fields <= UNRENDERED_REVIEW_FIELDS:
+        return
+    _invalidate([instance.school_id])
+
+
+@receiver(post_save, sender=ReviewVote)
+@receiver(post_delete, sender=ReviewVote)
+def invalidate_voted_school(sender, instance, **kwargs):
+    if ReviewVote.review.is_cached(instance):
+        school_ids = [instance.review.school_id]
+    else:
+        school_ids = list(
+            Reviews.objects.filter(pk=instance.review_id).values_list(
+                "school_id", flat=True
+            )
+        )
+    _invalidate(school_ids)
+
+
+@receiver(post_save, sender=Users)
+def invalidate_reviewer_schools(
+    sender, instance, created, update_fields=None, **kwargs
+):
+    # Deleting a user deletes their reviews, which invalidate their schools
+    if created or (
+        update_fields is not None and not update_fields & RENDERED_USER_FIELDS
+    ):
+        return
+    school_ids = list(
+        Reviews.objects.filter(user=instance)
+        .values_list("school_id", flat=True)
+        .distinct()
+    )
+    _invalidate(school_ids)
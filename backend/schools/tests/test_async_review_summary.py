@@ -0,0 +1,129 @@
+import json
+import time
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import RequestFactory
+from schools.async_views import get_review_summary
+from schools.models import Schools
+from reviews import summaries
+from reviews.models import Reviews, ReviewSummary
+
+
+def by_prompt(body):
+    if "general aspects" in body["messages"][0]["content"]:
+        return "Overview from stub"
+    return "Coach summary from stub"
+
+
+@pytest.mark.django_db
+class TestAsyncReviewSummary:
+    @pytest.fixture
+    def school(self, django_user_model):
+        school = Schools.objects.create(
+            school_name="Async University",
+            mbb=True,
+            wbb=True,
+            fb=True,
+            conference="Test Conference",
+            location="Test Location",
+        )
+        user = django_user_model.objects.create(email="async@example.com")
+        Reviews.objects.create(
+            school=school,
+            user=user,
+            sport="fb",
+            head_coach_name="Pat Coach",
+            review_message="Great coaching staff.",
+            head_coach=8,
+            assistant_coaches=8,
+            team_culture=8,
+            campus_life=8,
+            athletic_facilities=8,
+            athletic_department=8,
+            player_development=8,
+            nil_opportunity=8,
+        )
+        return school
+
+    def get_summary(self, school_id, query="?sport=fb"):
+        request = RequestFactory().get(
+            f"/api/public/schools/{school_id}/reviews/summary/{query}"
+        )
+        return async_to_sync(get_review_summary)(request, school_id=school_id)
+
+    def test_summary_is_generated_and_stored(self, llm_stub, school):
+        llm_stub.default_reply = by_prompt
+
+        response = self.get_summary(school.id)
+
+        assert response.status_code == 200
+        summary = json.loads(response.content)["summary"]
+        assert "Coach summary from stub" in summary
+        assert summary.endswith("Overview from stub")
+        assert ReviewSummary.objects.filter(school=school).count() == 2
+
+    def test_stored_summary_is_served_without_calls(self, llm_stub, school):
+        first = json.loads(self.get_summary(school.id).content)["summary"]
+
+        second = json.loads(self.get_summary(school.id).content)["summary"]
+
+        assert first == second
+        assert len(llm_stub.requests) == 2
+
+    def test_calls_run_concurrently(self, llm_stub, school):
+        llm_stub.delay(0.5)
+        llm_stub.delay(0.5)
+
+        started = time.monotonic()
+        response = self.get_summary(school.id)
+
+        assert response.status_code == 200
+        assert time.monotonic() - started < 0.9
+
+    def test_unavailable_model_falls_back_to_reviews(self, llm_stub, settings, school):
+        settings.LLM_MAX_RETRIES = 0
+        llm_stub.fail(500)
+        llm_stub.fail(500)
+
+        response = self.get_summary(school.id)
+
+        assert response.status_code == 200
+        assert "Great coaching staff." in json.loads(response.content)["summary"]
+
+    def test_timed_out_waiter_rereads_stored_rows(
+        self, llm_stub, settings, school, monkeypatch
+    ):
+        settings.SUMMARY_LOCK_WAIT = 0
+        review = Reviews.objects.get(school=school)
+
+        def held_elsewhere(key):
+            # The lock holder stores its results while this request waits
+            ReviewSummary.objects.store(
+                school, "fb", None, "Fresh overview", review.created_at
+            )
+            ReviewSummary.objects.store(
+                school, "fb", review.coach, "Fresh coach summary", review.created_at
+            )
+            return False
+
+        monkeypatch.setattr(summaries, "_try_lock", held_elsewhere)
+
+        summary = json.loads(self.get_summary(school.id).content)["summary"]
+
+        assert llm_stub.requests == []
+        assert summary == (
+            "Fresh coach summary\n\n**Program Overview**:\n\nFresh overview"
+        )
+
+    def test_missing_sport(self, school):
+        response = self.get_summary(school.id, query="")
+
+        assert response.status_code == 400
+        assert json.loads(response.content) == {"error": "Sport parameter is required"}
+
+    def test_no_reviews(self, school):
+        response = self.get_summary(school.id, query="?sport=mbb")
+
+        assert json.loads(response.content)["summary"] == (
+            "No reviews available for Men's Basketball at Async University yet."
+        )
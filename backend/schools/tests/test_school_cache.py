@@ -0,0 +1,187 @@
+import pytest
+from django.core.cache import cache as default_cache
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from reviews import services
+from reviews.models import Reviews, ReviewVote
+from schools import cache
+from schools.models import Schools
+
+
+def review(school, user, **fields):
+    return Reviews.objects.create(
+        school=school,
+        user=user,
+        sport="mbb",
+        head_coach_name="Coach Cache",
+        review_message="Cached.",
+        head_coach=5,
+        assistant_coaches=5,
+        team_culture=5,
+        campus_life=5,
+        athletic_facilities=5,
+        athletic_department=5,
+        player_development=5,
+        nil_opportunity=5,
+        **fields,
+    )
+
+
+def get(client, url):
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(url)
+    assert response.status_code == 200
+    return response.json(), len(queries)
+
+
+@pytest.fixture
+def school(db):
+    return Schools.objects.create(
+        school_name="Cache University",
+        mbb=True,
+        wbb=False,
+        fb=False,
+        conference="Test",
+        location="Here",
+    )
+
+
+@pytest.fixture
+def author(django_user_model):
+    return django_user_model.objects.create(email="cache-author@example.com")
+
+
+@pytest.mark.django_db
+class TestSchoolPayloadCache:
+    @pytest.mark.parametrize("url_name", ["get_schools", "public-school-list"])
+    def test_anonymous_list_is_served_from_cache(self, school, author, url_name):
+        review(school, author)
+        client = APIClient()
+
+        first, _ = get(client, reverse(url_name))
+        second, queries = get(client, reverse(url_name))
+
+        assert second == first
+        assert queries == 0
+
+    def test_anonymous_detail_is_served_from_cache(self, school, author):
+        review(school, author)
+        client = APIClient()
+        url = reverse("public-school-detail", args=[school.id])
+
+        first, _ = get(client, url)
+        second, queries = get(client, url)
+
+        assert second == first
+        assert queries == 0
+        assert first["review_count"] == 1
+
+    def test_missing_school_is_404(self, db):
+        response = APIClient().get(reverse("public-school-detail", args=[999999]))
+
+        assert response.status_code == 404
+
+    def test_writes_invalidate(self, school, author, django_user_model):
+        client = APIClient()
+        url = reverse("public-school-detail", args=[school.id])
+        get(client, url)
+
+        new_review = review(school, author)
+        payload, _ = get(client, url)
+        assert payload["review_count"] == 1
+
+        voter = django_user_model.objects.create(email="voter@example.com")
+        ReviewVote.objects.create(review=new_review, user=voter, vote=1)
+        payload, _ = get(client, url)
+        assert payload["reviews"][0]["helpful_count"] == 1
+
+        author.profile_picture = "pic2.png"
+        author.save()
+        payload, _ = get(client, url)
+        assert payload["reviews"][0]["user"]["profile_picture"] == "pic2.png"
+
+    def test_vote_rebuilds_only_its_school(self, school, author, django_user_model):
+        other = Schools.objects.create(
+            school_name="Other University",
+            mbb=True,
+            wbb=False,
+            fb=False,
+            conference="Test",
+            location="There",
+        )
+        voted = review(school, author)
+        review(other, author)
+        client = APIClient()
+        get(client, reverse("get_schools"))
+
+        voter = django_user_model.objects.create(email="voter@example.com")
+        ReviewVote.objects.create(review=voted, user=voter, vote=1)
+
+        with CaptureQueriesContext(connection) as queries:
+            other_payload = cache.school_detail(other.id)
+        assert len(queries) == 0
+        assert other_payload["review_count"] == 1
+        payload, _ = get(client, reverse("public-school-detail", args=[school.id]))
+        assert payload["reviews"][0]["helpful_count"] == 1
+
+    @pytest.mark.parametrize(
+        "save",
+        [
+            lambda review: review.user.save(update_fields=["last_login"]),
+            lambda review: review.save(update_fields=["coach"]),
+        ],
+        ids=["last_login", "lazy coach link"],
+    )
+    def test_unrendered_writes_keep_the_cache(self, school, author, save):
+        new_review = review(school, author)
+        cache.school_list()
+
+        save(new_review)
+
+        with CaptureQueriesContext(connection) as queries:
+            cache.school_list()
+        assert len(queries) == 0
+
+    def test_signed_in_visitors_skip_the_cache(self, school, author):
+        new_review = review(school, author)
+        ReviewVote.objects.create(review=new_review, user=author, vote=0)
+        client = APIClient()
+        client.force_authenticate(author)
+
+        payload, _ = get(client, reverse("get_schools"))
+
+        mine = next(s for s in payload if s["id"] == school.id)
+        assert mine["reviews"][0]["my_vote"] == 0
+        assert all(
+            review["my_vote"] is None
+            for s in cache.school_list()
+            for review in s["reviews"]
+        )
+
+
+@pytest.mark.django_db(transaction=True)
+class TestWarmCaches:
+    def test_warms_tenure_index_list_and_top_schools(self, school, author, capsys):
+        review(school, author)
+        services._tenure_indexes.clear()
+        default_cache.clear()
+
+        call_command("warm_caches", "--top", "3", "--workers", "2")
+
+        out = capsys.readouterr().out
+        assert "tenure index" in out and "Caches warmed in" in out
+        assert "3 schools" in out
+        assert set(services._tenure_indexes) == {"mbb", "wbb"}
+        assert cache.most_reviewed(3)[0] == school.id
+        with CaptureQueriesContext(connection) as queries:
+            assert cache.school_detail(school.id)["review_count"] == 1
+            assert cache.school_list()
+        assert len(queries) == 0
+
+    def test_rejects_bad_options(self, db):
+        with pytest.raises(Exception, match="--workers"):
+            call_command("warm_caches", "--workers", "0")
@@ -0,0 +1,72 @@
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from schools.listing import school_payloads
+from schools.models import Schools
+from schools.serializers import SchoolSerializer, with_listed_reviews
+from reviews.models import Reviews, ReviewVote
+
+
+@pytest.mark.django_db
+class TestSchoolListingFastPath:
+    @pytest.fixture
+    def schools(self):
+        return [
+            Schools.objects.create(
+                school_name=f"Listing School {i}",
+                mbb=i % 2 == 0,
+                wbb=True,
+                fb=i != 1,
+                wr=i == 2,
+                conference="Test Conference",
+                location="Test Location",
+            )
+            for i in range(3)
+        ]
+
+    @pytest.fixture
+    def user(self, django_user_model):
+        return django_user_model.objects.create(email="fastpath@example.com")
+
+    @pytest.fixture
+    def reviews(self, schools, user, django_user_model):
+        reviews = []
+        for i in range(4):
+            author = django_user_model.objects.create(email=f"author{i}@example.com")
+            reviews.append(
+                Reviews.objects.create(
+                    school=schools[i % 2],
+                    user=author,
+                    sport="wbb",
+                    head_coach_name=f"Coach {i}",
+                    review_message="Fine.",
+                    head_coach=i + 3,
+                    assistant_coaches=7,
+                    team_culture=4,
+                    campus_life=9,
+                    athletic_facilities=6,
+                    athletic_department=5,
+                    player_development=8,
+                    nil_opportunity=1,
+                )
+            )
+        ReviewVote.objects.create(review=reviews[2], user=user, vote=1)
+        return reviews
+
+    @pytest.mark.parametrize("authenticated", [True, False])
+    def test_fast_path_matches_serializer(self, schools, reviews, user, authenticated):
+        request = Request(APIRequestFactory().get("/"))
+        request.user = user if authenticated else AnonymousUser()
+        queryset = Schools.objects.order_by("id")
+
+        serialized = SchoolSerializer(
+            with_listed_reviews(queryset, request),
+            many=True,
+            context={"request": request},
+        ).data
+        fast = school_payloads(queryset, request)
+
+        assert JSONRenderer().render(fast) == JSONRenderer().render(serialized)
+        assert fast[-1]["reviews"] == [] and fast[-1]["average_rating"] == 0
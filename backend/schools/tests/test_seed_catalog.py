@@ -0,0 +1,96 @@
+import json
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from schools.catalog import read_catalog, seed_catalog
+from schools.models import Schools
+
+
+def fixture(pk, name, conference="Test", **fields):
+    return {
+        "model": "schools.Schools",
+        "pk": pk,
+        "fields": {
+            "school_name": name,
+            "mbb": True,
+            "wbb": True,
+            "fb": False,
+            "conference": conference,
+            "location": "Somewhere",
+            **fields,
+        },
+    }
+
+
+@pytest.fixture
+def fixtures_dir(tmp_path):
+    (tmp_path / "a.json").write_text(
+        json.dumps([fixture(9001, "Alpha"), fixture(9002, "Beta")])
+    )
+    (tmp_path / "b.json").write_text(json.dumps([fixture(9003, "Gamma")]))
+    return tmp_path
+
+
+@pytest.mark.django_db
+class TestSeedCatalog:
+    def test_every_fixture_is_seeded(self):
+        catalog = read_catalog()
+
+        assert Schools.objects.filter(pk__in=catalog).count() == len(catalog)
+        # acc.json used to be skipped
+        assert Schools.objects.filter(conference="ACC").exists()
+
+    def test_creates_then_leaves_unchanged_rows_alone(self, fixtures_dir):
+        assert seed_catalog(fixtures_dir) == (3, 0)
+        updated_at = Schools.objects.get(pk=9001).updated_at
+
+        with CaptureQueriesContext(connection) as queries:
+            assert seed_catalog(fixtures_dir) == (0, 0)
+
+        assert len(queries) == 1
+        assert Schools.objects.get(pk=9001).updated_at == updated_at
+
+    def test_updates_changed_rows(self, fixtures_dir):
+        seed_catalog(fixtures_dir)
+        Schools.objects.filter(pk=9002).update(location="Elsewhere", wr=True)
+        (fixtures_dir / "b.json").write_text(
+            json.dumps([fixture(9003, "Gamma", conference="Renamed")])
+        )
+
+        assert seed_catalog(fixtures_dir) == (0, 2)
+
+        assert Schools.objects.get(pk=9002).location == "Somewhere"
+        # Fields the fixture leaves out are left as they are
+        assert Schools.objects.get(pk=9002).wr is True
+        assert Schools.objects.get(pk=9003).conference == "Renamed"
+
+    def test_sequence_moves_past_seeded_ids(self, fixtures_dir):
+        seed_catalog(fixtures_dir)
+
+        school = Schools.objects.create(
+            school_name="New", mbb=True, wbb=True, fb=True, conference="X", location="Y"
+        )
+
+        assert school.pk > 9003
+
+    def test_thousands_of_schools_seed_in_a_few_queries(self, tmp_path):
+        (tmp_path / "big.json").write_text(
+            json.dumps([fixture(10000 + i, f"School {i}") for i in range(5000)])
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            assert seed_catalog(tmp_path) == (5000, 0)
+
+        # Existing rows, 5 batches of 1000 and the sequence reset
+        inserts = [q for q in queries if q["sql"].startswith("INSERT")]
+        assert len(inserts) == 5
+        assert len(queries) <= 10
+
+    def test_command(self, fixtures_dir, capsys, monkeypatch):
+        monkeypatch.setattr("schools.catalog.FIXTURES_DIR", fixtures_dir)
+        call_command("seed_catalog")
+
+        assert "0 created, 0 updated" in capsys.readouterr().out
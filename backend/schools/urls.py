@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.urls import path
 from .views import (
     SchoolListView,
@@ -11,6 +12,9 @@ from .views import (
     debug_reviews,
 )
 
+if settings.ASYNC_VIEWS:
+    from .async_views import get_review_summary  # noqa: F811
+
 urlpatterns = [
     # Public endpoints (no authentication required)
     path("public/schools/", SchoolListView.as_view(), name="public-school-list"),
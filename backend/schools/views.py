@@ -3,27 +3,34 @@ from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
 from rest_framework.decorators import api_view, permission_classes
 from .models import Schools
-from .serializers import SchoolSerializer
+from .serializers import SchoolSerializer, with_listed_reviews
+from .listing import school_payloads
+from . import cache
 from reviews.models import Reviews
-from openai import OpenAI
+from reviews.summaries import build_review_summary
 from django.conf import settings
 import logging
 from django.db import models
 from preferences.models import Preferences
 from django.shortcuts import get_object_or_404
-import openai
 import os
 from datetime import datetime
-from reviews.services import CoachSearchService
 
 logger = logging.getLogger(__name__)
 
 
 @api_view(["GET"])
 def get_schools(request):
-    schools = Schools.objects.all()
-    serializer = SchoolSerializer(schools, many=True, context={"request": request})
-    return Response(serializer.data)
+    if not request.user.is_authenticated:
+        return Response(cache.school_list())
+    return Response(school_payloads(Schools.objects.all(), request))
+
+
+class ListedReviewsMixin:
+    """Prefetch the reviews ``SchoolSerializer`` nests in each school."""
+
+    def get_queryset(self):
+        return with_listed_reviews(super().get_queryset(), self.request)
 
 
 # Public views
@@ -32,64 +39,42 @@ class SchoolListView(generics.ListAPIView):
     serializer_class = SchoolSerializer
     permission_classes = [AllowAny]
 
+    def list(self, request, *args, **kwargs):
+        if not request.user.is_authenticated:
+            return Response(cache.school_list())
+        schools = self.filter_queryset(self.get_queryset())
+        return Response(school_payloads(schools, request))
+
 
-class SchoolDetailView(generics.RetrieveAPIView):
+class SchoolDetailView(ListedReviewsMixin, generics.RetrieveAPIView):
     queryset = Schools.objects.all()
     serializer_class = SchoolSerializer
     permission_classes = [AllowAny]
 
+    def retrieve(self, request, *args, **kwargs):
+        if not request.user.is_authenticated:
+            payload = cache.school_detail(kwargs["pk"])
+            if payload is not None:
+                return Response(payload)
+        # Signed in, or no such school (raises the usual 404)
+        return super().retrieve(request, *args, **kwargs)
+
 
 # Protected views
-class ProtectedSchoolListView(generics.ListCreateAPIView):
+class ProtectedSchoolListView(ListedReviewsMixin, generics.ListCreateAPIView):
     queryset = Schools.objects.all()
     serializer_class = SchoolSerializer
     permission_classes = [IsAuthenticated]
 
 
-class ProtectedSchoolDetailView(generics.RetrieveUpdateDestroyAPIView):
+class ProtectedSchoolDetailView(
+    ListedReviewsMixin, generics.RetrieveUpdateDestroyAPIView
+):
     queryset = Schools.objects.all()
     serializer_class = SchoolSerializer
     permission_classes = [IsAuthenticated]
 
 
-def _normalize_coach_name(name):
-    """Normalize coach name by converting to lowercase and stripping whitespace."""
-    return name.lower().strip()
-
-
-def _standardize_coach_name(name):
-    """Standardize coach name capitalization (e.g., 'jan JENSEN' -> 'Jan Jensen')."""
-    # Split into words and capitalize each word
-    words = name.split()
-    standardized = " ".join(word.capitalize() for word in words)
-    return standardized
-
-
-def _normalize_school_name(name):
-    if not name:
-        return [""]
-    # Replace en-dash and em-dash with hyphen for school names
-    name = name.lower().strip().replace("–", "-").replace("—", "-")
-
-    # Handle common university name patterns
-    normalized_names = [name]
-
-    # If it starts with "university of", add the version without it
-    if name.startswith("university of "):
-        normalized_names.append(name.replace("university of ", ""))
-
-    # If it ends with "university", add the version without it
-    if name.endswith(" university"):
-        normalized_names.append(name.replace(" university", ""))
-
-    # If it's just a single word, add "university" and "university of" versions
-    if " " not in name:
-        normalized_names.append(f"{name} university")
-        normalized_names.append(f"university of {name}")
-
-    return list(set(normalized_names))  # Remove any duplicates
-
-
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def get_review_summary(request, school_id):
@@ -105,635 +90,7 @@ def get_review_summary(request, school_id):
         # Get school or return 404
         school = get_object_or_404(Schools, id=school_id)
 
-        # Convert sport code to full name if needed
-        code_to_display = {
-            "mbb": "Men's Basketball",
-            "wbb": "Women's Basketball",
-            "fb": "Football",
-        }
-
-        # Use the full sport name for display
-        display_sport = code_to_display.get(sport, sport)
-
-        # Get all reviews for this school and sport
-        reviews = Reviews.objects.filter(school=school, sport=sport).order_by(
-            "-created_at"
-        )
-
-        if not reviews.exists():
-            return Response(
-                {
-                    "summary": f"No reviews available for {display_sport} at {school.school_name} yet."
-                },
-                status=status.HTTP_200_OK,
-            )
-
-        # Get the most recent review's coach
-        latest_review = reviews.first()
-        latest_coach = latest_review.head_coach_name
-        latest_review_date = latest_review.created_at.isoformat()
-
-        # Ensure we have dictionaries for our JSON fields
-        if not isinstance(school.sport_summaries, dict):
-            school.sport_summaries = {}
-        if not isinstance(school.sport_review_dates, dict):
-            school.sport_review_dates = {}
-
-        # Initialize sport-specific dictionaries if they don't exist
-        if sport not in school.sport_summaries:
-            school.sport_summaries[sport] = {}
-        if sport not in school.sport_review_dates:
-            school.sport_review_dates[sport] = {}
-
-        # Ensure the sport-specific entries are dictionaries
-        if not isinstance(school.sport_summaries[sport], dict):
-            school.sport_summaries[sport] = {}
-        if not isinstance(school.sport_review_dates[sport], dict):
-            school.sport_review_dates[sport] = {}
-
-        # Group reviews by normalized coach name
-        coach_reviews = {}
-        for review in reviews:
-            coach_name = review.head_coach_name
-            normalized_name = _normalize_coach_name(coach_name)
-            if normalized_name not in coach_reviews:
-                # Use standardized capitalization for the original name
-                coach_reviews[normalized_name] = {
-                    "original_name": _standardize_coach_name(coach_name),
-                    "reviews": [],
-                }
-            coach_reviews[normalized_name]["reviews"].append(review)
-
-        # Initialize OpenAI client and CoachSearchService
-        client = OpenAI()
-        coach_service = CoachSearchService()
-
-        # List to store all summaries for final output
-        coach_summaries = []
-
-        # First, handle the latest reviewed coach
-        latest_coach_normalized = _normalize_coach_name(latest_coach)
-        stored_date = school.sport_review_dates[sport].get(latest_coach)
-        needs_update = latest_coach not in school.sport_summaries[
-            sport
-        ] or (  # No summary exists
-            stored_date and stored_date < latest_review_date
-        )  # Summary is outdated
-
-        # Get all reviews text for general aspects (facilities, NIL, etc.)
-        all_reviews_text = " ".join(
-            [
-                " ".join(
-                    [
-                        f"Athletic Facilities: {review.review_message if 'facilities' in review.review_message.lower() else ''}",
-                        f"NIL Opportunities: {review.review_message if 'nil' in review.review_message.lower() else ''}",
-                        f"Campus Life: {review.review_message if 'campus' in review.review_message.lower() else ''}",
-                        f"Athletic Department: {review.review_message if 'department' in review.review_message.lower() or 'athletic department' in review.review_message.lower() else ''}",
-                        f"Team Culture: {review.review_message if 'culture' in review.review_message.lower() or 'team culture' in review.review_message.lower() else ''}",
-                    ]
-                )
-                for review in reviews
-            ]
-        )
-
-        # Generate general summary
-        try:
-            general_response = client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": f"You are a helpful assistant that summarizes general aspects of {display_sport} programs (excluding coach-specific information). Focus on athletic facilities, NIL opportunities, campus life, athletic department support, and team culture. Provide a concise 2-3 sentence summary that captures the overall sentiment about these aspects from the reviews.",
-                    },
-                    {"role": "user", "content": all_reviews_text},
-                ],
-                max_tokens=250,
-                temperature=0.7,
-                presence_penalty=0.6,
-                frequency_penalty=0.6,
-            )
-            general_summary = general_response.choices[0].message.content
-
-            # Store the general summary
-            if not isinstance(school.sport_summaries[sport], dict):
-                school.sport_summaries[sport] = {}
-            school.sport_summaries[sport]["general_summary"] = general_summary
-            school.save()
-        except Exception as e:
-            logger.error(f"Error generating general summary: {str(e)}")
-            general_summary = school.sport_summaries[sport].get("general_summary", "")
-
-        if needs_update:
-            try:
-                # Get coach history
-                history, error = coach_service.search_coach_history(
-                    latest_coach, school.school_name, sport
-                )
-                logger.info(
-                    f"Generating new summary for {latest_coach} due to new review"
-                )
-
-                # Prepare reviews text - only coach-specific aspects
-                reviews_text = " ".join(
-                    [
-                        " ".join(
-                            [
-                                f"Head Coach Performance: {review.review_message if latest_coach.lower() in review.review_message.lower() else ''}",
-                                f"Coaching Style: {review.review_message if 'coach' in review.review_message.lower() or 'coaching' in review.review_message.lower() else ''}",
-                                f"Player Development: {review.review_message if 'development' in review.review_message.lower() or 'player development' in review.review_message.lower() else ''}",
-                            ]
-                        )
-                        for review in coach_reviews[latest_coach_normalized]["reviews"]
-                    ]
-                )
-
-                # Generate summary using OpenAI
-                response = client.chat.completions.create(
-                    model="gpt-3.5-turbo",
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": f"You are a helpful assistant that summarizes {display_sport} program reviews for {coach_reviews[latest_coach_normalized]['original_name']}. Provide a concise summary in exactly 2 sentences, focusing on coaching style, player development, and overall coaching performance. Always talk about it from a reviews perspective, like 'reviewers state...' or 'according to reviews...', and always refer to the coach by their actual name ('{coach_reviews[latest_coach_normalized]['original_name']}'). Focus only on coach-specific aspects.",
-                        },
-                        {"role": "user", "content": reviews_text},
-                    ],
-                    max_tokens=250,
-                    temperature=0.7,
-                    presence_penalty=0.6,
-                    frequency_penalty=0.6,
-                )
-
-                summary = response.choices[0].message.content
-
-                # Format the coach summary
-                coach_summary_parts = [
-                    f"**{coach_reviews[latest_coach_normalized]['original_name']}**:"
-                ]
-
-                if history and history != "No tenure found":
-                    coach_summary_parts.extend(["Tenure:", history])
-
-                    # Only check if coach is no longer at school for basketball coaches
-                    if sport in [
-                        "Men's Basketball",
-                        "Women's Basketball",
-                        "mbb",
-                        "wbb",
-                    ]:
-                        tenure_entries = history.split("\n")
-                        if tenure_entries:
-                            most_recent_tenure = tenure_entries[-1].lower()
-                            # Add special case mapping for Indiana
-                            special_case_school_names = {
-                                "university of central florida": [
-                                    "ucf",
-                                    "university of central florida",
-                                    "central florida",
-                                ],  # works
-                                "central florida": [
-                                    "ucf",
-                                    "university of central florida",
-                                    "central florida",
-                                ],  # works
-                                "university of colorado boulder": [
-                                    "colorado",
-                                    "university of colorado boulder",
-                                ],  # works
-                                "university of texas at austin": [
-                                    "texas",
-                                    "university of texas at austin",
-                                ],  # works
-                                # Illinois
-                                "university of illinois at urbana–champaign": [
-                                    "illinois",
-                                    "university of illinois at urbana–champaign",
-                                    "university of illinois at urbana-champaign",
-                                ],
-                                "university of illinois at urbana-champaign": [
-                                    "illinois",
-                                    "university of illinois at urbana–champaign",
-                                    "university of illinois at urbana-champaign",
-                                ],
-                                "illinois": [
-                                    "illinois",
-                                    "university of illinois at urbana–champaign",
-                                    "university of illinois at urbana-champaign",
-                                ],
-                                "illinois at urbana-champaign": [
-                                    "illinois",
-                                    "university of illinois at urbana–champaign",
-                                    "university of illinois at urbana-champaign",
-                                ],
-                                # Maryland
-                                "university of maryland, college park": [
-                                    "maryland",
-                                    "university of maryland, college park",
-                                ],
-                                "maryland": [
-                                    "maryland",
-                                    "university of maryland, college park",
-                                ],
-                                # Nebraska
-                                "university of nebraska–lincoln": [
-                                    "nebraska",
-                                    "university of nebraska–lincoln",
-                                    "university of nebraska-lincoln",
-                                ],
-                                "university of nebraska-lincoln": [
-                                    "nebraska",
-                                    "university of nebraska–lincoln",
-                                    "university of nebraska-lincoln",
-                                ],
-                                "nebraska": [
-                                    "nebraska",
-                                    "university of nebraska–lincoln",
-                                    "university of nebraska-lincoln",
-                                ],
-                                "nebraska-lincoln": [
-                                    "nebraska",
-                                    "university of nebraska–lincoln",
-                                    "university of nebraska-lincoln",
-                                ],
-                                # Wisconsin
-                                "university of wisconsin–madison": [
-                                    "wisconsin",
-                                    "university of wisconsin–madison",
-                                    "university of wisconsin-madison",
-                                ],
-                                "university of wisconsin-madison": [
-                                    "wisconsin",
-                                    "university of wisconsin–madison",
-                                    "university of wisconsin-madison",
-                                ],
-                                "wisconsin": [
-                                    "wisconsin",
-                                    "university of wisconsin–madison",
-                                    "university of wisconsin-madison",
-                                ],
-                                "wisconsin-madison": [
-                                    "wisconsin",
-                                    "university of wisconsin–madison",
-                                    "university of wisconsin-madison",
-                                ],
-                                # Baylor
-                                "baylor university": [
-                                    "baylor",
-                                    "baylor university",
-                                ],
-                                "baylor": [
-                                    "baylor",
-                                    "baylor university",
-                                ],
-                                # Auburn
-                                "auburn university": [
-                                    "auburn",
-                                    "auburn university",
-                                ],
-                                "auburn": [
-                                    "auburn",
-                                    "auburn university",
-                                ],
-                                # BYU
-                                "brigham young university": [
-                                    "byu",
-                                    "brigham young university",
-                                    "brigham young",
-                                ],
-                                "brigham young": [
-                                    "byu",
-                                    "brigham young university",
-                                    "brigham young",
-                                ],
-                                "byu": [
-                                    "byu",
-                                    "brigham young university",
-                                    "brigham young",
-                                ],
-                                # Purdue
-                                "purdue university": [
-                                    "purdue",
-                                    "purdue university",
-                                ],
-                                "purdue": [
-                                    "purdue",
-                                    "purdue university",
-                                ],
-                                # Indiana
-                                "indiana university bloomington": [
-                                    "indiana",
-                                    "indiana university",
-                                    "indiana university bloomington",
-                                ],
-                                "indiana university": [
-                                    "indiana",
-                                    "indiana university",
-                                    "indiana university bloomington",
-                                ],
-                                "indiana": [
-                                    "indiana",
-                                    "indiana university",
-                                    "indiana university bloomington",
-                                ],
-                            }
-
-                            normalized_school_names = _normalize_school_name(
-                                school.school_name
-                            )
-                            school_key = normalized_school_names[0]  # usually just one
-
-                            logger.info(
-                                f"DEBUG: Normalized school name: '{school_key}'"
-                            )
-                            logger.info(
-                                f"DEBUG: Special case mapping keys: {list(special_case_school_names.keys())}"
-                            )
-
-                            if school_key in special_case_school_names:
-                                logger.info(
-                                    f"DEBUG: Matched special case for '{school_key}' -> {special_case_school_names[school_key]}"
-                                )
-                                normalized_school_names = special_case_school_names[
-                                    school_key
-                                ]
-                            else:
-                                logger.info(
-                                    f"DEBUG: No special case match for '{school_key}'"
-                                )
-
-                            # Now do the check as before
-                            is_at_school = any(
-                                most_recent_tenure.endswith(f"@{name}")
-                                for name in normalized_school_names
-                            )
-                            logger.info(
-                                f"DEBUG: most_recent_tenure: '{most_recent_tenure}', normalized_school_names: {normalized_school_names}, is_at_school: {is_at_school}"
-                            )
-                            if not is_at_school:
-                                coach_summary_parts.append("*No longer at this school*")
-                else:
-                    # Only show no tenure message for basketball coaches
-                    if sport in [
-                        "Men's Basketball",
-                        "Women's Basketball",
-                        "mbb",
-                        "wbb",
-                    ]:
-                        coach_summary_parts.append("*No longer at this school*")
-
-                coach_summary_parts.append(summary)
-                coach_summary = "\n".join(coach_summary_parts)
-
-                # Store the new summary and date
-                school.sport_summaries[sport][
-                    coach_reviews[latest_coach_normalized]["original_name"]
-                ] = coach_summary
-                school.sport_review_dates[sport][
-                    coach_reviews[latest_coach_normalized]["original_name"]
-                ] = latest_review_date
-                school.save()
-
-                coach_summaries.append(coach_summary)
-
-            except Exception as e:
-                logger.error(f"Error generating summary for {latest_coach}: {str(e)}")
-                # Use existing summary if available
-                if (
-                    coach_reviews[latest_coach_normalized]["original_name"]
-                    in school.sport_summaries[sport]
-                ):
-                    coach_summaries.append(
-                        school.sport_summaries[sport][
-                            coach_reviews[latest_coach_normalized]["original_name"]
-                        ]
-                    )
-                else:
-                    # Create basic fallback summary
-                    coach_summary_parts = [
-                        f"**{coach_reviews[latest_coach_normalized]['original_name']}**:"
-                    ]
-                    if history and history != "No tenure found":
-                        coach_summary_parts.extend(["Tenure:", history])
-                        # Only check if coach is no longer at school for basketball coaches
-                        if sport in [
-                            "Men's Basketball",
-                            "Women's Basketball",
-                            "mbb",
-                            "wbb",
-                        ]:
-                            if tenure_entries:
-                                most_recent_tenure = tenure_entries[-1].lower()
-                                # Add special case mapping for Indiana
-                                special_case_school_names = {
-                                    "university of central florida": [
-                                        "ucf",
-                                        "university of central florida",
-                                        "central florida",
-                                    ],  # works
-                                    "central florida": [
-                                        "ucf",
-                                        "university of central florida",
-                                        "central florida",
-                                    ],  # works
-                                    "university of colorado boulder": [
-                                        "colorado",
-                                        "university of colorado boulder",
-                                    ],  # works
-                                    "university of texas at austin": [
-                                        "texas",
-                                        "university of texas at austin",
-                                    ],  # works
-                                    # Illinois
-                                    "university of illinois at urbana–champaign": [
-                                        "illinois",
-                                        "university of illinois at urbana–champaign",
-                                        "university of illinois at urbana-champaign",
-                                    ],
-                                    "university of illinois at urbana-champaign": [
-                                        "illinois",
-                                        "university of illinois at urbana–champaign",
-                                        "university of illinois at urbana-champaign",
-                                    ],
-                                    "illinois": [
-                                        "illinois",
-                                        "university of illinois at urbana–champaign",
-                                        "university of illinois at urbana-champaign",
-                                    ],
-                                    # Maryland
-                                    "university of maryland, college park": [
-                                        "maryland",
-                                        "university of maryland, college park",
-                                    ],
-                                    "maryland": [
-                                        "maryland",
-                                        "university of maryland, college park",
-                                    ],
-                                    # Nebraska
-                                    "university of nebraska–lincoln": [
-                                        "nebraska",
-                                        "university of nebraska–lincoln",
-                                        "university of nebraska-lincoln",
-                                    ],
-                                    "university of nebraska-lincoln": [
-                                        "nebraska",
-                                        "university of nebraska–lincoln",
-                                        "university of nebraska-lincoln",
-                                    ],
-                                    "nebraska": [
-                                        "nebraska",
-                                        "university of nebraska–lincoln",
-                                        "university of nebraska-lincoln",
-                                    ],
-                                    # Wisconsin
-                                    "university of wisconsin–madison": [
-                                        "wisconsin",
-                                        "university of wisconsin–madison",
-                                        "university of wisconsin-madison",
-                                    ],
-                                    "university of wisconsin-madison": [
-                                        "wisconsin",
-                                        "university of wisconsin–madison",
-                                        "university of wisconsin-madison",
-                                    ],
-                                    "wisconsin": [
-                                        "wisconsin",
-                                        "university of wisconsin–madison",
-                                        "university of wisconsin-madison",
-                                    ],
-                                    # Baylor
-                                    "baylor university": [
-                                        "baylor",
-                                        "baylor university",
-                                    ],
-                                    "baylor": [
-                                        "baylor",
-                                        "baylor university",
-                                    ],
-                                    # Auburn
-                                    "auburn university": [
-                                        "auburn",
-                                        "auburn university",
-                                    ],
-                                    "auburn": [
-                                        "auburn",
-                                        "auburn university",
-                                    ],
-                                    # BYU
-                                    "brigham young university": [
-                                        "byu",
-                                        "brigham young university",
-                                        "brigham young",
-                                    ],
-                                    "brigham young": [
-                                        "byu",
-                                        "brigham young university",
-                                        "brigham young",
-                                    ],
-                                    "byu": [
-                                        "byu",
-                                        "brigham young university",
-                                        "brigham young",
-                                    ],
-                                    # Purdue
-                                    "purdue university": [
-                                        "purdue",
-                                        "purdue university",
-                                    ],
-                                    "purdue": [
-                                        "purdue",
-                                        "purdue university",
-                                    ],
-                                    # Indiana
-                                    "indiana university bloomington": [
-                                        "indiana",
-                                        "indiana university",
-                                        "indiana university bloomington",
-                                    ],
-                                    "indiana university": [
-                                        "indiana",
-                                        "indiana university",
-                                        "indiana university bloomington",
-                                    ],
-                                    "indiana": [
-                                        "indiana",
-                                        "indiana university",
-                                        "indiana university bloomington",
-                                    ],
-                                }
-
-                                normalized_school_names = _normalize_school_name(
-                                    school.school_name
-                                )
-                                school_key = normalized_school_names[
-                                    0
-                                ]  # usually just one
-
-                                if school_key in special_case_school_names:
-                                    normalized_school_names = special_case_school_names[
-                                        school_key
-                                    ]
-
-                                # Now do the check as before
-                                is_at_school = any(
-                                    most_recent_tenure.endswith(f"@{name}")
-                                    for name in normalized_school_names
-                                )
-                                if not is_at_school:
-                                    coach_summary_parts.append(
-                                        "*No longer at this school*"
-                                    )
-                    else:
-                        # Only show no tenure message for basketball coaches
-                        if sport in [
-                            "Men's Basketball",
-                            "Women's Basketball",
-                            "mbb",
-                            "wbb",
-                        ]:
-                            coach_summary_parts.append("*No longer at this school*")
-
-                    reviews_text = "\n".join(
-                        [
-                            f"Review from {review.created_at.strftime('%Y-%m-%d')}: {review.review_message}"
-                            for review in coach_reviews[latest_coach_normalized][
-                                "reviews"
-                            ]
-                        ]
-                    )
-                    coach_summary_parts.append(reviews_text)
-                    coach_summary = "\n".join(coach_summary_parts)
-
-                    # Store the fallback summary
-                    school.sport_summaries[sport][
-                        coach_reviews[latest_coach_normalized]["original_name"]
-                    ] = coach_summary
-                    school.sport_review_dates[sport][
-                        coach_reviews[latest_coach_normalized]["original_name"]
-                    ] = latest_review_date
-                    school.save()
-
-                    coach_summaries.append(coach_summary)
-        else:
-            # Use existing summary for the latest coach
-            coach_summaries.append(
-                school.sport_summaries[sport][
-                    coach_reviews[latest_coach_normalized]["original_name"]
-                ]
-            )
-
-        # For other coaches, ONLY use existing summaries from the database
-        for normalized_name, coach_data in coach_reviews.items():
-            if normalized_name != latest_coach_normalized:
-                original_name = coach_data["original_name"]
-                if original_name in school.sport_summaries[sport]:
-                    # Only append existing summaries, never generate new ones
-                    coach_summaries.append(school.sport_summaries[sport][original_name])
-
-        # Add the general summary at the end
-        final_parts = coach_summaries + ["**Program Overview**:", general_summary]
-
-        # Combine all summaries with double newlines
-        final_summary = "\n\n".join(final_parts)
-        return Response({"summary": final_summary})
+        return Response({"summary": build_review_summary(school, sport)})
 
     except Exception as e:
         logger.error(f"Error in get_review_summary: {str(e)}")
@@ -824,10 +181,29 @@ def filter_schools(request):
         elif sport == "Wrestling":
             schools_query = schools_query.filter(wr=True)
 
-    serializer = SchoolSerializer(
-        schools_query, many=True, context={"request": request}
-    )
-    return Response(serializer.data)
+    return Response(school_payloads(schools_query, request))
+
+
+def _log_recommendation_inputs():
+    """Log every preference, review and school; only called at DEBUG level."""
+    logger.debug("All preferences in system:")
+    for pref in Preferences.objects.all():
+        logger.debug("User %s - Sport: %s", pref.user_id, pref.sport)
+
+    logger.debug("All reviews in system:")
+    for review in Reviews.objects.select_related("school"):
+        logger.debug(
+            "Review by User %s - School: %s, Sport: %s",
+            review.user_id,
+            review.school.school_name,
+            review.sport,
+        )
+
+    logger.debug("All schools and their sports:")
+    sport_flags = ["mbb", "wbb", "fb", "vb", "ba", "msoc", "wsoc", "wr"]
+    for school in Schools.objects.all():
+        sports = [flag for flag in sport_flags if getattr(school, flag)]
+        logger.debug("School %s - Sports: %s", school.school_name, ", ".join(sports))
 
 
 @api_view(["GET"])
@@ -835,66 +211,35 @@ def filter_schools(request):
 def get_recommended_schools(request):
     try:
         current_user = request.user
-        logger.info("=== RECOMMENDATIONS DEBUG START ===")
-        logger.info(f"User ID: {current_user.id}")
-
-        # Debug: Check all preferences in the system
-        all_preferences = Preferences.objects.all()
-        logger.info(f"\nAll preferences in system:")
-        for pref in all_preferences:
-            logger.info(f"User {pref.user.id} - Sport: {pref.sport}")
-
-        # Debug: Check all reviews in the system
-        all_reviews = Reviews.objects.all()
-        logger.info(f"\nAll reviews in system:")
-        for review in all_reviews:
-            logger.info(
-                f"Review by User {review.user.id} - School: {review.school.school_name}, Sport: {review.sport}"
-            )
-
-        # Debug: Check all schools and their sports
-        all_schools = Schools.objects.all()
-        logger.info(f"\nAll schools and their sports:")
-        for school in all_schools:
-            sports = []
-            if school.mbb:
-                sports.append("mbb")
-            if school.wbb:
-                sports.append("wbb")
-            if school.fb:
-                sports.append("fb")
-            if school.vb:
-                sports.append("vb")
-            if school.ba:
-                sports.append("ba")
-            if school.msoc:
-                sports.append("msoc")
-            if school.wsoc:
-                sports.append("wsoc")
-            if school.wr:
-                sports.append("wr")
-            logger.info(f"School {school.school_name} - Sports: {', '.join(sports)}")
+        logger.debug("=== RECOMMENDATIONS DEBUG START ===")
+        logger.debug("User ID: %s", current_user.id)
+        if logger.isEnabledFor(logging.DEBUG):
+            _log_recommendation_inputs()
 
         # Get user's preferences
         user_preferences = Preferences.objects.filter(user=current_user).first()
         if not user_preferences:
-            logger.info(f"No preferences found for user {current_user.id}.")
+            logger.info("No preferences found for user %s.", current_user.id)
             return Response({"no_preferences": True})
 
         # Log user's preferences
-        logger.info(f"\nUser preferences:")
-        logger.info(f"Sport: {user_preferences.sport}")
-        logger.info(f"Head Coach: {user_preferences.head_coach}")
-        logger.info(f"Assistant Coaches: {user_preferences.assistant_coaches}")
-        logger.info(f"Team Culture: {user_preferences.team_culture}")
-        logger.info(f"Campus Life: {user_preferences.campus_life}")
-        logger.info(f"Athletic Facilities: {user_preferences.athletic_facilities}")
-        logger.info(f"Athletic Department: {user_preferences.athletic_department}")
-        logger.info(f"Player Development: {user_preferences.player_development}")
-        logger.info(f"NIL Opportunity: {user_preferences.nil_opportunity}")
+        logger.debug(
+            "User preferences: sport=%s head_coach=%s assistant_coaches=%s "
+            "team_culture=%s campus_life=%s athletic_facilities=%s "
+            "athletic_department=%s player_development=%s nil_opportunity=%s",
+            user_preferences.sport,
+            user_preferences.head_coach,
+            user_preferences.assistant_coaches,
+            user_preferences.team_culture,
+            user_preferences.campus_life,
+            user_preferences.athletic_facilities,
+            user_preferences.athletic_department,
+            user_preferences.player_development,
+            user_preferences.nil_opportunity,
+        )
 
         sport = user_preferences.sport
-        logger.info(f"\nProcessing recommendations for sport: {sport}")
+        logger.info("Processing recommendations for sport: %s", sport)
 
         # Convert display names to codes and handle both formats
         display_to_code = {
@@ -927,18 +272,21 @@ def get_recommended_schools(request):
                     sport_code = code
                     break
 
-        logger.info(f"Converted sport '{sport}' to code '{sport_code}'")
+        logger.info("Converted sport '%s' to code '%s'", sport, sport_code)
 
         # Get all reviews for this sport (including current user's reviews)
         sport_reviews = Reviews.objects.filter(sport=sport_code)
-        logger.info(f"\nAll reviews for sport {sport_code}:")
-        for review in sport_reviews:
-            logger.info(
-                f"Review by User {review.user.id} for {review.school.school_name}"
-            )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("All reviews for sport %s:", sport_code)
+            for review in sport_reviews.select_related("school"):
+                logger.debug(
+                    "Review by User %s for %s",
+                    review.user_id,
+                    review.school.school_name,
+                )
 
         if not sport_reviews.exists():
-            logger.info(f"No reviews found for {sport_code}")
+            logger.info("No reviews found for %s", sport_code)
             return Response([])
 
         # Get schools that have reviews for this sport
@@ -946,7 +294,9 @@ def get_recommended_schools(request):
             "school_id", flat=True
         ).distinct()
         logger.info(
-            f"Found {len(school_ids_with_reviews)} schools with reviews for {sport_code}"
+            "Found %d schools with reviews for %s",
+            len(school_ids_with_reviews),
+            sport_code,
         )
 
         # Get schools that the current user has already reviewed for this sport
@@ -954,25 +304,31 @@ def get_recommended_schools(request):
             user=current_user, sport=sport_code
         ).values_list("school_id", flat=True)
         logger.info(
-            f"User has already reviewed {len(user_reviewed_schools)} schools for {sport_code}"
+            "User has already reviewed %d schools for %s",
+            len(user_reviewed_schools),
+            sport_code,
         )
 
         # Debug: Print school IDs and names
-        schools_with_reviews = Schools.objects.filter(id__in=school_ids_with_reviews)
-        logger.info("Schools with reviews:")
-        for school in schools_with_reviews:
-            logger.info(f"- ID: {school.id}, Name: {school.school_name}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Schools with reviews:")
+            for school in Schools.objects.filter(id__in=school_ids_with_reviews):
+                logger.debug("- ID: %s, Name: %s", school.id, school.school_name)
 
         if not school_ids_with_reviews:
-            logger.info(f"No schools have reviews for {sport_code}")
+            logger.info("No schools have reviews for %s", sport_code)
             return Response([])
 
         # Get all schools, excluding those the user has already reviewed
-        schools = Schools.objects.filter(id__in=school_ids_with_reviews).exclude(
-            id__in=user_reviewed_schools
+        schools = with_listed_reviews(
+            Schools.objects.filter(id__in=school_ids_with_reviews).exclude(
+                id__in=user_reviewed_schools
+            ),
+            request,
         )
         logger.info(
-            f"Total schools with reviews to check (excluding user's reviews): {schools.count()}"
+            "Total schools with reviews to check (excluding user's reviews): %d",
+            schools.count(),
         )
 
         recommended_schools = []
@@ -982,44 +338,49 @@ def get_recommended_schools(request):
             has_sport = False
             if sport_code == "mbb" and school.mbb:
                 has_sport = True
-                logger.info(f"School {school.school_name} offers Men's Basketball")
+                logger.debug("School %s offers Men's Basketball", school.school_name)
             elif sport_code == "wbb" and school.wbb:
                 has_sport = True
-                logger.info(f"School {school.school_name} offers Women's Basketball")
+                logger.debug("School %s offers Women's Basketball", school.school_name)
             elif sport_code == "fb" and school.fb:
                 has_sport = True
-                logger.info(f"School {school.school_name} offers Football")
+                logger.debug("School %s offers Football", school.school_name)
             elif sport_code == "vb" and school.vb:
                 has_sport = True
-                logger.info(f"School {school.school_name} offers Volleyball")
+                logger.debug("School %s offers Volleyball", school.school_name)
             elif sport_code == "ba" and school.ba:
                 has_sport = True
-                logger.info(f"School {school.school_name} offers Baseball")
+                logger.debug("School %s offers Baseball", school.school_name)
             elif sport_code == "msoc" and school.msoc:
                 has_sport = True
-                logger.info(f"School {school.school_name} offers Men's Soccer")
+                logger.debug("School %s offers Men's Soccer", school.school_name)
             elif sport_code == "wsoc" and school.wsoc:
                 has_sport = True
-                logger.info(f"School {school.school_name} offers Women's Soccer")
+                logger.debug("School %s offers Women's Soccer", school.school_name)
             elif sport_code == "wr" and school.wr:
                 has_sport = True
-                logger.info(f"School {school.school_name} offers Wrestling")
+                logger.debug("School %s offers Wrestling", school.school_name)
 
             if not has_sport:
-                logger.info(
-                    f"School {school.school_name} does not offer {sport_code}, skipping"
+                logger.debug(
+                    "School %s does not offer %s, skipping",
+                    school.school_name,
+                    sport_code,
                 )
                 continue
 
             # Get all reviews for this school and sport
             reviews = Reviews.objects.filter(school=school, sport=sport_code)
-            logger.info(
-                f"Found {reviews.count()} reviews for {school.school_name} - {sport_code}"
+            logger.debug(
+                "Found %d reviews for %s - %s",
+                len(reviews),
+                school.school_name,
+                sport_code,
             )
 
             if not reviews:
-                logger.info(
-                    f"No reviews for {school.school_name} with sport {sport_code}"
+                logger.debug(
+                    "No reviews for %s with sport %s", school.school_name, sport_code
                 )
                 continue
 
@@ -1088,15 +449,18 @@ def get_recommended_schools(request):
                         "sport": code_to_display.get(sport_code, sport_code),
                     }
                 )
-                logger.info(
-                    f"Added {school.school_name} for {sport_code} with score {similarity_score}"
+                logger.debug(
+                    "Added %s for %s with score %s",
+                    school.school_name,
+                    sport_code,
+                    similarity_score,
                 )
 
         # Sort by similarity score and return top schools
         recommended_schools.sort(key=lambda x: x["similarity_score"], reverse=True)
         result = recommended_schools[:5] if recommended_schools else []
 
-        logger.info(f"Returning {len(result)} recommendations")
+        logger.info("Returning %d recommendations", len(result))
         return Response(result)
 
     except Exception as e:
@@ -0,0 +1,88 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import JsonResponse
+from django.utils.encoding import force_bytes
+from django.utils.http import urlsafe_base64_encode
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
+from rest_framework.exceptions import APIException
+
+from config.async_utils import aauthenticate, bad_request, error_response, request_data
+from outbox.delivery import enqueue_email
+
+from .models import Users
+from .tokens import school_email_token_generator
+from .views import token_generator
+
+
+@csrf_exempt
+@require_POST
+async def forgot_password(request):
+    """Async ``users.views.forgot_password`` for ASGI mode."""
+    try:
+        email = request_data(request).get("email")
+    except APIException as e:
+        return error_response(e)
+    if not email:
+        return bad_request("Email is required.")
+    try:
+        user = await Users.objects.aget(email=email)
+    except Users.DoesNotExist:
+        return bad_request("Unregistered Email Address!")
+
+    uid = urlsafe_base64_encode(force_bytes(user.pk))
+    token = token_generator.make_token(user)
+
+    reset_url = request.build_absolute_uri(f"/reset-password/?uid={uid}&token={token}")
+    if settings.DEBUG:
+        reset_url = reset_url.replace("localhost:8000", "localhost:3000")
+
+    await sync_to_async(enqueue_email)(
+        subject="Password Reset Request",
+        message=(
+            f"Hello, this is Athletic Insider! \n,"
+            f"Please click the following link to reset your password,"
+            f"\n {reset_url} \n,"
+            f"The link is valid for one hour."
+        ),
+        from_email="noreply@example.com",
+        recipient_list=[email],
+    )
+    return JsonResponse({"message": "An email has been sent!"})
+
+
+@csrf_exempt
+@require_POST
+async def send_school_verification(request):
+    """Async ``users.views.send_school_verification`` for ASGI mode."""
+    try:
+        user = await aauthenticate(request)
+    except APIException as e:
+        return error_response(e)
+    email = user.email
+    domain = email.split("@")[1].lower()
+
+    if not domain.endswith(".edu"):
+        return bad_request("Only .edu emails can be verified.")
+
+    uid = urlsafe_base64_encode(force_bytes(user.pk))
+    token = school_email_token_generator.make_token(user)
+
+    verify_url = request.build_absolute_uri(
+        f"/verify-school-email/?uid={uid}&token={token}"
+    )
+    if settings.DEBUG:
+        verify_url = verify_url.replace("localhost:8000", "localhost:3000")
+
+    await sync_to_async(enqueue_email)(
+        subject="Verify Your School Email",
+        message=(
+            f"Hi {user.first_name},\n\n"
+            f"Click the link below to verify your school email:\n{verify_url}\n\n"
+            f"This link is valid for a limited time."
+        ),
+        from_email="noreply@yourapp.com",
+        recipient_list=[email],
+    )
+
+    return JsonResponse({"message": "Verification email sent!"})
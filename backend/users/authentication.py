@@ -0,0 +1,81 @@
+"""
+JWT authentication that serves the authenticated user from the cache.
+
+``JWTAuthentication`` loads the user row on every request. This caches a
+snapshot of the row (without the password hash or reset token, which load
+from the database only if something reads them) for
+``settings.AUTH_USER_CACHE_TIMEOUT`` seconds.
+
+Snapshots are keyed by user id and a per-user version. Saving or deleting a
+user replaces the version once the transaction commits (see
+``users/signals.py``), so every cached snapshot of them, including one
+written by a request that read the row just before the save, stops being
+used at once.
+"""
+
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+
+from .models import Users
+
+# Left out of the cache; read from the database if anything needs them
+UNCACHED_FIELDS = {"password", "reset_token"}
+
+
+def _version_key(user_id):
+    return f"auth:user:{user_id}:version"
+
+
+def _snapshot_key(user_id, version):
+    return f"auth:user:{user_id}:{version}"
+
+
+def _version(user_id):
+    key = _version_key(user_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid.uuid4().hex, None)
+        version = cache.get(key)
+    return version
+
+
+def invalidate_user(user_id):
+    """Stop serving cached snapshots of the user."""
+    cache.set(_version_key(user_id), uuid.uuid4().hex, None)
+
+
+def snapshot(user):
+    return {
+        field.attname: getattr(user, field.attname)
+        for field in Users._meta.concrete_fields
+        if field.attname not in UNCACHED_FIELDS
+    }
+
+
+def from_snapshot(values):
+    # Fields missing from the snapshot are deferred, loaded on first access
+    return Users.from_db(DEFAULT_DB_ALIAS, list(values), list(values.values()))
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    def get_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        # Token revocation compares against the password hash, which isn't
+        # cached, so it always takes the database path
+        if user_id is None or api_settings.CHECK_REVOKE_TOKEN:
+            return super().get_user(validated_token)
+
+        # Read the version before the row, so a save in between is noticed
+        key = _snapshot_key(user_id, _version(user_id))
+        values = cache.get(key)
+        if values is None:
+            user = super().get_user(validated_token)
+            cache.set(key, snapshot(user), settings.AUTH_USER_CACHE_TIMEOUT)
+            return user
+        # Users has no is_active field, so a cached user is always active
+        return from_snapshot(values)
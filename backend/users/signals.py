@@ -0,0 +1,14 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from users.authentication import invalidate_user
+from users.models import Users
+
+
+@receiver(post_save, sender=Users)
+@receiver(post_delete, sender=Users)
+def invalidate_cached_user(sender, instance, **kwargs):
+    # After commit, so a request can't re-cache the old row in between. The
+    # pk is read now, since delete() clears it before the commit
+    user_id = instance.pk
+    transaction.on_commit(lambda: invalidate_user(user_id))
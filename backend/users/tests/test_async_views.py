@@ -0,0 +1,107 @@
+import json
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import RequestFactory
+from rest_framework_simplejwt.tokens import RefreshToken
+from unittest.mock import patch
+from report.async_views import report_issue
+from users.async_views import forgot_password, send_school_verification
+from outbox.models import OutboxEmail
+
+
+def post(view, data=None, **headers):
+    request = RequestFactory().post(
+        "/", json.dumps(data or {}), content_type="application/json", **headers
+    )
+    return async_to_sync(view)(request)
+
+
+@pytest.fixture
+def user(django_user_model):
+    return django_user_model.objects.create_user(
+        email="test@example.edu",
+        first_name="Test",
+        last_name="User",
+        password="StrongP@ss123",
+    )
+
+
+def bearer(user):
+    return {"HTTP_AUTHORIZATION": f"Bearer {RefreshToken.for_user(user).access_token}"}
+
+
+@pytest.mark.django_db
+class TestAsyncEmailViews:
+    def test_forgot_password_sends_reset_link(self, user):
+        response = post(forgot_password, {"email": "test@example.edu"})
+
+        assert response.status_code == 200
+        assert json.loads(response.content) == {"message": "An email has been sent!"}
+        email = OutboxEmail.objects.get()
+        assert email.recipients == ["test@example.edu"]
+        assert "/reset-password/?uid=" in email.body
+
+    def test_forgot_password_unregistered_email(self):
+        response = post(forgot_password, {"email": "nobody@example.edu"})
+
+        assert response.status_code == 400
+        assert json.loads(response.content) == {"error": "Unregistered Email Address!"}
+        assert not OutboxEmail.objects.exists()
+
+    def test_forgot_password_malformed_json(self):
+        request = RequestFactory().post(
+            "/", "{not json", content_type="application/json"
+        )
+
+        response = async_to_sync(forgot_password)(request)
+
+        assert response.status_code == 400
+
+    def test_send_school_verification(self, user):
+        response = post(send_school_verification, **bearer(user))
+
+        assert response.status_code == 200
+        assert json.loads(response.content) == {"message": "Verification email sent!"}
+        assert "/verify-school-email/?uid=" in OutboxEmail.objects.get().body
+
+    def test_send_school_verification_requires_token(self, user):
+        response = post(send_school_verification)
+
+        assert response.status_code == 401
+        assert "detail" in json.loads(response.content)
+
+    def test_send_school_verification_rejects_bad_token(self, user):
+        response = post(send_school_verification, HTTP_AUTHORIZATION="Bearer nope")
+
+        assert response.status_code == 401
+
+    def test_send_school_verification_requires_edu(self, django_user_model):
+        user = django_user_model.objects.create(email="test@example.com")
+
+        response = post(send_school_verification, **bearer(user))
+
+        assert response.status_code == 400
+        assert not OutboxEmail.objects.exists()
+
+    def test_report_issue(self):
+        response = post(
+            report_issue,
+            {"email": "test@example.com", "description": "Broken page"},
+        )
+
+        assert response.status_code == 201
+        assert "Broken page" in OutboxEmail.objects.get().body
+
+    def test_report_issue_enqueue_failure(self):
+        with patch(
+            "report.async_views.enqueue_email", side_effect=Exception("DB down")
+        ):
+            response = post(
+                report_issue,
+                {"email": "test@example.com", "description": "Broken page"},
+            )
+
+        assert response.status_code == 500
+        assert json.loads(response.content) == {
+            "error": "Email sending failed: DB down"
+        }
@@ -0,0 +1,109 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from users.authentication import CachedJWTAuthentication
+from users.models import Users
+
+
+@pytest.fixture
+def user(db):
+    return Users.objects.create_user(
+        email="cached@example.com",
+        first_name="Cached",
+        last_name="User",
+        password="StrongP@ss123",
+    )
+
+
+@pytest.fixture
+def client(user):
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}")
+    return client
+
+
+def get_user_detail(client):
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(reverse("user_detail"))
+    assert response.status_code == 200
+    return response, len(queries)
+
+
+@pytest.mark.django_db
+class TestCachedJWTAuthentication:
+    def test_cached_user_saves_a_query(self, client):
+        first, first_queries = get_user_detail(client)
+        second, second_queries = get_user_detail(client)
+
+        assert second_queries == first_queries - 1
+        assert second.json() == first.json()
+
+    def test_password_and_reset_token_are_not_cached(self, user):
+        user.reset_token = "secret-token"
+        user.save()
+        token = AccessToken.for_user(user)
+        CachedJWTAuthentication().get_user(token)
+
+        cached = CachedJWTAuthentication().get_user(token)
+
+        assert cached.get_deferred_fields() == {"password", "reset_token"}
+        # Read from the database when needed
+        assert cached.check_password("StrongP@ss123")
+        assert cached.reset_token == "secret-token"
+
+    def test_save_invalidates_cached_user(
+        self, client, user, django_capture_on_commit_callbacks
+    ):
+        get_user_detail(client)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Users.objects.filter(pk=user.pk).get().save()
+        user.first_name = "Renamed"
+        with django_capture_on_commit_callbacks(execute=True):
+            user.save()
+
+        response, _ = get_user_detail(client)
+        assert response.json()["first_name"] == "Renamed"
+
+    def test_changed_password_is_saved_from_cached_user(
+        self, client, user, django_capture_on_commit_callbacks
+    ):
+        get_user_detail(client)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = client.post(
+                reverse("change_password"),
+                {"current_password": "StrongP@ss123", "new_password": "NewP@ss456"},
+                format="json",
+            )
+
+        assert response.status_code == 200
+        user.refresh_from_db()
+        assert user.check_password("NewP@ss456")
+        assert user.first_name == "Cached"
+
+    def test_deleted_user_is_rejected(
+        self, client, user, django_capture_on_commit_callbacks
+    ):
+        get_user_detail(client)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            user.delete()
+
+        assert client.get(reverse("user_detail")).status_code == 401
+
+    def test_version_survives_snapshot_expiry(self, user):
+        token = AccessToken.for_user(user)
+        CachedJWTAuthentication().get_user(token)
+        version = cache.get(f"auth:user:{user.pk}:version")
+
+        cache.delete(f"auth:user:{user.pk}:{version}")
+        CachedJWTAuthentication().get_user(token)
+
+        assert cache.get(f"auth:user:{user.pk}:version") == version
+        assert cache.get(f"auth:user:{user.pk}:{version}") is not None
@@ -37,15 +37,15 @@ class TestForgotPassword:
         url = reverse("forgot_password")
         data = {"email": "test@example.com"}
 
-        # Mock the send_mail function
-        with patch("users.views.send_mail") as mock_send_mail:
+        # Mock the enqueue_email function
+        with patch("users.views.enqueue_email") as mock_send_mail:
             response = api_client.post(url, data, format="json")
 
             # Assert the response is correct
             assert response.status_code == status.HTTP_200_OK
             assert response.data["message"] == "An email has been sent!"
 
-            # Assert send_mail was called
+            # Assert the email was queued
             mock_send_mail.assert_called_once()
 
     def test_forgot_password_unregistered_email(self, api_client):
@@ -49,15 +49,15 @@ class TestSchoolEmailVerification:
 
         url = reverse("send_school_verification")
 
-        # Mock the send_mail function
-        with patch("users.views.send_mail") as mock_send_mail:
+        # Mock the enqueue_email function
+        with patch("users.views.enqueue_email") as mock_send_mail:
             response = api_client.post(url, format="json")
 
             # Assert the response is correct
             assert response.status_code == status.HTTP_200_OK
             assert response.data["message"] == "Verification email sent!"
 
-            # Assert send_mail was called
+            # Assert the email was queued
             mock_send_mail.assert_called_once()
 
     def test_send_school_verification_non_edu_email(self, api_client, create_user):
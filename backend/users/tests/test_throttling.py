@@ -0,0 +1,178 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+from django.core.cache import cache
+from django.test import RequestFactory
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from users import throttling
+from users.models import Users
+from users.throttling import parse_rate
+
+
+@pytest.fixture
+def user(db):
+    return Users.objects.create_user(
+        email="throttled@example.com",
+        first_name="Throttled",
+        last_name="User",
+        password="StrongP@ss123",
+    )
+
+
+def login(client, email, password="WrongP@ss123", ip="10.0.0.1"):
+    return client.post(
+        reverse("login"),
+        {"email": email, "password": password},
+        format="json",
+        REMOTE_ADDR=ip,
+    )
+
+
+@pytest.fixture
+def clock():
+    """Freeze the throttles' clock; advance it by assigning ``clock.now``."""
+    clock = mock.Mock(now=1_000_000.0)
+    with mock.patch.object(throttling.time, "time", lambda: clock.now):
+        yield clock
+
+
+def test_parse_rate():
+    assert parse_rate("10/min") == (10, 60)
+    assert parse_rate("5/s") == (5, 1)
+    assert parse_rate("100/hour") == (100, 3600)
+
+
+@pytest.mark.django_db
+class TestPasswordThrottles:
+    @pytest.fixture(autouse=True)
+    def rates(self, settings):
+        settings.AUTH_THROTTLE_IP_RATE = "5/min"
+        settings.AUTH_THROTTLE_ACCOUNT_RATE = "3/min"
+
+    def test_account_limit_spans_ips(self, user, clock):
+        client = APIClient()
+        for i in range(3):
+            assert login(client, user.email, ip=f"10.0.0.{i}").status_code == 401
+
+        response = login(client, user.email.upper(), ip="10.0.0.9")
+
+        assert response.status_code == 429
+        assert int(response["Retry-After"]) == 20
+
+    def test_ip_limit_spans_accounts(self, user, clock):
+        client = APIClient()
+        for i in range(5):
+            assert login(client, f"user{i}@example.com").status_code == 401
+
+        assert login(client, user.email).status_code == 429
+        # Other IPs are unaffected
+        assert (
+            login(client, user.email, "StrongP@ss123", ip="10.0.0.2").status_code == 200
+        )
+
+    def test_spoofed_forwarded_for_shares_the_ip_limit(self, user, clock):
+        client = APIClient()
+        responses = [
+            client.post(
+                reverse("login"),
+                {"email": f"user{i}@example.com", "password": "WrongP@ss123"},
+                format="json",
+                REMOTE_ADDR="127.0.0.1",
+                # nginx appends the address it saw to whatever the client sent
+                HTTP_X_FORWARDED_FOR=f"198.51.100.{i}, 203.0.113.7",
+            ).status_code
+            for i in range(6)
+        ]
+
+        assert responses == [401] * 5 + [429]
+
+    def test_rejected_before_hashing(self, user, clock):
+        client = APIClient()
+        for _ in range(3):
+            login(client, user.email)
+
+        with mock.patch.object(PBKDF2PasswordHasher, "encode") as encode:
+            with mock.patch.object(PBKDF2PasswordHasher, "verify") as verify:
+                assert login(client, user.email).status_code == 429
+
+        encode.assert_not_called()
+        verify.assert_not_called()
+
+    def test_limit_resets_with_the_window(self, user, clock):
+        client = APIClient()
+        for _ in range(3):
+            login(client, user.email)
+        assert login(client, user.email).status_code == 429
+
+        # The clock starts 40 seconds into a one-minute window
+        clock.now += 20
+        for _ in range(2):
+            assert login(client, user.email).status_code == 401
+        assert login(client, user.email, "StrongP@ss123").status_code == 200
+        assert login(client, user.email).status_code == 429
+
+    def test_concurrent_attempts_cannot_share_a_slot(self):
+        throttle = throttling.IPThrottle()
+        request = RequestFactory().post("/", REMOTE_ADDR="10.2.0.1")
+        start = threading.Barrier(20)
+
+        def attempt(_):
+            start.wait()
+            return throttle.allow_request(request, None)
+
+        with ThreadPoolExecutor(max_workers=20) as pool:
+            allowed = list(pool.map(attempt, range(20)))
+
+        assert allowed.count(True) == 5
+
+    def test_signup_and_reset_password_are_throttled(self, db, clock):
+        client = APIClient()
+        for _ in range(3):
+            client.post(reverse("reset_password"), {"uid": "abc"}, format="json")
+        assert (
+            client.post(
+                reverse("reset_password"), {"uid": "abc"}, format="json"
+            ).status_code
+            == 429
+        )
+
+        # The IP has used 4 of its 5 tokens
+        client.post(reverse("signup"), {"email": "new@example.com"}, format="json")
+        assert (
+            client.post(
+                reverse("signup"), {"email": "other@example.com"}, format="json"
+            ).status_code
+            == 429
+        )
+
+    def test_change_password_is_throttled_per_user(self, user, clock):
+        client = APIClient()
+        client.force_authenticate(user)
+        url = reverse("change_password")
+        for i in range(3):
+            client.post(
+                url,
+                {"current_password": "nope"},
+                format="json",
+                REMOTE_ADDR=f"10.1.0.{i}",
+            )
+
+        response = client.post(
+            url, {"current_password": "nope"}, format="json", REMOTE_ADDR="10.1.0.9"
+        )
+
+        assert response.status_code == 429
+
+    def test_falls_back_to_local_buckets_without_cache(self, user, clock):
+        client = APIClient()
+        with mock.patch.object(
+            cache, "add", side_effect=ConnectionError
+        ), mock.patch.object(cache, "incr", side_effect=ConnectionError):
+            for _ in range(3):
+                assert login(client, user.email).status_code == 401
+            assert login(client, user.email).status_code == 429
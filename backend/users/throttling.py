@@ -0,0 +1,151 @@
+"""
+Fixed-window throttles for the endpoints that hash passwords.
+
+Logging in, signing up and changing or resetting a password each run the
+password hasher, which deliberately costs ~100 ms of CPU, so a burst of
+attempts can tie up every worker. These throttles run before the view, so a
+rejected request is answered with a 429 without hashing anything.
+
+Each client IP and each account may make ``N`` attempts per window for a rate
+of ``"N/period"`` (``settings.AUTH_THROTTLE_IP_RATE`` and
+``settings.AUTH_THROTTLE_ACCOUNT_RATE``). Attempts are counted with the
+cache's atomic ``add`` and ``incr``, so concurrent requests, on any worker,
+each get their own count and can't share a slot. Up to ``2N`` attempts can
+get through around a window boundary. If the cache can't be reached, each
+process falls back to its own counters.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.throttling import BaseThrottle
+
+logger = logging.getLogger(__name__)
+
+PERIODS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_rate(rate):
+    """``"10/min"`` -> ``(10, 60)``: the attempts allowed and the window in seconds."""
+    attempts, period = rate.split("/")
+    return int(attempts), PERIODS[period[0]]
+
+
+class _LocalCounters:
+    """Per-process counters, used while the shared cache is down."""
+
+    def __init__(self):
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def incr(self, key, timeout):
+        now = time.time()
+        with self._lock:
+            count, expires = self._counters.get(key, (0, now + timeout))
+            if expires <= now:
+                count, expires = 0, now + timeout
+            self._counters[key] = (count + 1, expires)
+            # Drop expired counters now and then so the dict stays small
+            if len(self._counters) > 10000:
+                self._counters = {k: c for k, c in self._counters.items() if c[1] > now}
+            return count + 1
+
+
+_local = _LocalCounters()
+
+
+def _incr(key, timeout):
+    """Atomically count one more attempt under ``key`` in the shared cache."""
+    cache.add(key, 0, timeout)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # Expired between the add and the incr
+        cache.add(key, 0, timeout)
+        return cache.incr(key)
+
+
+class WindowThrottle(BaseThrottle):
+    """
+    Allow ``N`` requests per key in each window of the rate's period.
+    Subclasses name the rate setting and pick the key; a ``None`` key isn't
+    throttled.
+    """
+
+    rate_setting = None
+    scope = None
+
+    def __init__(self):
+        self.attempts, self.period = parse_rate(getattr(settings, self.rate_setting))
+        self.retry_after = None
+
+    def get_ident_key(self, request, view):
+        raise NotImplementedError
+
+    def get_cache_key(self, request, view):
+        ident = self.get_ident_key(request, view)
+        if ident is None:
+            return None
+        # Hashed, since identifiers such as emails may not be valid cache keys
+        digest = hashlib.sha256(str(ident).encode()).hexdigest()[:32]
+        return f"throttle:{self.scope}:{digest}"
+
+    def allow_request(self, request, view):
+        key = self.get_cache_key(request, view)
+        if key is None:
+            return True
+        now = time.time()
+        window = int(now // self.period)
+        key = f"{key}:{window}"
+        # Rejected attempts count too, so hammering doesn't earn a retry sooner
+        try:
+            count = _incr(key, self.period)
+        except Exception:
+            logger.warning("Throttle cache unavailable; using local counters")
+            count = _local.incr(key, self.period)
+
+        if count <= self.attempts:
+            return True
+        self.retry_after = (window + 1) * self.period - now
+        return False
+
+    def wait(self):
+        return self.retry_after
+
+
+class IPThrottle(WindowThrottle):
+    """Limit password attempts per client IP."""
+
+    rate_setting = "AUTH_THROTTLE_IP_RATE"
+    scope = "ip"
+
+    def get_ident_key(self, request, view):
+        return self.get_ident(request)
+
+
+class AccountThrottle(WindowThrottle):
+    """
+    Limit password attempts per account, however many IPs they come from:
+    the signed-in user, or the email or reset link uid in the request body.
+    """
+
+    rate_setting = "AUTH_THROTTLE_ACCOUNT_RATE"
+    scope = "account"
+
+    def get_ident_key(self, request, view):
+        if request.user and request.user.is_authenticated:
+            return f"user:{request.user.pk}"
+        email = request.data.get("email")
+        if isinstance(email, str) and email:
+            return f"email:{email.strip().lower()}"
+        uid = request.data.get("uid")
+        if isinstance(uid, str) and uid:
+            return f"uid:{uid}"
+        return None
+
+
+PASSWORD_THROTTLES = [IPThrottle, AccountThrottle]
@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.urls import path
 from .views import (
     test_api,
@@ -13,6 +14,9 @@ from .views import (
     UpdateProfilePictureView,
 )
 
+if settings.ASYNC_VIEWS:
+    from .async_views import forgot_password, send_school_verification  # noqa: F811
+
 urlpatterns = [
     path("test/", test_api, name="test_api"),
     path("healthcheck/", healthcheck, name="healthcheck"),
@@ -3,22 +3,25 @@ from django.http import JsonResponse
 from django.conf import settings
 from rest_framework import status
 from rest_framework.response import Response
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, throttle_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.views import APIView
 from rest_framework_simplejwt.views import TokenObtainPairView
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
-from django.core.mail import send_mail
+from outbox.delivery import enqueue_email
 from django.contrib.auth.tokens import PasswordResetTokenGenerator
 from .tokens import school_email_token_generator
 from django.utils.http import urlsafe_base64_encode, urlsafe_base64_decode
 from django.utils.encoding import force_bytes, force_str
 from .serializers import UserSerializer
 from .models import Users
+from .throttling import PASSWORD_THROTTLES
 import re
 from django.db import IntegrityError
 from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
 from rest_framework.exceptions import AuthenticationFailed
+from django.utils.decorators import method_decorator
+from config.compression import compression_exempt
 
 
 token_generator = PasswordResetTokenGenerator()
@@ -26,6 +29,7 @@ token_generator = PasswordResetTokenGenerator()
 
 @csrf_exempt
 @api_view(["POST"])
+@throttle_classes(PASSWORD_THROTTLES)
 def signup(request):
     data = request.data
     required_fields = ["first_name", "last_name", "email", "password"]
@@ -76,6 +80,7 @@ def signup(request):
 
 @api_view(["POST"])
 @permission_classes([IsAuthenticated])
+@throttle_classes(PASSWORD_THROTTLES)
 def change_password(request):
     user = request.user
     current_password = request.data.get("current_password")
@@ -129,8 +134,8 @@ def forgot_password(request):
     if settings.DEBUG:
         reset_url = reset_url.replace("localhost:8000", "localhost:3000")
 
-    # Send Email
-    send_mail(
+    # Queue the email; the outbox worker sends it
+    enqueue_email(
         subject="Password Reset Request",
         message=(
             f"Hello, this is Athletic Insider! \n,"
@@ -140,12 +145,12 @@ def forgot_password(request):
         ),
         from_email="noreply@example.com",
         recipient_list=[email],
-        fail_silently=False,
     )
     return Response({"message": "An email has been sent!"}, status=status.HTTP_200_OK)
 
 
 @api_view(["POST"])
+@throttle_classes(PASSWORD_THROTTLES)
 def reset_password(request):
     uidb64 = request.data.get("uid")
     token = request.data.get("token")
@@ -205,7 +210,7 @@ def send_school_verification(request):
     if settings.DEBUG:
         verify_url = verify_url.replace("localhost:8000", "localhost:3000")
 
-    send_mail(
+    enqueue_email(
         subject="Verify Your School Email",
         message=(
             f"Hi {user.first_name},\n\n"
@@ -214,7 +219,6 @@ def send_school_verification(request):
         ),
         from_email="noreply@yourapp.com",
         recipient_list=[email],
-        fail_silently=False,
     )
 
     return Response({"message": "Verification email sent!"})
@@ -270,8 +274,11 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
             raise AuthenticationFailed("Invalid token or credentials.")
 
 
+# The response carries the JWTs, so it isn't compressed (BREACH)
+@method_decorator(compression_exempt, name="dispatch")
 class LoginView(TokenObtainPairView):
     serializer_class = CustomTokenObtainPairSerializer
+    throttle_classes = PASSWORD_THROTTLES
 
 
 class UserDetailView(APIView):